@@ -1,5 +1,6 @@
-from app.models.schemas import AssetType
+from app.models.schemas import Asset, AssetType
 from datetime import datetime
+from collections import defaultdict
 import uuid
 
 # Sample assets data
@@ -100,6 +101,21 @@ sample_assets = [
     }
 ]
 
+# Validated Asset models (validated once at import time)
+sample_asset_models = [Asset(**asset) for asset in sample_assets]
+
+# Lookup indexes over sample_assets (built once at import time)
+assets_by_id = {asset["id"]: asset for asset in sample_assets}
+assets_by_number = {asset["asset_number"]: asset for asset in sample_assets}
+assets_by_site = defaultdict(list)
+assets_by_type = defaultdict(list)
+assets_by_user = defaultdict(list)
+for _asset in sample_assets:
+    assets_by_site[_asset["site"]].append(_asset)
+    assets_by_type[_asset["asset_type"]].append(_asset)
+    assets_by_user[_asset["user"]].append(_asset)
+del _asset
+
 # Sample site data for dashboard
 site_data = [
     {
@@ -0,0 +1,49 @@
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipMiddleware, GZipResponder
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+# 압축하지 않고 바로 흘려보낼 스트리밍 응답 형식 (Content-Type 접두사)
+_STREAMING_MEDIA_TYPES = ("text/event-stream", "application/x-ndjson")
+
+
+class SSEAwareGZipMiddleware(GZipMiddleware):
+    """
+    큰 JSON 응답을 gzip 으로 압축하되 SSE/NDJSON 스트림은 건너뛰는 미들웨어
+
+    GZipMiddleware 는 스트리밍 본문을 압축 버퍼에 모아 보내므로 SSE 이벤트나 NDJSON 줄이
+    실시간으로 전달되지 않는다. 요청 헤더와 관계없이 응답 Content-Type 이
+    text/event-stream 또는 application/x-ndjson 이면 압축하지 않고 그대로 통과시킨다.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, compresslevel: int = 6):
+        super().__init__(app, minimum_size=minimum_size, compresslevel=compresslevel)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and "gzip" in Headers(scope=scope).get("Accept-Encoding", ""):
+            responder = GZipResponder(
+                self._bypass_streaming(send), self.minimum_size, compresslevel=self.compresslevel
+            )
+            await responder(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+    def _bypass_streaming(self, send: Send) -> ASGIApp:
+        """
+        응답 시작 메시지의 Content-Type 을 보고 스트리밍 응답이면 gzip 응답기를 거치지 않고
+        원래 send 로 바로 보내도록 앱을 감싼다.
+        """
+        async def app(scope: Scope, receive: Receive, gzip_send: Send) -> None:
+            target = gzip_send
+
+            async def route(message: Message) -> None:
+                nonlocal target
+                if message["type"] == "http.response.start":
+                    content_type = Headers(raw=message["headers"]).get("content-type", "")
+                    if content_type.startswith(_STREAMING_MEDIA_TYPES):
+                        target = send
+                await target(message)
+
+            await self.app(scope, receive, route)
+
+        return app
@@ -1,13 +1,19 @@
+import sys
 import time
+import heapq
+import bisect
 import psutil
 import asyncio
+import numpy as np
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Union
 from datetime import datetime, timedelta
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from pathlib import Path
-import json
-from collections import deque, defaultdict
+import orjson
+import aiofiles
+from collections import deque
+from itertools import islice
 from concurrent.futures import ThreadPoolExecutor
 
 from fastapi import Request, Response
@@ -15,7 +21,11 @@ from starlette.middleware.base import BaseHTTPMiddleware
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# 메트릭 파일 직렬화 옵션 (naive UTC datetime → ISO 8601, dataclass 직접 직렬화)
+# 기계가 읽는 파일이므로 들여쓰기 없이 저장
+_METRICS_DUMP_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_DATACLASS
+
+@dataclass(slots=True)
 class RequestMetrics:
     """요청 메트릭"""
     path: str
@@ -28,7 +38,7 @@ class RequestMetrics:
     user_agent: str = ""
     ip_address: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class SystemMetrics:
     """시스템 메트릭"""
     cpu_percent: float
@@ -39,15 +49,251 @@ class SystemMetrics:
     active_connections: int
     timestamp: datetime
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceAlert:
     """성능 알림"""
     alert_type: str
     message: str
     severity: str  # low, medium, high, critical
-    metrics: Dict[str, Any]
+    metrics: Union[RequestMetrics, SystemMetrics]  # 원본 메트릭 참조 (조회 시 직렬화)
     timestamp: datetime
 
+# 응답 시간 히스토그램 구간 경계 (초, 1ms~120s 로그 간격, 구간 폭 약 10%)
+# 첫/마지막 칸은 범위 밖 값을 받는다
+_RESPONSE_TIME_EDGES: List[float] = np.geomspace(1e-3, 120.0, 129).tolist()
+
+@dataclass(slots=True)
+class RequestHourBucket:
+    """시간 단위 요청 집계"""
+    hour_start: datetime
+    count: int = 0
+    resp_sum: float = 0.0
+    resp_max: float = 0.0
+    resp_min: float = 0.0
+    mem_sum: int = 0
+    mem_max: int = 0
+    # 상태 코드 대역별 건수 (인덱스 = status_code // 100)
+    status_counts: List[int] = field(default_factory=lambda: [0] * 10)
+    # 응답 시간 구간별 건수 (인덱스 = bisect_right(_RESPONSE_TIME_EDGES, response_time))
+    resp_hist: List[int] = field(default_factory=lambda: [0] * (len(_RESPONSE_TIME_EDGES) + 1))
+    # 엔드포인트 (method, path)별 [요청 수, 응답 시간 합계, 최대 응답 시간]
+    endpoints: Dict[tuple, list] = field(default_factory=dict)
+
+    @property
+    def err_count(self) -> int:
+        """4xx 이상 응답 건수"""
+        return sum(self.status_counts[4:])
+
+    def add(self, metrics: RequestMetrics):
+        """요청 메트릭 1건 누적"""
+        if self.count == 0:
+            self.resp_max = self.resp_min = metrics.response_time
+            self.mem_max = metrics.memory_used
+        else:
+            self.resp_max = max(self.resp_max, metrics.response_time)
+            self.resp_min = min(self.resp_min, metrics.response_time)
+            self.mem_max = max(self.mem_max, metrics.memory_used)
+        self.count += 1
+        self.resp_sum += metrics.response_time
+        self.mem_sum += metrics.memory_used
+        self.status_counts[metrics.status_code // 100] += 1
+        self.resp_hist[bisect.bisect_right(_RESPONSE_TIME_EDGES, metrics.response_time)] += 1
+        
+        key = (metrics.method, metrics.path)
+        endpoint = self.endpoints.get(key)
+        if endpoint is None:
+            self.endpoints[key] = [1, metrics.response_time, metrics.response_time]
+        else:
+            endpoint[0] += 1
+            endpoint[1] += metrics.response_time
+            endpoint[2] = max(endpoint[2], metrics.response_time)
+
+# 집계 버킷 단위 및 보관 개수
+_BUCKET_SPAN = timedelta(hours=1)
+_MAX_BUCKETS = 48
+
+def _bucket_for(buckets: deque, timestamp: datetime) -> RequestHourBucket:
+    """timestamp가 속한 시간 버킷 반환 (시간이 바뀌면 새 버킷 추가)"""
+    hour_start = timestamp.replace(minute=0, second=0, microsecond=0)
+    if not buckets or buckets[-1].hour_start != hour_start:
+        buckets.append(RequestHourBucket(hour_start=hour_start))
+    return buckets[-1]
+
+def _histogram_percentiles(hist: np.ndarray, percentiles: List[float],
+                           lower: float, upper: float) -> List[float]:
+    """
+    응답 시간 히스토그램에서 분위수 근사
+    - 해당 순위가 속한 구간의 상한 경계를 반환하고 실제 최소/최대값 범위로 제한
+    """
+    cumulative = np.cumsum(hist)
+    ranks = np.ceil(np.asarray(percentiles) / 100 * cumulative[-1])
+    bins = np.searchsorted(cumulative, ranks)
+    bin_upper = np.append(_RESPONSE_TIME_EDGES, upper)
+    return np.clip(bin_upper[bins], lower, upper).tolist()
+
+class _TimeSeriesRing:
+    """
+    시간순 고정 크기 순환 버퍼의 공통 부분
+    - timestamp 열은 기록 순서대로 단조 증가하므로 구간 조회에 이진 탐색 사용
+    """
+    
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.timestamp = np.zeros(capacity, dtype='datetime64[us]')
+        self.head = 0
+        self.size = 0
+        self.total = 0  # 누적 기록 건수
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _advance(self):
+        """head를 다음 칸으로 이동 (가득 차면 가장 오래된 항목을 덮어씀)"""
+        self.head = (self.head + 1) % self.capacity
+        if self.size < self.capacity:
+            self.size += 1
+        self.total += 1
+
+    def indices(self) -> np.ndarray:
+        """저장된 항목의 인덱스 (오래된 순)"""
+        start = (self.head - self.size) % self.capacity
+        return (start + np.arange(self.size)) % self.capacity
+
+    def window(self, cutoff_time: datetime) -> np.ndarray:
+        """cutoff_time 이후 항목의 인덱스 (오래된 순)"""
+        cutoff = np.datetime64(cutoff_time, 'us')
+        start = (self.head - self.size) % self.capacity
+        end = start + self.size
+        
+        # 연속 구간 [start, end)
+        if end <= self.capacity:
+            first = start + int(np.searchsorted(self.timestamp[start:end], cutoff))
+            return np.arange(first, end)
+        
+        # 순환된 경우: 오래된 구간 [start, capacity) + 최근 구간 [0, head)
+        first = start + int(np.searchsorted(self.timestamp[start:], cutoff))
+        if first < self.capacity:
+            return np.concatenate((np.arange(first, self.capacity), np.arange(self.head)))
+        first = int(np.searchsorted(self.timestamp[:self.head], cutoff))
+        return np.arange(first, self.head)
+
+class RequestMetricsRing(_TimeSeriesRing):
+    """
+    요청 메트릭 컬럼형(SoA) 순환 버퍼
+    - 필드별 NumPy 배열을 고정 크기로 미리 할당
+    - 엔드포인트(method, path)는 정수 코드로 저장
+    """
+    
+    def __init__(self, capacity: int):
+        super().__init__(capacity)
+        self.response_time = np.zeros(capacity, dtype=np.float64)
+        self.memory_used = np.zeros(capacity, dtype=np.int64)
+        self.status_code = np.zeros(capacity, dtype=np.uint16)
+        self.cpu_percent = np.zeros(capacity, dtype=np.float64)
+        self.endpoint = np.zeros(capacity, dtype=np.int32)
+        self.user_agent: List[str] = [""] * capacity
+        self.ip_address: List[str] = [""] * capacity
+        
+        # 엔드포인트 코드 테이블
+        self.endpoints: List[tuple] = []
+        self._endpoint_codes: Dict[tuple, int] = {}
+
+    def _endpoint_code(self, method: str, path: str) -> int:
+        key = (method, path)
+        code = self._endpoint_codes.get(key)
+        if code is None:
+            code = len(self.endpoints)
+            self._endpoint_codes[key] = code
+            self.endpoints.append(key)
+        return code
+
+    def append(self, metrics: RequestMetrics):
+        """메트릭 1건 기록 (가장 오래된 항목을 덮어씀)"""
+        i = self.head
+        self.response_time[i] = metrics.response_time
+        self.memory_used[i] = metrics.memory_used
+        self.status_code[i] = metrics.status_code
+        self.cpu_percent[i] = metrics.cpu_percent
+        self.timestamp[i] = metrics.timestamp
+        self.endpoint[i] = self._endpoint_code(metrics.method, metrics.path)
+        self.user_agent[i] = metrics.user_agent
+        self.ip_address[i] = metrics.ip_address
+        self._advance()
+
+    def tail(self, n: int) -> List[RequestMetrics]:
+        """최근 n개 항목을 RequestMetrics로 복원"""
+        records = []
+        for i in self.indices()[-n:].tolist():
+            method, path = self.endpoints[self.endpoint[i]]
+            records.append(RequestMetrics(
+                path=path,
+                method=method,
+                status_code=int(self.status_code[i]),
+                response_time=float(self.response_time[i]),
+                memory_used=int(self.memory_used[i]),
+                cpu_percent=float(self.cpu_percent[i]),
+                timestamp=self.timestamp[i].item(),
+                user_agent=self.user_agent[i],
+                ip_address=self.ip_address[i]
+            ))
+        return records
+
+class SystemMetricsRing(_TimeSeriesRing):
+    """
+    시스템 메트릭 순환 버퍼
+    - (capacity, 6) float64 배열에 SystemMetrics 수치 필드를 행 단위로 저장
+    """
+    
+    # data 배열의 열 순서
+    FIELDS = (
+        "cpu_percent",
+        "memory_percent",
+        "memory_used",
+        "memory_available",
+        "disk_usage_percent",
+        "active_connections",
+    )
+    
+    def __init__(self, capacity: int):
+        super().__init__(capacity)
+        self.data = np.zeros((capacity, len(self.FIELDS)), dtype=np.float64)
+
+    def append(self, metrics: SystemMetrics):
+        """메트릭 1건 기록 (가장 오래된 항목을 덮어씀)"""
+        i = self.head
+        self.data[i] = (
+            metrics.cpu_percent,
+            metrics.memory_percent,
+            metrics.memory_used,
+            metrics.memory_available,
+            metrics.disk_usage_percent,
+            metrics.active_connections,
+        )
+        self.timestamp[i] = metrics.timestamp
+        self._advance()
+
+    def _record(self, i: int) -> SystemMetrics:
+        cpu, mem_pct, mem_used, mem_avail, disk_pct, conns = self.data[i].tolist()
+        return SystemMetrics(
+            cpu_percent=cpu,
+            memory_percent=mem_pct,
+            memory_used=int(mem_used),
+            memory_available=int(mem_avail),
+            disk_usage_percent=disk_pct,
+            active_connections=int(conns),
+            timestamp=self.timestamp[i].item()
+        )
+
+    def latest(self) -> Optional[SystemMetrics]:
+        """가장 최근 항목"""
+        if not self.size:
+            return None
+        return self._record((self.head - 1) % self.capacity)
+
+    def tail(self, n: int) -> List[SystemMetrics]:
+        """최근 n개 항목을 SystemMetrics로 복원"""
+        return [self._record(i) for i in self.indices()[-n:].tolist()]
+
 class PerformanceMonitor:
     """
     성능 모니터링 시스템
@@ -70,18 +316,27 @@ class PerformanceMonitor:
         }
         
         # 메트릭 저장소
-        self.request_metrics: deque = deque(maxlen=max_metrics_history)
-        self.system_metrics: deque = deque(maxlen=max_metrics_history)
+        self.request_metrics = RequestMetricsRing(max_metrics_history)
+        self.system_metrics = SystemMetricsRing(max_metrics_history)
         self.alerts: deque = deque(maxlen=1000)
         
+        # 시간 단위 요청 집계 (통계 조회 시 전체 이력 순회 방지)
+        self.request_buckets: deque = deque(maxlen=_MAX_BUCKETS)
+        
         # 통계 캐시
         self.stats_cache = {}
         self.cache_expiry = {}
         self.cache_ttl = 60  # 1분
         
-        # 에러 카운터
-        self.error_counts = defaultdict(int)
-        self.request_counts = defaultdict(int)
+        # 최근 CPU 사용률 (요청 기록 시 재사용)
+        self._last_cpu_percent = 0.0
+        # 현재 프로세스 핸들 및 연결 수 캐시
+        self._proc = psutil.Process()
+        self._connection_count = 0
+        self._sample_count = 0
+        
+        # 첫 호출로 psutil의 CPU 측정 기준점 설정 (이후 interval=None 호출은 직전 호출 이후 값을 반환)
+        psutil.cpu_percent(interval=None)
         
         # 백그라운드 태스크
         self.monitor_task = None
@@ -125,8 +380,11 @@ class PerformanceMonitor:
                     self.system_metrics.append(metrics)
                     await self._check_system_alerts(metrics)
                 
+                # 만료된 통계 캐시 정리
+                self._invalidate_cache()
+                
                 # 주기적으로 데이터 저장
-                if len(self.system_metrics) % 20 == 0:  # 10분마다
+                if self.system_metrics.total % 20 == 0:  # 10분마다
                     await self._save_metrics_to_file()
                     
             except asyncio.CancelledError:
@@ -139,7 +397,9 @@ class PerformanceMonitor:
         """시스템 메트릭 수집"""
         try:
             # CPU 사용률
-            cpu_percent = psutil.cpu_percent(interval=1)
+            # 수집 주기(30초) 동안의 평균 CPU 사용률 (블로킹 없음)
+            cpu_percent = psutil.cpu_percent(interval=None)
+            self._last_cpu_percent = cpu_percent
             
             # 메모리 정보
             memory = psutil.virtual_memory()
@@ -147,8 +407,11 @@ class PerformanceMonitor:
             # 디스크 사용률
             disk = psutil.disk_usage('/')
             
-            # 네트워크 연결 수
-            connections = len(psutil.net_connections())
+            # 네트워크 연결 수 (이 서버 프로세스의 TCP 연결만, 10회 수집마다 갱신)
+            if self._sample_count % 10 == 0:
+                self._connection_count = len(self._proc.net_connections(kind='tcp'))
+            self._sample_count += 1
+            connections = self._connection_count
             
             return SystemMetrics(
                 cpu_percent=cpu_percent,
@@ -168,40 +431,28 @@ class PerformanceMonitor:
                            response_time: float, memory_used: int):
         """요청 메트릭 기록"""
         try:
-            # CPU 사용률 (비동기로 수집)
-            loop = asyncio.get_event_loop()
-            cpu_percent = await loop.run_in_executor(
-                self.executor,
-                lambda: psutil.cpu_percent()
-            )
+            # 반복되는 method/path 문자열은 intern하여 동일 객체를 공유
+            method = sys.intern(request.method)
+            path = sys.intern(request.url.path)
             
             metrics = RequestMetrics(
-                path=str(request.url.path),
-                method=request.method,
+                path=path,
+                method=method,
                 status_code=response.status_code,
                 response_time=response_time,
                 memory_used=memory_used,
-                cpu_percent=cpu_percent,
+                cpu_percent=self._last_cpu_percent,  # 시스템 모니터 루프에서 수집한 최근 값
                 timestamp=datetime.utcnow(),
                 user_agent=request.headers.get("user-agent", ""),
                 ip_address=request.client.host if request.client else ""
             )
             
             self.request_metrics.append(metrics)
-            
-            # 요청 카운터 업데이트
-            path_key = f"{request.method}:{request.url.path}"
-            self.request_counts[path_key] += 1
-            
-            if response.status_code >= 400:
-                self.error_counts[path_key] += 1
+            _bucket_for(self.request_buckets, metrics.timestamp).add(metrics)
             
             # 성능 알림 확인
             await self._check_request_alerts(metrics)
             
-            # 캐시 무효화
-            self._invalidate_cache()
-            
         except Exception as e:
             logger.error(f"Failed to record request metrics: {e}")
 
@@ -215,7 +466,7 @@ class PerformanceMonitor:
                 alert_type="slow_response",
                 message=f"Slow response detected: {metrics.path} took {metrics.response_time:.2f}s",
                 severity="high" if metrics.response_time > 10 else "medium",
-                metrics=asdict(metrics),
+                metrics=metrics,
                 timestamp=datetime.utcnow()
             ))
         
@@ -225,7 +476,7 @@ class PerformanceMonitor:
                 alert_type="high_memory_usage",
                 message=f"High memory usage: {metrics.path} used {metrics.memory_used / 1024 / 1024:.2f}MB",
                 severity="medium",
-                metrics=asdict(metrics),
+                metrics=metrics,
                 timestamp=datetime.utcnow()
             ))
         
@@ -244,7 +495,7 @@ class PerformanceMonitor:
                 alert_type="high_cpu_usage",
                 message=f"High CPU usage: {metrics.cpu_percent:.1f}%",
                 severity="critical" if metrics.cpu_percent > 95 else "high",
-                metrics=asdict(metrics),
+                metrics=metrics,
                 timestamp=datetime.utcnow()
             ))
         
@@ -254,7 +505,7 @@ class PerformanceMonitor:
                 alert_type="high_memory_usage",
                 message=f"High memory usage: {metrics.memory_percent:.1f}%",
                 severity="critical" if metrics.memory_percent > 95 else "high",
-                metrics=asdict(metrics),
+                metrics=metrics,
                 timestamp=datetime.utcnow()
             ))
         
@@ -264,7 +515,7 @@ class PerformanceMonitor:
                 alert_type="high_disk_usage",
                 message=f"High disk usage: {metrics.disk_usage_percent:.1f}%",
                 severity="critical" if metrics.disk_usage_percent > 95 else "high",
-                metrics=asdict(metrics),
+                metrics=metrics,
                 timestamp=datetime.utcnow()
             ))
         
@@ -292,6 +543,9 @@ class PerformanceMonitor:
         if key in self.stats_cache and current_time < self.cache_expiry.get(key, 0):
             return self.stats_cache[key]
         
+        # 만료된 항목은 조회 시점에 제거
+        self.stats_cache.pop(key, None)
+        self.cache_expiry.pop(key, None)
         return None
 
     def _cache_stats(self, key: str, stats: Dict):
@@ -302,38 +556,48 @@ class PerformanceMonitor:
 
     async def get_request_stats(self, hours: int = 24) -> Dict:
         """요청 통계 조회"""
+        # 버킷은 최근 _MAX_BUCKETS 시간만 보관하므로 조회 구간도 그 범위로 제한
+        hours = max(1, min(hours, _MAX_BUCKETS))
         cache_key = f"request_stats_{hours}"
         cached = self._get_cached_stats(cache_key)
         if cached:
             return cached
         
         try:
-            cutoff_time = datetime.utcnow() - timedelta(hours=hours)
-            recent_metrics = [
-                m for m in self.request_metrics
-                if m.timestamp >= cutoff_time
-            ]
+            # 현재 시간을 포함한 최근 hours개 시간 버킷만 사용 (정각 단위 구간)
+            # 모든 통계값을 같은 버킷 집합에서 계산해 링 버퍼 덮어쓰기와 무관하게 같은 요청 집합을 기술
+            window_start = (
+                datetime.utcnow().replace(minute=0, second=0, microsecond=0)
+                - _BUCKET_SPAN * (hours - 1)
+            )
+            buckets = [b for b in self.request_buckets if b.hour_start >= window_start]
             
-            if not recent_metrics:
+            if not buckets:
                 return {"error": "No data available"}
             
-            # 통계 계산
-            response_times = [m.response_time for m in recent_metrics]
-            memory_usage = [m.memory_used for m in recent_metrics]
+            total_requests = sum(b.count for b in buckets)
+            max_response_time = max(b.resp_max for b in buckets)
+            min_response_time = min(b.resp_min for b in buckets)
+            p95, p99 = _histogram_percentiles(
+                np.sum([b.resp_hist for b in buckets], axis=0), [95, 99],
+                min_response_time, max_response_time
+            )
             
             stats = {
-                "total_requests": len(recent_metrics),
-                "avg_response_time": sum(response_times) / len(response_times),
-                "max_response_time": max(response_times),
-                "min_response_time": min(response_times),
-                "p95_response_time": self._percentile(response_times, 95),
-                "p99_response_time": self._percentile(response_times, 99),
-                "avg_memory_usage": sum(memory_usage) / len(memory_usage),
-                "max_memory_usage": max(memory_usage),
-                "error_rate": self._calculate_error_rate(recent_metrics),
-                "requests_per_hour": len(recent_metrics) / hours,
-                "top_slow_endpoints": self._get_slow_endpoints(recent_metrics),
-                "status_code_distribution": self._get_status_distribution(recent_metrics)
+                "hours": hours,
+                "window_start": window_start.isoformat(),
+                "total_requests": total_requests,
+                "avg_response_time": sum(b.resp_sum for b in buckets) / total_requests,
+                "max_response_time": max_response_time,
+                "min_response_time": min_response_time,
+                "p95_response_time": p95,
+                "p99_response_time": p99,
+                "avg_memory_usage": sum(b.mem_sum for b in buckets) / total_requests,
+                "max_memory_usage": max(b.mem_max for b in buckets),
+                "error_rate": (sum(b.err_count for b in buckets) / total_requests) * 100,
+                "requests_per_hour": total_requests / hours,
+                "top_slow_endpoints": self._get_slow_endpoints(buckets),
+                "status_code_distribution": self._get_status_distribution(buckets)
             }
             
             self._cache_stats(cache_key, stats)
@@ -352,28 +616,26 @@ class PerformanceMonitor:
         
         try:
             cutoff_time = datetime.utcnow() - timedelta(hours=hours)
-            recent_metrics = [
-                m for m in self.system_metrics
-                if m.timestamp >= cutoff_time
-            ]
+            rows = self.system_metrics.data[self.system_metrics.window(cutoff_time)]
             
-            if not recent_metrics:
+            if not rows.size:
                 return {"error": "No data available"}
             
-            # 통계 계산
-            cpu_usage = [m.cpu_percent for m in recent_metrics]
-            memory_usage = [m.memory_percent for m in recent_metrics]
-            disk_usage = [m.disk_usage_percent for m in recent_metrics]
+            # 통계 계산 (열 단위 벡터 연산)
+            means = rows.mean(axis=0)
+            maxes = rows.max(axis=0)
+            cpu, memory, disk = 0, 1, 4  # SystemMetricsRing.FIELDS 열 번호
+            latest = self.system_metrics.latest()
             
             stats = {
-                "avg_cpu_percent": sum(cpu_usage) / len(cpu_usage),
-                "max_cpu_percent": max(cpu_usage),
-                "avg_memory_percent": sum(memory_usage) / len(memory_usage),
-                "max_memory_percent": max(memory_usage),
-                "avg_disk_usage": sum(disk_usage) / len(disk_usage),
-                "max_disk_usage": max(disk_usage),
-                "current_metrics": asdict(recent_metrics[-1]) if recent_metrics else None,
-                "data_points": len(recent_metrics)
+                "avg_cpu_percent": float(means[cpu]),
+                "max_cpu_percent": float(maxes[cpu]),
+                "avg_memory_percent": float(means[memory]),
+                "max_memory_percent": float(maxes[memory]),
+                "avg_disk_usage": float(means[disk]),
+                "max_disk_usage": float(maxes[disk]),
+                "current_metrics": asdict(latest) if latest else None,
+                "data_points": len(rows)
             }
             
             self._cache_stats(cache_key, stats)
@@ -387,10 +649,9 @@ class PerformanceMonitor:
         """알림 조회"""
         try:
             cutoff_time = datetime.utcnow() - timedelta(hours=hours)
-            recent_alerts = [
-                alert for alert in self.alerts
-                if alert.timestamp >= cutoff_time
-            ]
+            # 알림은 시간순으로 쌓이므로 이진 탐색으로 시작 위치를 찾음
+            start = bisect.bisect_left(self.alerts, cutoff_time, key=lambda alert: alert.timestamp)
+            recent_alerts = list(islice(self.alerts, start, None))
             
             if severity:
                 recent_alerts = [
@@ -398,88 +659,76 @@ class PerformanceMonitor:
                     if alert.severity == severity
                 ]
             
+            # asdict가 alert.metrics 데이터클래스까지 함께 변환
             return [asdict(alert) for alert in recent_alerts]
             
         except Exception as e:
             logger.error(f"Failed to get alerts: {e}")
             return []
 
-    def _percentile(self, data: List[float], percentile: int) -> float:
-        """백분위수 계산"""
-        if not data:
-            return 0.0
-        
-        sorted_data = sorted(data)
-        index = int((percentile / 100) * len(sorted_data))
-        return sorted_data[min(index, len(sorted_data) - 1)]
-
-    def _calculate_error_rate(self, metrics: List[RequestMetrics]) -> float:
-        """에러율 계산"""
-        if not metrics:
-            return 0.0
+    def _get_slow_endpoints(self, buckets: List[RequestHourBucket], limit: int = 10) -> List[Dict]:
+        """느린 엔드포인트 조회"""
+        # 엔드포인트별 요청 수, 응답 시간 합계, 최대 응답 시간을 버킷에서 합산
+        totals: Dict[tuple, list] = {}
+        for bucket in buckets:
+            for key, (count, resp_sum, resp_max) in bucket.endpoints.items():
+                total = totals.get(key)
+                if total is None:
+                    totals[key] = [count, resp_sum, resp_max]
+                else:
+                    total[0] += count
+                    total[1] += resp_sum
+                    total[2] = max(total[2], resp_max)
         
-        error_count = sum(1 for m in metrics if m.status_code >= 400)
-        return (error_count / len(metrics)) * 100
+        # 평균 응답 시간 상위 limit개 선택
+        return heapq.nlargest(
+            limit,
+            (
+                {
+                    "endpoint": f"{method} {path}",
+                    "avg_response_time": resp_sum / count,
+                    "max_response_time": resp_max,
+                    "request_count": count
+                }
+                for (method, path), (count, resp_sum, resp_max) in totals.items()
+            ),
+            key=lambda x: x["avg_response_time"]
+        )
 
-    def _get_slow_endpoints(self, metrics: List[RequestMetrics], limit: int = 10) -> List[Dict]:
-        """느린 엔드포인트 조회"""
-        endpoint_times = defaultdict(list)
-        
-        for metric in metrics:
-            endpoint_key = f"{metric.method} {metric.path}"
-            endpoint_times[endpoint_key].append(metric.response_time)
-        
-        # 평균 응답 시간으로 정렬
-        slow_endpoints = []
-        for endpoint, times in endpoint_times.items():
-            avg_time = sum(times) / len(times)
-            slow_endpoints.append({
-                "endpoint": endpoint,
-                "avg_response_time": avg_time,
-                "max_response_time": max(times),
-                "request_count": len(times)
-            })
-        
-        return sorted(slow_endpoints, key=lambda x: x["avg_response_time"], reverse=True)[:limit]
-
-    def _get_status_distribution(self, metrics: List[RequestMetrics]) -> Dict[str, int]:
+    def _get_status_distribution(self, buckets: List[RequestHourBucket]) -> Dict[str, int]:
         """상태 코드 분포"""
-        distribution = defaultdict(int)
+        distribution = [0] * 10
         
-        for metric in metrics:
-            status_range = f"{metric.status_code // 100}xx"
-            distribution[status_range] += 1
+        for bucket in buckets:
+            for status_range, count in enumerate(bucket.status_counts):
+                distribution[status_range] += count
         
-        return dict(distribution)
+        return {
+            f"{status_range}xx": count
+            for status_range, count in enumerate(distribution)
+            if count
+        }
 
     async def _save_metrics_to_file(self):
         """메트릭을 파일로 저장"""
         try:
             timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M")
             
-            # 요청 메트릭 저장
-            if self.request_metrics:
+            # 스냅샷을 먼저 떠서 한 번에 인코딩 후 비동기로 기록
+            request_snapshot = self.request_metrics.tail(1000)  # 최근 1000개
+            system_snapshot = self.system_metrics.tail(100)  # 최근 100개
+            
+            # 요청 메트릭 저장 (orjson이 dataclass/datetime을 직접 직렬화)
+            if request_snapshot:
                 request_file = self.data_dir / f"requests_{timestamp}.json"
-                request_data = [asdict(m) for m in list(self.request_metrics)[-1000:]]  # 최근 1000개
-                
-                # datetime 객체를 문자열로 변환
-                for item in request_data:
-                    item['timestamp'] = item['timestamp'].isoformat()
-                
-                with open(request_file, 'w', encoding='utf-8') as f:
-                    json.dump(request_data, f, indent=2, ensure_ascii=False)
+                async with aiofiles.open(request_file, 'wb') as f:
+                    await f.write(orjson.dumps(request_snapshot, option=_METRICS_DUMP_OPTIONS))
             
             # 시스템 메트릭 저장
-            if self.system_metrics:
+            if system_snapshot:
                 system_file = self.data_dir / f"system_{timestamp}.json"
-                system_data = [asdict(m) for m in list(self.system_metrics)[-100:]]  # 최근 100개
-                
-                # datetime 객체를 문자열로 변환
-                for item in system_data:
-                    item['timestamp'] = item['timestamp'].isoformat()
-                
-                with open(system_file, 'w', encoding='utf-8') as f:
-                    json.dump(system_data, f, indent=2, ensure_ascii=False)
+                async with aiofiles.open(system_file, 'wb') as f:
+                    await f.write(orjson.dumps(system_snapshot, option=_METRICS_DUMP_OPTIONS))
             
             logger.info(f"Metrics saved to files at {timestamp}")
             
@@ -498,15 +747,17 @@ class PerformanceMonitorMiddleware(BaseHTTPMiddleware):
     def __init__(self, app, monitor: PerformanceMonitor):
         super().__init__(app)
         self.monitor = monitor
+        # 프로세스 핸들은 한 번만 생성해 재사용
+        self._proc = psutil.Process()
 
     async def dispatch(self, request: Request, call_next):
         start_time = time.time()
-        start_memory = psutil.Process().memory_info().rss
+        start_memory = self._proc.memory_info().rss
         
         response = await call_next(request)
         
         end_time = time.time()
-        end_memory = psutil.Process().memory_info().rss
+        end_memory = self._proc.memory_info().rss
         
         response_time = end_time - start_time
         memory_used = end_memory - start_memory
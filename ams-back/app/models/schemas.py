@@ -40,8 +40,13 @@ class FileUploadResponse(BaseModel):
 	upload_time: datetime
 	file_path: str
 
+class MaskEncoding(str, Enum):
+	PNG = "png"  # 1비트 PNG data URI
+	RLE = "rle"  # COCO 스타일 비압축 RLE {"size": [h, w], "counts": [...]}
+
 class SegmentationRequest(BaseModel):
 	image_path: str
+	mask_encoding: MaskEncoding = MaskEncoding.PNG  # 세그멘테이션 마스크 전송 형식
 
 class SegmentationResponse(BaseModel):
 	segments: Dict[str, Any]
@@ -174,3 +179,40 @@ class AssetListResponse(BaseModel):
 	page: int
 	page_size: int
 	total_pages: int
+
+# Verification schemas
+class OCRVerifyItem(BaseModel):
+	id: str = ''
+	text: str = ''
+	category: str = 'other'
+	confidence: float = 0.0
+
+class BatchVerifyRequest(BaseModel):
+	ocr_data: List[OCRVerifyItem] = Field(default_factory=list)
+
+class FeedbackRequest(BaseModel):
+	ocr_data: Dict[str, Any] = Field(default_factory=dict)
+	verification_result: Optional[Dict[str, Any]] = None
+	user_accepted: bool = True
+	corrected_text: Optional[str] = None
+
+class PerformanceMetricsRequest(BaseModel):
+	true_positives: int = 0
+	false_positives: int = 0
+	true_negatives: int = 0
+	false_negatives: int = 0
+	total_predictions: int = 0
+
+class ThresholdOverrideRequest(BaseModel):
+	thresholds: Dict[str, float] = Field(default_factory=dict)
+	reason: str = 'manual_override'
+
+class ABTestConversionRequest(BaseModel):
+	user_id: Optional[str] = None
+	conversion_data: Dict[str, Any] = Field(default_factory=dict)
+
+# GPU OCR scheduler schemas
+class OCRJobSubmitRequest(BaseModel):
+	images: List[Any] = Field(default_factory=list)  # 이미지 경로 또는 데이터
+	priority: str = 'normal'  # "low", "normal", "high", "urgent"
+	options: Dict[str, Any] = Field(default_factory=dict)
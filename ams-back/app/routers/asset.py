@@ -1,7 +1,16 @@
 from fastapi import APIRouter, HTTPException
 from typing import List
+import orjson
 from app.models.schemas import Asset, AssetType
-from app.data.sample_data import sample_assets
+from app.data.sample_data import (
+    sample_asset_models,
+    assets_by_id,
+    assets_by_number,
+    assets_by_site,
+    assets_by_type,
+    assets_by_user,
+)
+from app.utils.json_stream import json_array_response
 
 router = APIRouter(
     prefix="/api/assets",
@@ -9,21 +18,24 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
+# Pre-serialized rows for GET /api/assets (sample data never changes at runtime)
+_asset_rows = [orjson.dumps(asset.dict()) for asset in sample_asset_models]
+
 @router.get("", response_model=List[Asset])
 async def get_assets():
     """
     Get all assets.
     """
-    return sample_assets
+    return json_array_response(_asset_rows)
 
 @router.get("/{asset_id}", response_model=Asset)
 async def get_asset(asset_id: str):
     """
     Get a specific asset by ID.
     """
-    for asset in sample_assets:
-        if asset["id"] == asset_id:
-            return asset
+    asset = assets_by_id.get(asset_id)
+    if asset is not None:
+        return asset
 
     raise HTTPException(status_code=404, detail="Asset not found")
 
@@ -32,9 +44,9 @@ async def get_asset_by_number(asset_number: str):
     """
     Get a specific asset by asset number.
     """
-    for asset in sample_assets:
-        if asset["asset_number"] == asset_number:
-            return asset
+    asset = assets_by_number.get(asset_number)
+    if asset is not None:
+        return asset
 
     raise HTTPException(status_code=404, detail="Asset not found")
 
@@ -43,21 +55,18 @@ async def get_assets_by_site(site: str):
     """
     Get assets by site.
     """
-    assets = [asset for asset in sample_assets if asset["site"] == site]
-    return assets
+    return assets_by_site.get(site, [])
 
 @router.get("/type/{asset_type}", response_model=List[Asset])
 async def get_assets_by_type(asset_type: AssetType):
     """
     Get assets by type.
     """
-    assets = [asset for asset in sample_assets if asset["asset_type"] == asset_type]
-    return assets
+    return assets_by_type.get(asset_type, [])
 
 @router.get("/user/{user}", response_model=List[Asset])
 async def get_assets_by_user(user: str):
     """
     Get assets by user.
     """
-    assets = [asset for asset in sample_assets if asset["user"] == user]
-    return assets
+    return assets_by_user.get(user, [])
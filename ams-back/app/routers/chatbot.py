@@ -1,19 +1,229 @@
 from fastapi import APIRouter, Body
+from fastapi.responses import ORJSONResponse
 from typing import List, Optional, Dict, Any
 from app.models.schemas import ChatMessage, ChatResponse
 from datetime import datetime
+from enum import Enum
+from collections import deque
+from types import MappingProxyType
+import re
+import secrets
 
 router = APIRouter(
     prefix="/api/chatbot",
     tags=["chatbot"],
     responses={404: {"description": "Not found"}},
+    default_response_class=ORJSONResponse,
 )
 
-# Sample chat history for demonstration
-chat_history = []
+# Sample chat history for demonstration (bounded; oldest entries are evicted)
+CHAT_HISTORY_LIMIT = 1000
+chat_history = deque(maxlen=CHAT_HISTORY_LIMIT)
 
-@router.post("/send", response_model=ChatResponse)
-async def send_message(message: ChatMessage):
+# Intent tags used to route chatbot messages
+class IntentTag(str, Enum):
+    GREETING = "greeting"
+    ASSET = "asset"
+    REGISTER = "register"
+    MODEL = "model"
+    ASSET_NUMBER = "asset_number"
+    USER = "user"
+    SITE = "site"
+    HELP = "help"
+
+_INTENT_KEYWORDS = {
+    "안녕": IntentTag.GREETING,
+    "hello": IntentTag.GREETING,
+    "hi": IntentTag.GREETING,
+    "자산": IntentTag.ASSET,
+    "등록": IntentTag.REGISTER,
+    "추가": IntentTag.REGISTER,
+    "모델": IntentTag.MODEL,
+    "스펙": IntentTag.MODEL,
+    "관리번호": IntentTag.ASSET_NUMBER,
+    "asset number": IntentTag.ASSET_NUMBER,
+    "사용자": IntentTag.USER,
+    "user": IntentTag.USER,
+    "site": IntentTag.SITE,
+    "지점": IntentTag.SITE,
+    "위치": IntentTag.SITE,
+    "도움": IntentTag.HELP,
+    "help": IntentTag.HELP,
+}
+
+# Keywords are matched as UTF-8 bytes: the message is encoded and lowercased once
+# (bytes.lower is ASCII-only, which is enough since the Korean keywords have no case)
+_INTENT_KEYWORD_BYTES = {keyword.encode("utf-8"): tag for keyword, tag in _INTENT_KEYWORDS.items()}
+
+# Zero-width lookahead so overlapping keywords are all reported in one scan
+_INTENT_PATTERN = re.compile(
+    b"(?=(" + b"|".join(re.escape(k) for k in sorted(_INTENT_KEYWORD_BYTES, key=len, reverse=True)) + b"))"
+)
+
+def _scan_intents(data: bytes) -> frozenset:
+    """
+    Return the set of intent tags whose keywords occur in the lowercased UTF-8 message.
+    """
+    return frozenset(_INTENT_KEYWORD_BYTES[m.group(1)] for m in _INTENT_PATTERN.finditer(data))
+
+# Mock spec data for recognised model families
+_THINKPAD_SPECS = MappingProxyType({
+    "cpu": "Intel Core i7-1165G7",
+    "ram": "16GB",
+    "storage": "512GB SSD",
+    "display": "14-inch FHD+"
+})
+_DELL_SPECS = MappingProxyType({
+    "cpu": "Intel Core i9-11900H",
+    "ram": "32GB",
+    "storage": "1TB SSD",
+    "display": "15.6-inch 4K OLED"
+})
+_LG_SPECS = MappingProxyType({
+    "cpu": "Intel Core i7-1165G7",
+    "ram": "16GB",
+    "storage": "512GB SSD",
+    "display": "17-inch WQXGA"
+})
+
+_SPEC_LABELS = (("cpu", "CPU"), ("ram", "RAM"), ("storage", "저장공간"), ("display", "디스플레이"))
+
+def _format_specs(specs) -> str:
+    return "".join(f"\n- {label}: {specs[key]}" for key, label in _SPEC_LABELS)
+
+_THINKPAD_SUMMARY = _format_specs(_THINKPAD_SPECS)
+_DELL_SUMMARY = _format_specs(_DELL_SPECS)
+_LG_SUMMARY = _format_specs(_LG_SPECS)
+
+# Model-name keyword -> family, checked in order (first match wins)
+_FAMILY_KEYWORDS = (
+    ("thinkpad", "lenovo"),
+    ("dell", "dell"),
+    ("xps", "dell"),
+    ("lg", "lg"),
+    ("gram", "lg"),
+)
+# Family -> (manufacturer, specs, formatted spec summary)
+_FAMILY_SPECS = MappingProxyType({
+    "lenovo": ("Lenovo", _THINKPAD_SPECS, _THINKPAD_SUMMARY),
+    "dell": ("Dell", _DELL_SPECS, _DELL_SUMMARY),
+    "lg": ("LG", _LG_SPECS, _LG_SUMMARY),
+})
+
+def _detect_family(model_name: str):
+    """
+    Return (manufacturer, specs, summary) for a model name, or None if unrecognised.
+    """
+    name = model_name.lower()
+    family = next((family for keyword, family in _FAMILY_KEYWORDS if keyword in name), None)
+    return _FAMILY_SPECS[family] if family else None
+
+# Static chatbot replies: (message, suggestions, asset_info)
+_GREETING_REPLY = (
+    "안녕하세요! AMS 챗봇입니다. 자산 등록 및 관리를 도와드릴게요. 어떻게 도와드릴까요?",
+    ("자산 등록 도움", "모델명으로 스펙 검색", "자산 현황 보기"),
+    None
+)
+_REGISTER_REPLY = (
+    "자산 등록을 도와드릴게요. 이미지를 업로드하시면 OCR을 통해 정보를 자동으로 인식합니다. 또는 모델명을 알려주시면 스펙 정보를 찾아드릴 수 있어요.",
+    ("이미지 업로드하기", "모델명 직접 입력하기"),
+    None
+)
+_ASK_MODEL_REPLY = (
+    "어떤 모델의 스펙 정보가 필요하신가요? 모델명을 알려주시면 찾아드릴게요.",
+    ("ThinkPad X1 Carbon", "Dell XPS 15", "LG Gram 17"),
+    None
+)
+_USER_REPLY = (
+    "자산의 사용자 정보를 입력해주세요. 이름 또는 사원번호를 입력하시면 됩니다.",
+    ("사용자 검색하기",),
+    None
+)
+_SITE_REPLY = (
+    "자산이 위치한 지점을 선택해주세요.",
+    ("판교 본사", "고양 지사", "압구정 LF", "마곡 LG Science Park", "역삼 GS 타워"),
+    None
+)
+_HELP_REPLY = (
+    "다음과 같은 도움을 드릴 수 있습니다:\n- 자산 등록 과정 안내\n- 모델명으로 스펙 정보 검색\n- 관리번호 자동 생성\n- 사용자 정보 입력 도움\n- 지점 정보 입력 도움",
+    ("자산 등록 도움", "모델명으로 스펙 검색", "관리번호 생성", "사용자 정보 입력", "지점 정보 입력"),
+    None
+)
+_FALLBACK_REPLY = (
+    "죄송합니다. 질문을 이해하지 못했습니다. 자산 등록, 스펙 검색, 관리번호 생성 등에 대해 물어보시면 도움을 드릴 수 있어요.",
+    ("자산 등록 도움", "모델명으로 스펙 검색", "관리번호 생성"),
+    None
+)
+_UNKNOWN_MODEL_SUGGESTIONS = ("제조사 입력하기", "상세 모델명 입력하기")
+_ASSET_NUMBER_SUGGESTIONS = ("예, 사용하겠습니다", "아니오, 다른 번호를 생성해주세요")
+_ASSIST_GENERAL_SUGGESTIONS = ("자산 유형을 선택해주세요", "지점 정보를 입력해주세요", "사용자 정보를 입력해주세요")
+
+def _reply_greeting(context: Dict[str, Any]):
+    return _GREETING_REPLY
+
+def _reply_register(context: Dict[str, Any]):
+    return _REGISTER_REPLY
+
+def _reply_model(context: Dict[str, Any]):
+    # Check if there's a model name in the context
+    model_name = None
+    if "ocr_results" in context and "model_name" in context["ocr_results"]:
+        model_name = context["ocr_results"]["model_name"]
+
+    if not model_name:
+        return _ASK_MODEL_REPLY
+
+    # Mock spec lookup based on model name
+    family = _detect_family(model_name)
+    if family is None:
+        return (
+            f"죄송합니다. {model_name}에 대한 스펙 정보를 찾을 수 없습니다. 제조사와 상세 모델명을 알려주시면 더 정확한 정보를 찾을 수 있어요.",
+            _UNKNOWN_MODEL_SUGGESTIONS,
+            None
+        )
+
+    manufacturer, specs, summary = family
+    asset_info = {"model_name": model_name, "manufacturer": manufacturer, "specs": specs}
+    return f"{model_name}의 스펙 정보입니다:{summary}", (), asset_info
+
+def _reply_asset_number(context: Dict[str, Any]):
+    # Generate a sample asset number
+    current_year = datetime.now().year
+    asset_number = f"AMS-{current_year}-{secrets.token_hex(4)}"
+    
+    return (
+        f"새로운 자산의 관리번호로 '{asset_number}'를 생성했습니다. 이 번호를 사용하시겠어요?",
+        _ASSET_NUMBER_SUGGESTIONS,
+        {"asset_number": asset_number}
+    )
+
+def _reply_user(context: Dict[str, Any]):
+    return _USER_REPLY
+
+def _reply_site(context: Dict[str, Any]):
+    return _SITE_REPLY
+
+def _reply_help(context: Dict[str, Any]):
+    return _HELP_REPLY
+
+def _reply_fallback(context: Dict[str, Any]):
+    return _FALLBACK_REPLY
+
+# Ordered (required tags, handler) rules; the first rule whose tags are all present wins
+_INTENT_RULES = (
+    (frozenset({IntentTag.GREETING}), _reply_greeting),
+    (frozenset({IntentTag.ASSET, IntentTag.REGISTER}), _reply_register),
+    (frozenset({IntentTag.MODEL}), _reply_model),
+    (frozenset({IntentTag.ASSET_NUMBER}), _reply_asset_number),
+    (frozenset({IntentTag.USER}), _reply_user),
+    (frozenset({IntentTag.SITE}), _reply_site),
+    (frozenset({IntentTag.HELP}), _reply_help),
+)
+
+# response_model=None: the handler already builds a validated ChatResponse,
+# so FastAPI only encodes it instead of validating it a second time
+@router.post("/send", response_model=None, responses={200: {"model": ChatResponse}})
+async def send_message(message: ChatMessage) -> ChatResponse:
     """
     Send a message to the chatbot and get a response.
     """
@@ -21,102 +231,16 @@ async def send_message(message: ChatMessage):
     chat_history.append(message.dict())
     
     # Process the message and generate a response
-    user_message = message.content.lower()
+    user_message = message.content.encode("utf-8").lower()
     context = message.context or {}
     
-    # Initialize response variables
-    response_text = ""
-    suggestions = []
-    asset_info = None
-    
-    # Handle different types of queries
-    if "안녕" in user_message or "hello" in user_message or "hi" in user_message:
-        response_text = "안녕하세요! AMS 챗봇입니다. 자산 등록 및 관리를 도와드릴게요. 어떻게 도와드릴까요?"
-        suggestions = ["자산 등록 도움", "모델명으로 스펙 검색", "자산 현황 보기"]
-    
-    elif "자산" in user_message and ("등록" in user_message or "추가" in user_message):
-        response_text = "자산 등록을 도와드릴게요. 이미지를 업로드하시면 OCR을 통해 정보를 자동으로 인식합니다. 또는 모델명을 알려주시면 스펙 정보를 찾아드릴 수 있어요."
-        suggestions = ["이미지 업로드하기", "모델명 직접 입력하기"]
-    
-    elif "모델" in user_message or "스펙" in user_message:
-        # Check if there's a model name in the context
-        model_name = None
-        if "ocr_results" in context and "model_name" in context["ocr_results"]:
-            model_name = context["ocr_results"]["model_name"]
-        
-        if model_name:
-            response_text = f"{model_name}에 대한 스펙 정보를 찾아보겠습니다."
-            
-            # Mock spec lookup based on model name
-            if "thinkpad" in model_name.lower():
-                asset_info = {
-                    "model_name": model_name,
-                    "manufacturer": "Lenovo",
-                    "specs": {
-                        "cpu": "Intel Core i7-1165G7",
-                        "ram": "16GB",
-                        "storage": "512GB SSD",
-                        "display": "14-inch FHD+"
-                    }
-                }
-                response_text = f"{model_name}의 스펙 정보입니다:\n- CPU: Intel Core i7-1165G7\n- RAM: 16GB\n- 저장공간: 512GB SSD\n- 디스플레이: 14-inch FHD+"
-            elif "dell" in model_name.lower() or "xps" in model_name.lower():
-                asset_info = {
-                    "model_name": model_name,
-                    "manufacturer": "Dell",
-                    "specs": {
-                        "cpu": "Intel Core i9-11900H",
-                        "ram": "32GB",
-                        "storage": "1TB SSD",
-                        "display": "15.6-inch 4K OLED"
-                    }
-                }
-                response_text = f"{model_name}의 스펙 정보입니다:\n- CPU: Intel Core i9-11900H\n- RAM: 32GB\n- 저장공간: 1TB SSD\n- 디스플레이: 15.6-inch 4K OLED"
-            elif "lg" in model_name.lower() or "gram" in model_name.lower():
-                asset_info = {
-                    "model_name": model_name,
-                    "manufacturer": "LG",
-                    "specs": {
-                        "cpu": "Intel Core i7-1165G7",
-                        "ram": "16GB",
-                        "storage": "512GB SSD",
-                        "display": "17-inch WQXGA"
-                    }
-                }
-                response_text = f"{model_name}의 스펙 정보입니다:\n- CPU: Intel Core i7-1165G7\n- RAM: 16GB\n- 저장공간: 512GB SSD\n- 디스플레이: 17-inch WQXGA"
-            else:
-                response_text = f"죄송합니다. {model_name}에 대한 스펙 정보를 찾을 수 없습니다. 제조사와 상세 모델명을 알려주시면 더 정확한 정보를 찾을 수 있어요."
-                suggestions = ["제조사 입력하기", "상세 모델명 입력하기"]
-        else:
-            response_text = "어떤 모델의 스펙 정보가 필요하신가요? 모델명을 알려주시면 찾아드릴게요."
-            suggestions = ["ThinkPad X1 Carbon", "Dell XPS 15", "LG Gram 17"]
-    
-    elif "관리번호" in user_message or "asset number" in user_message:
-        # Generate a sample asset number
-        from datetime import datetime
-        import uuid
-        current_year = datetime.now().year
-        asset_number = f"AMS-{current_year}-{str(uuid.uuid4())[:8]}"
-        
-        response_text = f"새로운 자산의 관리번호로 '{asset_number}'를 생성했습니다. 이 번호를 사용하시겠어요?"
-        suggestions = ["예, 사용하겠습니다", "아니오, 다른 번호를 생성해주세요"]
-        asset_info = {"asset_number": asset_number}
-    
-    elif "사용자" in user_message or "user" in user_message:
-        response_text = "자산의 사용자 정보를 입력해주세요. 이름 또는 사원번호를 입력하시면 됩니다."
-        suggestions = ["사용자 검색하기"]
-    
-    elif "site" in user_message or "지점" in user_message or "위치" in user_message:
-        response_text = "자산이 위치한 지점을 선택해주세요."
-        suggestions = ["판교 본사", "고양 지사", "압구정 LF", "마곡 LG Science Park", "역삼 GS 타워"]
-    
-    elif "도움" in user_message or "help" in user_message:
-        response_text = "다음과 같은 도움을 드릴 수 있습니다:\n- 자산 등록 과정 안내\n- 모델명으로 스펙 정보 검색\n- 관리번호 자동 생성\n- 사용자 정보 입력 도움\n- 지점 정보 입력 도움"
-        suggestions = ["자산 등록 도움", "모델명으로 스펙 검색", "관리번호 생성", "사용자 정보 입력", "지점 정보 입력"]
-    
-    else:
-        response_text = "죄송합니다. 질문을 이해하지 못했습니다. 자산 등록, 스펙 검색, 관리번호 생성 등에 대해 물어보시면 도움을 드릴 수 있어요."
-        suggestions = ["자산 등록 도움", "모델명으로 스펙 검색", "관리번호 생성"]
+    # Tag every intent keyword in a single pass, then dispatch on the tag set
+    tags = _scan_intents(user_message)
+    handler = next(
+        (handler for required, handler in _INTENT_RULES if required <= tags),
+        _reply_fallback
+    )
+    response_text, suggestions, asset_info = handler(context)
     
     # Create and return the response
     response = ChatResponse(
@@ -136,7 +260,7 @@ async def get_chat_history():
     """
     Get the chat history.
     """
-    return chat_history
+    return list(chat_history)
 
 @router.delete("/history")
 async def clear_chat_history():
@@ -162,44 +286,19 @@ async def get_asset_assistance(
     }
     
     # Generate asset number
-    from datetime import datetime
-    import uuid
     current_year = datetime.now().year
-    response["asset_number"] = f"AMS-{current_year}-{str(uuid.uuid4())[:8]}"
+    response["asset_number"] = f"AMS-{current_year}-{secrets.token_hex(4)}"
     
     # Process model name if provided
     if model_name:
-        if "thinkpad" in model_name.lower():
-            response["specs"] = {
-                "cpu": "Intel Core i7-1165G7",
-                "ram": "16GB",
-                "storage": "512GB SSD",
-                "display": "14-inch FHD+"
-            }
-            if not manufacturer:
-                response["suggestions"].append("제조사를 'Lenovo'로 설정하시겠어요?")
-        elif "dell" in model_name.lower() or "xps" in model_name.lower():
-            response["specs"] = {
-                "cpu": "Intel Core i9-11900H",
-                "ram": "32GB",
-                "storage": "1TB SSD",
-                "display": "15.6-inch 4K OLED"
-            }
-            if not manufacturer:
-                response["suggestions"].append("제조사를 'Dell'로 설정하시겠어요?")
-        elif "lg" in model_name.lower() or "gram" in model_name.lower():
-            response["specs"] = {
-                "cpu": "Intel Core i7-1165G7",
-                "ram": "16GB",
-                "storage": "512GB SSD",
-                "display": "17-inch WQXGA"
-            }
+        family = _detect_family(model_name)
+        if family is not None:
+            family_manufacturer, specs, _ = family
+            response["specs"] = dict(specs)
             if not manufacturer:
-                response["suggestions"].append("제조사를 'LG'로 설정하시겠어요?")
+                response["suggestions"].append(f"제조사를 '{family_manufacturer}'로 설정하시겠어요?")
     
     # Add general suggestions
-    response["suggestions"].append("자산 유형을 선택해주세요")
-    response["suggestions"].append("지점 정보를 입력해주세요")
-    response["suggestions"].append("사용자 정보를 입력해주세요")
+    response["suggestions"].extend(_ASSIST_GENERAL_SUGGESTIONS)
     
     return response
\ No newline at end of file
@@ -1,52 +1,57 @@
 from fastapi import APIRouter
-from typing import List, Dict, Any
+from fastapi.responses import ORJSONResponse
+from typing import List, Dict, Any, Optional, Tuple
 from app.models.schemas import StatCard, SiteAsset, DashboardCharts, ChartData
-from datetime import datetime
+from app.data.sample_data import site_data
+from datetime import datetime, date
 
 router = APIRouter(
     prefix="/api/dashboard",
     tags=["dashboard"],
     responses={404: {"description": "Not found"}},
+    default_response_class=ORJSONResponse,
 )
 
+# In a real application, this would fetch data from a database
+# For now, the dashboard serves static sample data, built once at import
+_STAT_CARDS = [StatCard(**card) for card in [
+    {
+        "title": "총 자산",
+        "value": "281",
+        "change": "+10%",
+        "change_text": "전월 대비 증가",
+        "positive": True,
+    },
+    {
+        "title": "신규 등록",
+        "value": "21",
+        "change": "+5%",
+        "change_text": "전주 대비",
+        "positive": True,
+    },
+    {
+        "title": "사용자",
+        "value": "85",
+        "change_text": "업데이트됨",
+        "no_change": True,
+    },
+]]
+
+# (date, charts) for the last chart-data response; months roll over daily
+_chart_cache: Optional[Tuple[date, DashboardCharts]] = None
+
 @router.get("/stats", response_model=List[StatCard])
 async def get_stats():
     """
     Get statistics for the dashboard stat cards.
     """
-    # In a real application, this would fetch data from a database
-    # For now, we'll return sample data
-    stat_cards = [
-        {
-            "title": "총 자산",
-            "value": "281",
-            "change": "+10%",
-            "change_text": "전월 대비 증가",
-            "positive": True,
-        },
-        {
-            "title": "신규 등록",
-            "value": "21",
-            "change": "+5%",
-            "change_text": "전주 대비",
-            "positive": True,
-        },
-        {
-            "title": "사용자",
-            "value": "85",
-            "change_text": "업데이트됨",
-            "no_change": True,
-        },
-    ]
-
-    return stat_cards
+    return _STAT_CARDS
 
 @router.get("/site-assets", response_model=List[SiteAsset])
 async def get_site_assets():
     """
     Get asset data by site for the data table.
     """
-    from app.data.sample_data import site_data
     return site_data
 
 @router.get("/chart-data", response_model=DashboardCharts)
@@ -54,6 +59,12 @@ async def get_chart_data():
     """
     Get data for the charts on the dashboard.
     """
+    global _chart_cache
+
+    today = datetime.now()
+    if _chart_cache is not None and _chart_cache[0] == today.date():
+        return _chart_cache[1]
+
     # In a real application, this would fetch data from a database
     # For now, we'll return sample data
 
@@ -71,30 +82,23 @@ async def get_chart_data():
 
     # Monthly registrations chart
     # Generate data for the last 6 months
-    today = datetime.now()
-    months = []
-    data = []
+    # Count months from year 0 so the rollback needs no year-boundary branch
+    base = today.year * 12 + today.month - 1
+    months = [f"{(base - i) // 12}-{(base - i) % 12 + 1:02d}" for i in range(5, -1, -1)]
 
-    for i in range(5, -1, -1):
-        month = today.month - i
-        year = today.year
-        if month <= 0:
-            month += 12
-            year -= 1
-
-        # Format as "YYYY-MM"
-        months.append(f"{year}-{month:02d}")
-
-        # Generate random-ish data that increases over time
-        data.append(10 + i * 5 + (i * i))
+    # Generate random-ish data that increases over time
+    data = [10 + i * 5 + (i * i) for i in range(5, -1, -1)]
 
     monthly_registrations = ChartData(
         labels=months,
         data=data
     )
 
-    return DashboardCharts(
+    charts = DashboardCharts(
         asset_by_type=asset_by_type,
         asset_by_site=asset_by_site,
         monthly_registrations=monthly_registrations
     )
+    _chart_cache = (today.date(), charts)
+
+    return charts
@@ -1,16 +1,24 @@
 from fastapi import APIRouter, HTTPException, Response
+from fastapi.responses import ORJSONResponse
+from fastapi.concurrency import run_in_threadpool
 from typing import List, Optional, Dict, Any
 from app.models.schemas import Label, Asset
 import uuid
+import asyncio
 from datetime import datetime
-import qrcode
+import segno
 from io import BytesIO
 import base64
+import binascii
+from functools import lru_cache
+import orjson
+from app.utils.json_stream import json_array_response
 
 router = APIRouter(
     prefix="/api/labels",
     tags=["labels"],
     responses={404: {"description": "Not found"}},
+    default_response_class=ORJSONResponse,
 )
 
 # Sample data
@@ -56,66 +64,87 @@ sample_labels = [
     }
 ]
 
+# Lookup indexes over sample_labels (entries are shared, so in-place updates stay visible)
+_labels_by_id = {label["id"]: label for label in sample_labels}
+_labels_by_asset: Dict[str, Dict[str, Any]] = {}
+for _label in sample_labels:
+    _labels_by_asset.setdefault(_label["asset_id"], _label)
+del _label
+
+_PNG_DATA_URI_PREFIX = "data:image/png;base64,"
+
 # Helper function to generate QR code
+@lru_cache(maxsize=4096)
 def generate_qr_code(data: str) -> str:
     """
     Generate a QR code as a base64 encoded string.
+    Results are memoized by payload since the output is deterministic.
     """
-    qr = qrcode.QRCode(
-        version=1,
-        error_correction=qrcode.constants.ERROR_CORRECTION_L,
-        box_size=10,
-        border=4,
-    )
-    qr.add_data(data)
-    qr.make(fit=True)
-
-    img = qr.make_image(fill_color="black", back_color="white")
-
-    # Convert to base64
+    # segno encodes the PNG directly, without building a PIL image first
     buffered = BytesIO()
-    img.save(buffered)
+    segno.make_qr(data, error="L", boost_error=False).save(buffered, kind="png", scale=10, border=4)
     img_str = base64.b64encode(buffered.getvalue()).decode()
 
-    return f"data:image/png;base64,{img_str}"
+    return f"{_PNG_DATA_URI_PREFIX}{img_str}"
+
+async def generate_qr_code_async(data: str) -> str:
+    """
+    Run generate_qr_code in the threadpool so PNG encoding does not block the event loop.
+    """
+    return await run_in_threadpool(generate_qr_code, data)
+
+# Decoded label PNG bytes keyed by label ID (label images do not change once generated)
+_label_png_cache: Dict[str, bytes] = {}
+
+def _label_png_response(label_id: str, image_bytes: bytes) -> Response:
+    return Response(
+        content=image_bytes,
+        media_type="image/png",
+        headers={"Cache-Control": "public, max-age=31536000", "ETag": f'"{label_id}"'}
+    )
 
 @router.get("", response_model=List[Label])
 async def get_labels():
     """
     Get all labels.
     """
-    return sample_labels
+    # Labels carry multi-KB base64 images, so encode and send them one at a time.
+    # Rows are encoded per request because print_label/create_label mutate sample_labels.
+    return json_array_response(
+        orjson.dumps(Label.construct(**label).dict()) for label in sample_labels
+    )
 
 @router.get("/{label_id}", response_model=Label)
 async def get_label(label_id: str):
     """
     Get a specific label by ID.
     """
-    for label in sample_labels:
-        if label["id"] == label_id:
-            return label
+    label = _labels_by_id.get(label_id)
+    if label is not None:
+        return label
 
     raise HTTPException(status_code=404, detail="Label not found")
 
-@router.post("", response_model=Label)
-async def create_label(label: Label):
+# Handlers below build validated Label instances themselves; response_model=None
+# skips FastAPI's second validation pass while the OpenAPI schema stays documented
+@router.post("", response_model=None, responses={200: {"model": Label}})
+async def create_label(label: Label) -> Label:
     """
     Create a new label.
     """
     # In a real application, this would save the label to a database
     # For now, we'll just return the label with a new ID
-    new_label = label.dict()
-    new_label["id"] = str(uuid.uuid4())
+    update = {"id": str(uuid.uuid4())}
 
     # Generate QR code if not provided
-    if not new_label.get("qr_code"):
-        qr_data = f"asset:{new_label['asset_number']}"
-        new_label["qr_code"] = generate_qr_code(qr_data)
+    if not label.qr_code:
+        qr_data = f"asset:{label.asset_number}"
+        update["qr_code"] = await generate_qr_code_async(qr_data)
 
-    return new_label
+    return label.copy(update=update)
 
-@router.post("/generate/{asset_id}", response_model=Label)
-async def generate_label_for_asset(asset_id: str):
+@router.post("/generate/{asset_id}", response_model=None, responses={200: {"model": Label}})
+async def generate_label_for_asset(asset_id: str) -> Label:
     """
     Generate a label for an asset.
     """
@@ -130,36 +159,33 @@ async def generate_label_for_asset(asset_id: str):
 
     # Generate QR code
     qr_data = f"asset:{asset['asset_number']}"
-    qr_code = generate_qr_code(qr_data)
+    qr_code = await generate_qr_code_async(qr_data)
 
     # Create label
-    label = {
-        "id": str(uuid.uuid4()),
-        "asset_id": asset_id,
-        "asset_number": asset["asset_number"],
-        "qr_code": qr_code,
-        "label_image": None,  # Would be generated in a real application
-        "created_at": datetime.now(),
-        "printed": False,
-        "metadata": {
+    label = Label(
+        id=str(uuid.uuid4()),
+        asset_id=asset_id,
+        asset_number=asset["asset_number"],
+        qr_code=qr_code,
+        label_image=None,  # Would be generated in a real application
+        created_at=datetime.now(),
+        printed=False,
+        metadata={
             "model_name": asset["model_name"],
             "site": asset["site"]
         }
-    }
+    )
 
     return label
 
-@router.put("/{label_id}", response_model=Label)
-async def update_label(label_id: str, label: Label):
+@router.put("/{label_id}", response_model=None, responses={200: {"model": Label}})
+async def update_label(label_id: str, label: Label) -> Label:
     """
     Update a label.
     """
     # In a real application, this would update the label in a database
     # For now, we'll just return the updated label
-    updated_label = label.dict()
-    updated_label["id"] = label_id
-
-    return updated_label
+    return label.copy(update={"id": label_id})
 
 @router.delete("/{label_id}")
 async def delete_label(label_id: str):
@@ -175,12 +201,13 @@ async def download_label(label_id: str):
     """
     Download a label as an image.
     """
+    # Serve the decoded PNG from cache when this label was downloaded before
+    image_bytes = _label_png_cache.get(label_id)
+    if image_bytes is not None:
+        return _label_png_response(label_id, image_bytes)
+
     # Find the label
-    label = None
-    for l in sample_labels:
-        if l["id"] == label_id:
-            label = l
-            break
+    label = _labels_by_id.get(label_id)
 
     if not label:
         raise HTTPException(status_code=404, detail="Label not found")
@@ -194,23 +221,62 @@ async def download_label(label_id: str):
         label["label_image"] = label["qr_code"]
 
     # Extract the base64 data
-    if label["label_image"].startswith("data:image/png;base64,"):
-        image_data = label["label_image"].split(",")[1]
-    else:
-        image_data = label["label_image"]
+    image_data = label["label_image"].removeprefix(_PNG_DATA_URI_PREFIX)
 
     # Decode the base64 data
     try:
         image_bytes = base64.b64decode(image_data)
-    except:
+    except binascii.Error:
         # If the mock data can't be decoded, generate a new QR code
         qr_data = f"asset:{label['asset_number']}"
-        label["label_image"] = generate_qr_code(qr_data)
-        image_data = label["label_image"].split(",")[1]
+        label["label_image"] = await generate_qr_code_async(qr_data)
+        _, _, image_data = label["label_image"].partition(",")
         image_bytes = base64.b64decode(image_data)
 
-    # Return the image
-    return Response(content=image_bytes, media_type="image/png")
+    # Cache and return the image
+    _label_png_cache[label_id] = image_bytes
+    return _label_png_response(label_id, image_bytes)
+
+# Upper bound on labels rendered at once in a batch, so one large batch cannot occupy the whole threadpool
+_BATCH_RENDER_CONCURRENCY = 8
+
+def _store_label(label: Label) -> Dict[str, Any]:
+    """
+    Add a generated label to sample_labels and its lookup indexes.
+    """
+    entry = label.dict()
+    sample_labels.append(entry)
+    _labels_by_id[entry["id"]] = entry
+    _labels_by_asset.setdefault(entry["asset_id"], entry)
+    return entry
+
+async def _render_label_for_print(asset_id: str, semaphore: asyncio.Semaphore) -> str:
+    async with semaphore:
+        label = _labels_by_asset.get(asset_id)
+        if label is None:
+            generated = await generate_label_for_asset(asset_id)
+            # The same asset may appear twice in a batch; keep whichever label was stored first
+            label = _labels_by_asset.get(asset_id) or _store_label(generated)
+
+        if not label.get("qr_code"):
+            label["qr_code"] = await generate_qr_code_async(f"asset:{label['asset_number']}")
+        label["printed"] = True
+        return label["id"]
+
+# Registered before /{label_id}/print so "batch" is not captured as a label ID
+@router.post("/batch/print")
+async def batch_print_labels(asset_ids: List[str]):
+    """
+    Print multiple labels in a batch.
+    """
+    # In a real application, this would send multiple labels to a printer
+    # For now, we'll render the labels concurrently and mark them as printed
+    semaphore = asyncio.Semaphore(_BATCH_RENDER_CONCURRENCY)
+    label_ids = await asyncio.gather(
+        *(_render_label_for_print(asset_id, semaphore) for asset_id in asset_ids)
+    )
+
+    return {"message": f"{len(asset_ids)} labels sent to printer", "printed": True, "label_ids": label_ids}
 
 @router.post("/{label_id}/print")
 async def print_label(label_id: str):
@@ -218,16 +284,13 @@ async def print_label(label_id: str):
     Mark a label as printed.
     """
     # Find the label
-    label = None
-    for i, l in enumerate(sample_labels):
-        if l["id"] == label_id:
-            label = l
-            sample_labels[i]["printed"] = True
-            break
+    label = _labels_by_id.get(label_id)
 
     if not label:
         raise HTTPException(status_code=404, detail="Label not found")
 
+    label["printed"] = True
+
     # In a real application, this would send the label to a printer
     # For now, we'll just mark it as printed
 
@@ -239,19 +302,9 @@ async def get_label_by_asset(asset_id: str):
     Get a label by asset ID.
     """
     # Find the label
-    for label in sample_labels:
-        if label["asset_id"] == asset_id:
-            return label
+    label = _labels_by_asset.get(asset_id)
+    if label is not None:
+        return label
 
     # If no label exists, generate one
     return await generate_label_for_asset(asset_id)
-
-@router.get("/batch/print")
-async def batch_print_labels(asset_ids: List[str]):
-    """
-    Print multiple labels in a batch.
-    """
-    # In a real application, this would send multiple labels to a printer
-    # For now, we'll just return a success message
-
-    return {"message": f"{len(asset_ids)} labels sent to printer", "printed": True}
@@ -1,12 +1,16 @@
 from fastapi import APIRouter, HTTPException, Query, Depends
-from typing import List, Optional
+from fastapi.responses import ORJSONResponse
+from typing import List, Optional, Tuple
+from functools import lru_cache
+import numpy as np
 from app.models.schemas import Asset, AssetType, PaginationParams, AssetListResponse
-from app.data.sample_data import sample_assets
+from app.data.sample_data import sample_assets, assets_by_id, assets_by_site, assets_by_type
 
 router = APIRouter(
 	prefix="/api/assets/list",
 	tags=["asset-list"],
 	responses={404: {"description": "Not found"}},
+	default_response_class=ORJSONResponse,
 )
 
 def get_pagination_params(
@@ -22,6 +26,41 @@ def get_pagination_params(
 		sort_desc=sort_desc
 	)
 
+# Column (struct-of-arrays) view of sample_assets, built once at import time.
+# Filters become vectorized masks over these arrays; row i is sample_assets[i].
+# Searchable fields are joined with a unit separator so a query cannot match across fields.
+_SEARCH_FIELDS = ("model_name", "detailed_model", "serial_number", "asset_number")
+
+def _search_blob(asset: dict, fields: Tuple[str, ...]) -> str:
+	return "\x1f".join(asset[f] for f in fields if asset[f]).lower()
+
+def _column(values) -> np.ndarray:
+	return np.array(list(values), dtype=str)
+
+_site_col = _column(a["site"] for a in sample_assets)
+_type_col = _column(AssetType(a["asset_type"]).value for a in sample_assets)
+_user_col = _column((a["user"] or "").lower() for a in sample_assets)
+_manufacturer_col = _column((a["manufacturer"] or "").lower() for a in sample_assets)
+_search_col = _column(_search_blob(a, _SEARCH_FIELDS) for a in sample_assets)
+_query_col = _column(_search_blob(a, _SEARCH_FIELDS + ("manufacturer",)) for a in sample_assets)
+
+def _contains(column: np.ndarray, text: str) -> np.ndarray:
+	return np.char.find(column, text) >= 0
+
+# Presorted row orders (ascending, descending) for the common sort columns.
+# Both directions come from a stable sort, so ties keep sample order like sorted(reverse=...) does.
+_PRESORT_COLUMNS = ("asset_number", "model_name", "site", "registration_date")
+
+def _presort(column: str) -> Tuple[np.ndarray, np.ndarray]:
+	key = lambda i: sample_assets[i].get(column, "")
+	rows = range(len(sample_assets))
+	return (
+		np.array(sorted(rows, key=key), dtype=np.intp),
+		np.array(sorted(rows, key=key, reverse=True), dtype=np.intp),
+	)
+
+_presorted_rows = {column: _presort(column) for column in _PRESORT_COLUMNS}
+
 @router.get("", response_model=AssetListResponse)
 async def get_assets(
 		pagination: PaginationParams = Depends(get_pagination_params),
@@ -34,50 +73,54 @@ async def get_assets(
 	"""
 	Get a list of assets with filtering, pagination, and sorting.
 	"""
-	# Filter assets
-	filtered_assets = sample_assets
+	# Filter assets with one boolean mask over the column arrays
+	mask = np.ones(len(sample_assets), dtype=bool)
 
 	if site:
-		filtered_assets = [a for a in filtered_assets if a["site"] == site]
+		mask &= _site_col == site
 
 	if asset_type:
-		filtered_assets = [a for a in filtered_assets if a["asset_type"] == asset_type]
+		mask &= _type_col == asset_type.value
 
 	if user:
-		filtered_assets = [a for a in filtered_assets if a["user"] and user.lower() in a["user"].lower()]
+		mask &= _contains(_user_col, user.lower())
 
 	if manufacturer:
-		filtered_assets = [a for a in filtered_assets if a["manufacturer"] and manufacturer.lower() in a["manufacturer"].lower()]
+		mask &= _contains(_manufacturer_col, manufacturer.lower())
 
 	if search:
-		search = search.lower()
-		filtered_assets = [a for a in filtered_assets if
-		                   (a["model_name"] and search in a["model_name"].lower()) or
-		                   (a["detailed_model"] and search in a["detailed_model"].lower()) or
-		                   (a["serial_number"] and search in a["serial_number"].lower()) or
-		                   (a["asset_number"] and search in a["asset_number"].lower())
-		                   ]
+		mask &= _contains(_search_col, search.lower())
 
 	# Sort assets
-	if pagination.sort_by:
-		try:
-			filtered_assets = sorted(
-				filtered_assets,
-				key=lambda x: x.get(pagination.sort_by, ""),
-				reverse=pagination.sort_desc
-			)
-		except:
-			# If sorting fails, ignore it
-			pass
+	filtered_assets = None
+	if pagination.sort_by in _presorted_rows:
+		order = _presorted_rows[pagination.sort_by][pagination.sort_desc]
+		rows = order[mask[order]]
+	else:
+		rows = np.flatnonzero(mask)
+		if pagination.sort_by:
+			filtered_assets = [sample_assets[i] for i in rows]
+			try:
+				filtered_assets = sorted(
+					filtered_assets,
+					key=lambda x: x.get(pagination.sort_by, ""),
+					reverse=pagination.sort_desc
+				)
+			except:
+				# If sorting fails, ignore it
+				pass
 
 	# Calculate pagination
-	total = len(filtered_assets)
+	total = len(rows)
 	total_pages = (total + pagination.page_size - 1) // pagination.page_size
 
 	start_idx = (pagination.page - 1) * pagination.page_size
 	end_idx = start_idx + pagination.page_size
 
-	paginated_assets = filtered_assets[start_idx:end_idx]
+	if filtered_assets is not None:
+		paginated_assets = filtered_assets[start_idx:end_idx]
+	else:
+		paginated_assets = [sample_assets[i] for i in rows[start_idx:end_idx]]
 
 	return AssetListResponse(
 		items=paginated_assets,
@@ -92,9 +135,9 @@ async def get_asset(asset_id: str):
 	"""
 	Get a specific asset by ID.
 	"""
-	for asset in sample_assets:
-		if asset["id"] == asset_id:
-			return asset
+	asset = assets_by_id.get(asset_id)
+	if asset is not None:
+		return asset
 
 	raise HTTPException(status_code=404, detail="Asset not found")
 
@@ -103,36 +146,32 @@ async def search_assets(query: str):
 	"""
 	Search for assets by model name, serial number, asset number, etc.
 	"""
-	query = query.lower()
-	results = []
-
-	for asset in sample_assets:
-		if ((asset["model_name"] and query in asset["model_name"].lower()) or
-				(asset["detailed_model"] and query in asset["detailed_model"].lower()) or
-				(asset["serial_number"] and query in asset["serial_number"].lower()) or
-				(asset["asset_number"] and query in asset["asset_number"].lower()) or
-				(asset["manufacturer"] and query in asset["manufacturer"].lower())):
-			results.append(asset)
+	return [sample_assets[i] for i in np.flatnonzero(_contains(_query_col, query.lower()))]
 
-	return results
+# Memoized substring lookup (sample_assets does not change at runtime;
+# call cache_clear() if assets become mutable)
+@lru_cache(maxsize=128)
+def _assets_for_user(user: str) -> Tuple[dict, ...]:
+	user = user.lower()
+	return tuple(a for a in sample_assets if a["user"] and user in a["user"].lower())
 
 @router.get("/site/{site}", response_model=List[Asset])
 async def get_assets_by_site(site: str):
 	"""
 	Get assets by site.
 	"""
-	return [a for a in sample_assets if a["site"] == site]
+	return assets_by_site.get(site, [])
 
 @router.get("/type/{asset_type}", response_model=List[Asset])
 async def get_assets_by_type(asset_type: AssetType):
 	"""
 	Get assets by type.
 	"""
-	return [a for a in sample_assets if a["asset_type"] == asset_type]
+	return assets_by_type.get(asset_type, [])
 
 @router.get("/user/{user}", response_model=List[Asset])
 async def get_assets_by_user(user: str):
 	"""
 	Get assets by user.
 	"""
-	return [a for a in sample_assets if a["user"] and user.lower() in a["user"].lower()]
+	return list(_assets_for_user(user))
@@ -3,22 +3,31 @@
 import os
 import uuid
 import asyncio
-import json
 import csv
 import re
+import time
+import orjson
+import base64
+import itertools
+import threading
+import aiofiles
 from datetime import datetime
-from io import BytesIO
+from io import BytesIO, StringIO
 from typing import Dict, Any, Optional, List
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
-from fastapi import APIRouter, UploadFile, File, HTTPException, Body, status, BackgroundTasks
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, UploadFile, File, HTTPException, Body, status, BackgroundTasks, Response
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
 from sse_starlette.sse import EventSourceResponse
 from PIL import Image
+import numpy as np
 
 from app.models.schemas import (
 	FileUploadResponse,
 	SegmentationRequest,
+	MaskEncoding,
 	SegmentationResponse,
 	OCRRequest,
 	OCRResponse,
@@ -28,10 +37,18 @@ from app.models.schemas import (
 	JobResponse,
 	JobStatus,
 	JobStage,
-	JobStatusEvent
+	JobStatusEvent,
+	OCRVerifyItem,
+	BatchVerifyRequest,
+	FeedbackRequest,
+	PerformanceMetricsRequest,
+	ThresholdOverrideRequest,
+	ABTestConversionRequest,
+	OCRJobSubmitRequest
 )
 from app.utils.sse import push_sse, sse_response
 from app.utils.logging import registration_logger
+from app.utils.ttl_cache import TTLCache
 
 import novelike.seg as segmod
 import novelike.ocr as ocrmod
@@ -52,108 +69,236 @@ from app.middleware.performance_monitor import get_performance_monitor
 # Phase 3 GPU OCR 서비스 임포트
 from app.services.gpu_manager import get_gpu_manager
 from app.services.batch_ocr_engine import get_batch_ocr_engine, BatchOCRRequest
-from app.services.ocr_scheduler import get_ocr_scheduler, OCRJobRequest
+from app.services.ocr_scheduler import get_ocr_scheduler, JobPriority, QueueFullError
 
 router = APIRouter(
 	prefix="/api/registration",
 	tags=["registration"],
 	responses={404: {"description": "Not found"}},
+	default_response_class=ORJSONResponse,
 )
 
 UPLOAD_DIR = "uploads"
+UPLOAD_CHUNK_SIZE = 1 << 20  # 업로드 스트리밍 청크 크기 (1 MiB)
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 
+@lru_cache(maxsize=1)
+def _utc_second_iso(seconds: int) -> str:
+	return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+
+def _utc_now_iso() -> str:
+	"""
+	SSE 이벤트용 UTC ISO 8601 타임스탬프
+	초 단위 문자열은 같은 초 동안 재사용하고 마이크로초만 덧붙여 이벤트마다 datetime 을 만들지 않는다.
+	"""
+	seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+	return f"{_utc_second_iso(seconds)}.{nanos // 1000:06d}"
+
 # 전역 서비스 인스턴스 초기화
 asset_matcher = None
 confidence_evaluator = None
 fuzzy_matcher = None
+_services_init_lock = asyncio.Lock()
 
 async def initialize_services(force_reset: bool = False):
     """서비스 인스턴스 초기화"""
     global asset_matcher, confidence_evaluator, fuzzy_matcher
 
-    # 강제 리셋이 요청된 경우 모든 서비스를 None으로 설정
-    if force_reset:
-        registration_logger.info("서비스 강제 리셋 중...")
-        asset_matcher = None
-        confidence_evaluator = None
-        fuzzy_matcher = None
-
-    if asset_matcher is None:
-        registration_logger.info("자산 매칭 서비스 초기화 중...")
-        try:
-            config = AssetMatcherConfig(
-                cache_ttl=3600,
-                max_workers=4,
-                enable_cache=True,
-                data_dir="data/assets"
-            )
-            asset_matcher = EnhancedAssetMatcher(config)
-            await asset_matcher.initialize()
-            registration_logger.info("자산 매칭 서비스 초기화 완료")
-        except Exception as e:
-            registration_logger.error(f"자산 매칭 서비스 초기화 실패: {str(e)}")
-            asset_matcher = None
+    # 이미 모두 초기화된 경우 락 없이 바로 반환 (요청 경로의 빠른 경로)
+    if not force_reset and asset_matcher is not None and confidence_evaluator is not None and fuzzy_matcher is not None:
+        return
 
-    if confidence_evaluator is None:
-        registration_logger.info("신뢰도 평가 서비스 초기화 중...")
-        try:
-            thresholds = ConfidenceThresholds(
-                high=0.85,
-                medium=0.65,
-                low=0.45,
-                very_low=0.25
-            )
-            confidence_evaluator = ConfidenceEvaluator(thresholds)
-            registration_logger.info("신뢰도 평가 서비스 초기화 완료")
-        except Exception as e:
-            registration_logger.error(f"신뢰도 평가 서비스 초기화 실패: {str(e)}")
+    # 동시에 들어온 첫 요청들이 무거운 초기화를 중복 실행하지 않도록 직렬화
+    async with _services_init_lock:
+        # 강제 리셋이 요청된 경우 모든 서비스를 None으로 설정
+        if force_reset:
+            registration_logger.info("서비스 강제 리셋 중...")
+            asset_matcher = None
             confidence_evaluator = None
-
-    if fuzzy_matcher is None:
-        registration_logger.info("퍼지 매칭 서비스 초기화 중...")
-        try:
-            fuzzy_matcher = FuzzyMatcher()
-            registration_logger.info("퍼지 매칭 서비스 초기화 완료")
-        except Exception as e:
-            registration_logger.error(f"퍼지 매칭 서비스 초기화 실패: {str(e)}")
             fuzzy_matcher = None
 
-    registration_logger.info("모든 검증 서비스 초기화 완료")
+        if asset_matcher is None:
+            registration_logger.info("자산 매칭 서비스 초기화 중...")
+            try:
+                config = AssetMatcherConfig(
+                    cache_ttl=3600,
+                    max_workers=4,
+                    enable_cache=True,
+                    data_dir="data/assets",
+                    # 여러 워커가 자동완성 캐시를 공유하려면 Redis URL 설정 (예: redis://localhost:6379/0)
+                    redis_url=os.getenv("SUGGESTION_REDIS_URL")
+                )
+                asset_matcher = EnhancedAssetMatcher(config)
+                await asset_matcher.initialize()
+                registration_logger.info("자산 매칭 서비스 초기화 완료")
+            except Exception as e:
+                registration_logger.error(f"자산 매칭 서비스 초기화 실패: {str(e)}")
+                asset_matcher = None
+
+        if confidence_evaluator is None:
+            registration_logger.info("신뢰도 평가 서비스 초기화 중...")
+            try:
+                thresholds = ConfidenceThresholds(
+                    high=0.85,
+                    medium=0.65,
+                    low=0.45,
+                    very_low=0.25
+                )
+                confidence_evaluator = ConfidenceEvaluator(thresholds)
+                registration_logger.info("신뢰도 평가 서비스 초기화 완료")
+            except Exception as e:
+                registration_logger.error(f"신뢰도 평가 서비스 초기화 실패: {str(e)}")
+                confidence_evaluator = None
+
+        if fuzzy_matcher is None:
+            registration_logger.info("퍼지 매칭 서비스 초기화 중...")
+            try:
+                fuzzy_matcher = FuzzyMatcher()
+                registration_logger.info("퍼지 매칭 서비스 초기화 완료")
+            except Exception as e:
+                registration_logger.error(f"퍼지 매칭 서비스 초기화 실패: {str(e)}")
+                fuzzy_matcher = None
+
+        registration_logger.info("모든 검증 서비스 초기화 완료")
+
+
+@router.on_event("startup")
+async def _initialize_services_on_startup():
+    """앱 시작 시 검증 서비스를 미리 초기화해 첫 요청이 초기화 비용을 지지 않도록 함"""
+    await initialize_services()
 
 
 @router.post("/upload", response_model=FileUploadResponse)
-async def upload_image(file: UploadFile = File(...)):
+async def upload_image(background_tasks: BackgroundTasks, file: UploadFile = File(...)):
 	registration_logger.info(f"이미지 업로드 요청 수신: {file.filename}")
 
 	if not file.content_type.startswith("image/"):
 		registration_logger.warning(f"잘못된 파일 형식: {file.content_type}")
 		raise HTTPException(400, "이미지 파일만 업로드할 수 있습니다.")
 
-	registration_logger.debug("파일 데이터 읽는 중...")
-	data = await file.read()
-	registration_logger.debug(f"파일 크기: {len(data)} 바이트")
-
 	filename, ext = os.path.splitext(file.filename)
 	timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 	new_filename = f"{filename}_{timestamp}{ext}"
 	path = os.path.join(UPLOAD_DIR, new_filename)
 
+	# 전체 파일을 메모리에 올리지 않고 청크 단위로 디스크에 기록
 	registration_logger.debug(f"파일 저장 중: {path}")
-	with open(path, "wb") as f:
-		f.write(data)
+	size = 0
+	async with aiofiles.open(path, "wb") as f:
+		while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+			await f.write(chunk)
+			size += len(chunk)
+	registration_logger.debug(f"파일 크기: {size} 바이트")
+
+	# 응답을 보낸 뒤 스레드 풀에서 미리 디코딩해 두어 이어지는 /segment 요청이 캐시를 바로 사용하도록 함
+	background_tasks.add_task(_warm_image_cache, path)
 
 	registration_logger.info(f"이미지 업로드 완료: {path}")
 	return FileUploadResponse(
 		filename=file.filename,
-		size=len(data),
+		size=size,
 		content_type=file.content_type,
 		upload_time=datetime.utcnow(),
 		file_path=path,
 	)
 
 
-async def _segment_image_task(job_id: str, image_path: str):
+@lru_cache(maxsize=8)
+def _decode_image_bgr(image_path: str, mtime_ns: int, size: int) -> np.ndarray:
+	img = Image.open(image_path).convert("RGB")
+	# EasyOCR/YOLO 는 ndarray 를 OpenCV(BGR) 순서로 다루므로 한 번만 변환
+	img_np = np.ascontiguousarray(np.asarray(img)[:, :, ::-1])
+	# 캐시된 배열을 여러 작업이 공유하므로 읽기 전용으로 고정
+	img_np.flags.writeable = False
+	return img_np
+
+def _load_image_bgr(image_path: str) -> np.ndarray:
+	"""
+	이미지를 BGR ndarray 로 로드 (세그멘테이션/OCR 단계가 같은 디코딩 결과를 공유)
+	파일 (mtime, size) 를 캐시 키에 포함하므로 파일이 바뀌면 다시 디코딩한다.
+	"""
+	stat_result = os.stat(image_path)
+	return _decode_image_bgr(image_path, stat_result.st_mtime_ns, stat_result.st_size)
+
+
+def _warm_image_cache(image_path: str):
+	"""
+	업로드 직후 디코딩 캐시를 채움 (동기 함수라 BackgroundTasks 가 스레드 풀에서 실행)
+	디코딩할 수 없는 파일이면 이후 단계에서 오류를 보고하므로 여기서는 로그만 남긴다.
+	"""
+	try:
+		_load_image_bgr(image_path)
+	except Exception as e:
+		registration_logger.warning(f"업로드 이미지 사전 디코딩 실패: {image_path} ({e})")
+
+
+def _encode_mask_png(mask) -> str:
+	"""
+	세그멘테이션 마스크를 1비트 PNG data URI 로 인코딩
+	H×W 마스크를 중첩 리스트(tolist)로 풀지 않고 PNG 한 장으로 압축해 SSE 로 전송한다.
+	클라이언트는 "data:image/png;base64," 접두사를 떼고 PNG 로 디코딩하면 된다 (전경 = 흰색).
+	"""
+	mask_array = mask.cpu().numpy() if hasattr(mask, 'cpu') else np.asarray(mask)
+	buf = BytesIO()
+	Image.fromarray(mask_array > 0.5).save(buf, format="PNG")
+	return "data:image/png;base64," + base64.b64encode(buf.getvalue()).decode()
+
+
+# 세그멘테이션 전용 스레드 풀 (동시에 실행되는 YOLOv8 추론 수를 제한)
+_segmentation_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="segmentation")
+
+def _encode_mask_rle(mask) -> Dict[str, Any]:
+	"""
+	세그멘테이션 마스크를 COCO 스타일 비압축 RLE 로 인코딩
+	column-major 순서로 펼친 마스크의 run 길이를 배경(0)부터 번갈아 기록한다.
+	run 경계 탐색은 NumPy 벡터 연산으로 처리해 픽셀 단위 파이썬 루프가 없다.
+	counts 는 정수 배열 그대로 두고 push_sse 의 orjson 이 직접 직렬화한다 (파이썬 int 리스트를 만들지 않음).
+	"""
+	mask_array = mask.cpu().numpy() if hasattr(mask, 'cpu') else np.asarray(mask)
+	flat = (mask_array > 0.5).ravel(order='F')
+	boundaries = np.flatnonzero(flat[1:] != flat[:-1]) + 1
+	counts = np.diff(np.concatenate(([0], boundaries, [flat.size])))
+	if flat.size and flat[0]:
+		# RLE 는 항상 배경 run 으로 시작
+		counts = np.concatenate(([0], counts))
+	return {"size": list(mask_array.shape[:2]), "counts": np.ascontiguousarray(counts, dtype=np.int64)}
+
+_MASK_ENCODERS = {
+	MaskEncoding.PNG: _encode_mask_png,
+	MaskEncoding.RLE: _encode_mask_rle,
+}
+
+def _segment_and_encode(image_path: str, mask_encoding: MaskEncoding = MaskEncoding.PNG) -> Dict[str, Any]:
+	"""
+	세그멘테이션을 수행하고 마스크를 인코딩 (동기 함수, 세그멘테이션 스레드 풀에서 실행)
+	"""
+	encode_mask = _MASK_ENCODERS[mask_encoding]
+	results = segmod.segment_image(image_path, image=_load_image_bgr(image_path))
+	registration_logger.info(f"세그멘테이션 완료, 결과 처리 중")
+
+	segments: Dict[str, Any] = {}
+
+	# None 체크 및 안전한 처리 추가
+	if results:
+		registration_logger.debug(f"세그멘테이션 결과 객체 처리 중")
+		for i, r in enumerate(results):
+			registration_logger.debug(f"결과 {i+1} 처리 중")
+			# r.masks가 None이 아니고 data 속성이 존재하는지 확인
+			if r.masks is not None and hasattr(r.masks, 'data') and r.masks.data is not None:
+				registration_logger.debug(f"마스크 데이터 발견됨, 변환 중")
+				for name, mask in r.masks.data.items():
+					registration_logger.debug(f"마스크 '{name}' 처리 중")
+					segments[name] = encode_mask(mask)
+			else:
+				# 세그멘테이션 결과가 없는 경우 로그 또는 기본값 처리
+				registration_logger.warning(f"결과 {i+1}에 대한 마스크 데이터를 찾을 수 없음: {r}")
+	else:
+		registration_logger.warning("세그멘테이션 결과가 없거나 비어 있음")
+
+	return segments
+
+
+async def _segment_image_task(job_id: str, image_path: str, mask_encoding: MaskEncoding = MaskEncoding.PNG):
 	"""
 	세그멘테이션 작업을 백그라운드에서 실행하고 SSE 이벤트를 전송하는 비동기 함수
 	"""
@@ -170,39 +315,21 @@ async def _segment_image_task(job_id: str, image_path: str):
 		await push_sse(job_id, {
 			"stage": JobStage.SEGMENT_START,
 			"message": "세그멘테이션 시작",
-			"timestamp": datetime.utcnow().isoformat()
+			"timestamp": _utc_now_iso()
 		})
 
-		# 세그멘테이션 수행
+		# 세그멘테이션 수행 (모델 추론과 마스크 인코딩은 전용 스레드에서 실행해 이벤트 루프를 막지 않음)
 		registration_logger.info(f"YOLOv8 세그멘테이션 모델 호출 중...")
-		results = segmod.segment_image(image_path)
-		registration_logger.info(f"세그멘테이션 완료, 결과 처리 중")
-
-		segments: Dict[str, Any] = {}
-
-		# None 체크 및 안전한 처리 추가
-		if results:
-			registration_logger.debug(f"세그멘테이션 결과 객체 처리 중")
-			for i, r in enumerate(results):
-				registration_logger.debug(f"결과 {i+1} 처리 중")
-				# r.masks가 None이 아니고 data 속성이 존재하는지 확인
-				if r.masks is not None and hasattr(r.masks, 'data') and r.masks.data is not None:
-					registration_logger.debug(f"마스크 데이터 발견됨, 변환 중")
-					for name, mask in r.masks.data.items():
-						registration_logger.debug(f"마스크 '{name}' 처리 중")
-						segments[name] = mask.tolist()
-				else:
-					# 세그멘테이션 결과가 없는 경우 로그 또는 기본값 처리
-					registration_logger.warning(f"결과 {i+1}에 대한 마스크 데이터를 찾을 수 없음: {r}")
-		else:
-			registration_logger.warning("세그멘테이션 결과가 없거나 비어 있음")
+		segments = await asyncio.get_running_loop().run_in_executor(
+			_segmentation_executor, _segment_and_encode, image_path, mask_encoding
+		)
 
 		# 세그멘테이션 완료 이벤트 전송
 		registration_logger.debug(f"작업 ID '{job_id}'에 대한 세그멘테이션 완료 이벤트 전송 중")
 		await push_sse(job_id, {
 			"stage": JobStage.SEGMENT_DONE,
 			"message": "세그멘테이션 완료",
-			"timestamp": datetime.utcnow().isoformat(),
+			"timestamp": _utc_now_iso(),
 			"result": {
 				"segments": segments,
 				"image_path": image_path
@@ -220,7 +347,7 @@ async def _segment_image_task(job_id: str, image_path: str):
 		await push_sse(job_id, {
 			"stage": "error",
 			"message": f"세그멘테이션 오류: {str(e)}",
-			"timestamp": datetime.utcnow().isoformat()
+			"timestamp": _utc_now_iso()
 		})
 		raise e
 
@@ -242,13 +369,35 @@ async def segment_image(request: SegmentationRequest, background_tasks: Backgrou
 
 	# 백그라운드 작업 시작
 	registration_logger.debug(f"백그라운드 세그멘테이션 작업 시작 중...")
-	background_tasks.add_task(_segment_image_task, job_id, request.image_path)
+	background_tasks.add_task(_segment_image_task, job_id, request.image_path, request.mask_encoding)
 
 	# 작업 ID와 상태 반환
 	registration_logger.info(f"세그멘테이션 작업 {job_id} 대기열에 추가됨")
 	return JobResponse(job_id=job_id, status=JobStatus.QUEUED)
 
 
+# OCR 후처리 정규식 (모듈 로드 시 한 번만 컴파일)
+# 패턴 1: "제목: 내용" 형태
+_COLON_RE = re.compile(r'^([^:]+):\s*(.+)$')
+# 패턴 2: "제목 내용" 형태 (공백으로 구분)
+_SPACE_RE = re.compile(r'^(모델명|제조사|시리얼번호|시리얼|제조자|제조업체|상호명|기자재|명칭|제품명칭)\s+(.+)$')
+# 괄호/대괄호 구간 (한 번의 스캔으로 둘 다 제거)
+_BRACKETED_RE = re.compile(r'\([^)]*\)|\[[^\]]*\]')
+_WS_RE = re.compile(r'\s+')
+# 불필요한 접두사 (하나의 앵커 alternation으로 결합, 연달아 붙은 접두사도 한 번의 매칭으로 제거)
+# "기자재의 명칭제품명칭" -> "명칭제품명칭"
+# "상호명제조업체명" -> "제조업체명"
+_UNNECESSARY_PREFIX_RE = re.compile(
+	r'^(?:(?:기자재의\s*'
+	r'|제품의\s*'
+	r'|상품의\s*'
+	r'|장비의\s*'
+	r'|상호명(?=\S)'  # 상호명 뒤에 공백이 없는 경우만
+	r'|제조자\s+'     # 제조자 뒤에 공백이 있는 경우만
+	r'|제조국가\s*)\s*)+',
+	re.IGNORECASE
+)
+
 def post_process_ocr_text(text: str) -> dict:
 	"""OCR 텍스트 후처리 및 값 추출"""
 	if not text or not isinstance(text, str):
@@ -257,8 +406,7 @@ def post_process_ocr_text(text: str) -> dict:
 	text = text.strip()
 
 	# 패턴 1: "제목: 내용" 형태
-	colon_pattern = r'^([^:]+):\s*(.+)$'
-	colon_match = re.match(colon_pattern, text)
+	colon_match = _COLON_RE.match(text)
 
 	if colon_match:
 		title = colon_match.group(1).strip()
@@ -270,8 +418,7 @@ def post_process_ocr_text(text: str) -> dict:
 		return {"category": category, "value": value, "confidence": 0.9}
 
 	# 패턴 2: "제목 내용" 형태 (공백으로 구분)
-	space_pattern = r'^(모델명|제조사|시리얼번호|시리얼|제조자|제조업체|상호명|기자재|명칭|제품명칭)\s+(.+)$'
-	space_match = re.match(space_pattern, text)
+	space_match = _SPACE_RE.match(text)
 
 	if space_match:
 		title = space_match.group(1).strip()
@@ -285,20 +432,40 @@ def post_process_ocr_text(text: str) -> dict:
 	# 기본값 반환
 	return {"category": "other", "value": text, "confidence": 0.5}
 
+# 제목 키워드 -> 카테고리 (위에서부터 우선 적용, 키워드는 소문자)
+_CATEGORY_KEYWORDS = (
+	('model', ('모델', 'model', '기자재', '명칭', '제품명칭')),
+	('manufacturer', ('제조', 'manufacturer', '상호명', '제조업체', '제조자')),
+	('serial', ('시리얼', 'serial', 's/n', 'sn')),
+	('spec', ('전압', 'voltage', '정격', '스펙')),
+)
+
+def _match_category_keywords(title_lower: str) -> str:
+	"""소문자 제목에 포함된 첫 키워드의 카테고리 반환"""
+	for category, keywords in _CATEGORY_KEYWORDS:
+		for keyword in keywords:
+			if keyword in title_lower:
+				return category
+
+	return 'other'
+
+# 제목이 키워드 그 자체인 경우 (가장 흔한 경우) 는 부분 문자열 검사 없이 바로 조회
+# 값은 같은 테이블로 미리 계산하므로 부분 문자열 검사 결과와 항상 같다.
+_CATEGORY_BY_TITLE = {
+	keyword: _match_category_keywords(keyword)
+	for _, keywords in _CATEGORY_KEYWORDS
+	for keyword in keywords
+}
+
 def categorize_from_title(title: str) -> str:
 	"""제목에서 카테고리 분류"""
 	title_lower = title.lower()
 
-	if any(keyword in title_lower for keyword in ['모델', 'model', '기자재', '명칭', '제품명칭']):
-		return 'model'
-	elif any(keyword in title_lower for keyword in ['제조', 'manufacturer', '상호명', '제조업체', '제조자']):
-		return 'manufacturer'
-	elif any(keyword in title_lower for keyword in ['시리얼', 'serial', 's/n', 'sn']):
-		return 'serial'
-	elif any(keyword in title_lower for keyword in ['전압', 'voltage', '정격', '스펙']):
-		return 'spec'
+	category = _CATEGORY_BY_TITLE.get(title_lower)
+	if category is not None:
+		return category
 
-	return 'other'
+	return _match_category_keywords(title_lower)
 
 def clean_content(content: str) -> str:
 	"""내용 텍스트 정리"""
@@ -306,27 +473,13 @@ def clean_content(content: str) -> str:
 		return ''
 
 	# 괄호 제거
-	content = re.sub(r'\([^)]*\)', '', content).strip()
-	content = re.sub(r'\[[^\]]*\]', '', content).strip()
-
-	# 불필요한 접두사 제거 (더 정확한 패턴 사용)
-	# "기자재의 명칭제품명칭" -> "명칭제품명칭"
-	# "상호명제조업체명" -> "제조업체명"
-	unnecessary_patterns = [
-		r'^기자재의\s*',
-		r'^제품의\s*',
-		r'^상품의\s*',
-		r'^장비의\s*',
-		r'^상호명(?=\S)',  # 상호명 뒤에 공백이 없는 경우만
-		r'^제조자\s+',     # 제조자 뒤에 공백이 있는 경우만
-		r'^제조국가\s*'
-	]
+	content = _BRACKETED_RE.sub('', content).strip()
 
-	for pattern in unnecessary_patterns:
-		content = re.sub(pattern, '', content, flags=re.IGNORECASE).strip()
+	# 불필요한 접두사 제거 (접두사를 떼어낸 뒤 드러나는 접두사까지 정규식의 반복 그룹이 함께 제거)
+	content = _UNNECESSARY_PREFIX_RE.sub('', content, count=1)
 
 	# 연속된 공백 정리
-	content = re.sub(r'\s+', ' ', content).strip()
+	content = _WS_RE.sub(' ', content).strip()
 
 	return content
 
@@ -378,6 +531,117 @@ def process_ocr_result(ocr_result):
 		return {"text": "", "conf": 0.0}
 
 
+# 지원하는 dict bbox 형식: 필요한 키 집합 -> (x, y, w, h) 변환 (위에서부터 우선 적용)
+_BBOX_DICT_FORMATS = (
+	# 표준 형식: x, y, width, height
+	(frozenset(('x', 'y', 'width', 'height')), lambda b: (b["x"], b["y"], b["width"], b["height"])),
+	# 대체 형식: x, y, w, h
+	(frozenset(('x', 'y', 'w', 'h')), lambda b: (b["x"], b["y"], b["w"], b["h"])),
+	# 좌표 형식: x1, y1, x2, y2
+	(frozenset(('x1', 'y1', 'x2', 'y2')), lambda b: (b["x1"], b["y1"], b["x2"] - b["x1"], b["y2"] - b["y1"])),
+)
+
+def _normalize_bbox(bbox) -> Optional[tuple]:
+	"""
+	dict/list/tuple 형식의 bbox 를 (x, y, w, h) 로 변환 (지원하지 않는 형식이면 None)
+	"""
+	if isinstance(bbox, dict):
+		keys = bbox.keys()
+		for required, convert in _BBOX_DICT_FORMATS:
+			if required <= keys:
+				return convert(bbox)
+		return None
+	if isinstance(bbox, (list, tuple)) and len(bbox) >= 4:
+		# 리스트/튜플 형식: [x, y, w, h]
+		return bbox[0], bbox[1], bbox[2], bbox[3]
+	return None
+
+
+# 동시에 GPU 를 사용하는 OCR 호출 수 제한 (백그라운드 작업이 몰려도 VRAM 경합 방지)
+OCR_MAX_CONCURRENCY = max(1, int(os.getenv("OCR_MAX_CONCURRENCY", "2")))
+_ocr_semaphore = asyncio.Semaphore(OCR_MAX_CONCURRENCY)
+
+# 일시적인 GPU/드라이버 오류 재시도 설정
+OCR_MAX_ATTEMPTS = 3
+OCR_RETRY_BACKOFF = 0.5  # 초, 재시도마다 두 배
+_OCR_TRANSIENT_ERROR_RE = re.compile(r"out of memory|cuda error|cudnn_status|resource exhausted", re.IGNORECASE)
+
+async def _run_ocr_limited(ocr_call, *args):
+	"""
+	OCR 호출을 동시 실행 한도 안에서 수행하고, 일시적인 GPU 오류면 지수 백오프로 재시도
+	"""
+	backoff = OCR_RETRY_BACKOFF
+	for attempt in range(1, OCR_MAX_ATTEMPTS + 1):
+		try:
+			async with _ocr_semaphore:
+				return await ocr_call(*args)
+		except Exception as e:
+			if attempt == OCR_MAX_ATTEMPTS or not _OCR_TRANSIENT_ERROR_RE.search(str(e)):
+				raise
+			registration_logger.warning(f"일시적인 OCR 오류, {backoff:.1f}초 후 재시도 ({attempt}/{OCR_MAX_ATTEMPTS}): {e}")
+			# 대기 중에는 세마포어를 놓아 다른 작업이 진행되도록 함
+			await asyncio.sleep(backoff)
+			backoff *= 2
+
+
+def _postprocess_region_ocr(region_fields: List[str], batched: List[list]):
+	"""
+	영역별 EasyOCR 결과 후처리 (동기 함수, 스레드 풀에서 실행) - 영역마다 첫 번째 텍스트를 사용
+	"""
+	results: Dict[str, str] = {}
+	confidence: Dict[str, float] = {}
+	for field, ocrs in zip(region_fields, batched):
+		if ocrs and len(ocrs) > 0:
+			registration_logger.info(f"영역 '{field}'에서 {len(ocrs)}개 텍스트 감지됨")
+			processed_result = process_ocr_result(ocrs[0])
+			results[field] = processed_result["text"]
+			confidence[field] = processed_result["conf"]
+			registration_logger.info(f"영역 '{field}' OCR 결과: '{processed_result['text']}' (신뢰도: {processed_result['conf']:.2f})")
+		else:
+			registration_logger.warning(f"영역 '{field}'에서 텍스트가 감지되지 않음")
+	return results, confidence
+
+def _postprocess_full_image_ocr(ocrs: list):
+	"""
+	전체 이미지 EasyOCR 결과 후처리 (동기 함수, 스레드 풀에서 실행)
+	검출된 텍스트가 여럿이면 text_1.. 과 결합된 combined_text 를, 하나면 full_text 를 반환한다.
+	"""
+	results: Dict[str, str] = {}
+	confidence: Dict[str, float] = {}
+
+	if not ocrs:
+		# OCR 결과가 없는 경우
+		registration_logger.warning("전체 이미지에서 텍스트가 감지되지 않음")
+		results["full_text"] = ""
+		confidence["full_text"] = 0.0
+		return results, confidence
+
+	registration_logger.info(f"전체 이미지에서 {len(ocrs)}개 텍스트 영역 감지됨")
+	# 모든 검출된 텍스트를 처리
+	full_texts = []
+	total_confidence = 0.0
+
+	for i, ocr_result in enumerate(ocrs):
+		registration_logger.debug(f"텍스트 영역 {i+1}/{len(ocrs)} 처리 중")
+		processed_result = process_ocr_result(ocr_result)
+		field_name = f"text_{i + 1}" if len(ocrs) > 1 else "full_text"
+		results[field_name] = processed_result["text"]
+		confidence[field_name] = processed_result["conf"]
+		full_texts.append(processed_result["text"])
+		total_confidence += processed_result["conf"]
+		registration_logger.debug(f"텍스트 영역 {i+1} 결과: '{processed_result['text']}' (신뢰도: {processed_result['conf']:.2f})")
+
+	# 전체 텍스트도 함께 제공
+	if len(ocrs) > 1:
+		combined_text = " ".join(full_texts)
+		avg_confidence = total_confidence / len(ocrs)
+		results["combined_text"] = combined_text
+		confidence["combined_text"] = avg_confidence
+		registration_logger.info(f"결합된 전체 텍스트: '{combined_text}' (평균 신뢰도: {avg_confidence:.2f})")
+
+	return results, confidence
+
+
 async def _perform_ocr_task(job_id: str, image_path: str, segments: Optional[Dict[str, Any]] = None):
 	"""
 	OCR 작업을 백그라운드에서 실행하고 SSE 이벤트를 전송하는 비동기 함수
@@ -406,7 +670,7 @@ async def _perform_ocr_task(job_id: str, image_path: str, segments: Optional[Dic
 			"stage": mapped_stage,
 			"message": message,
 			"progress": progress,
-			"timestamp": datetime.utcnow().isoformat()
+			"timestamp": _utc_now_iso()
 		})
 
 	# SSE 연결 시간 확보를 위한 짧은 지연
@@ -419,7 +683,7 @@ async def _perform_ocr_task(job_id: str, image_path: str, segments: Optional[Dic
 		await push_sse(job_id, {
 			"stage": JobStage.OCR_START,
 			"message": "텍스트 인식 시작",
-			"timestamp": datetime.utcnow().isoformat()
+			"timestamp": _utc_now_iso()
 		})
 
 		if not os.path.exists(image_path):
@@ -427,8 +691,9 @@ async def _perform_ocr_task(job_id: str, image_path: str, segments: Optional[Dic
 			raise HTTPException(404, "이미지 파일을 찾을 수 없습니다.")
 
 		registration_logger.debug(f"이미지 로드 중: {image_path}")
-		img = Image.open(image_path).convert("RGB")
-		registration_logger.debug(f"이미지 크기: {img.width}x{img.height} 픽셀")
+		# 캐시 미스 시 디코딩/채널 변환이 이벤트 루프를 막지 않도록 기본 스레드 풀에서 로드
+		img_np = await asyncio.get_running_loop().run_in_executor(None, _load_image_bgr, image_path)
+		registration_logger.debug(f"이미지 크기: {img_np.shape[1]}x{img_np.shape[0]} 픽셀")
 
 		results: Dict[str, str] = {}
 		confidence: Dict[str, float] = {}
@@ -436,103 +701,60 @@ async def _perform_ocr_task(job_id: str, image_path: str, segments: Optional[Dic
 		# 1) 세그멘테이션 bbox 가 있으면 해당 영역에 대해 EasyOCR 수행
 		if segments:
 			registration_logger.info(f"세그멘테이션 영역별 OCR 수행 시작 (영역 수: {len(segments)})")
+			region_fields: List[str] = []
+			regions: List[np.ndarray] = []
 			for field, bbox in segments.items():
 				registration_logger.debug(f"영역 '{field}' OCR 처리 중")
 				try:
-					# 다양한 bbox 형식을 지원하도록 수정
-					if isinstance(bbox, dict):
-						registration_logger.debug(f"딕셔너리 형식 bbox 처리 중: {bbox}")
-						# 표준 형식: x, y, width, height
-						if all(key in bbox for key in ['x', 'y', 'width', 'height']):
-							x, y, w, h = bbox["x"], bbox["y"], bbox["width"], bbox["height"]
-							registration_logger.debug(f"표준 형식 bbox: x={x}, y={y}, width={w}, height={h}")
-						# 대체 형식: x, y, w, h
-						elif all(key in bbox for key in ['x', 'y', 'w', 'h']):
-							x, y, w, h = bbox["x"], bbox["y"], bbox["w"], bbox["h"]
-							registration_logger.debug(f"대체 형식 bbox: x={x}, y={y}, w={w}, h={h}")
-						# 좌표 형식: x1, y1, x2, y2
-						elif all(key in bbox for key in ['x1', 'y1', 'x2', 'y2']):
-							x1, y1, x2, y2 = bbox["x1"], bbox["y1"], bbox["x2"], bbox["y2"]
-							x, y, w, h = x1, y1, x2 - x1, y2 - y1
-							registration_logger.debug(f"좌표 형식 bbox: x1={x1}, y1={y1}, x2={x2}, y2={y2} -> x={x}, y={y}, w={w}, h={h}")
-						else:
-							registration_logger.warning(f"지원되지 않는 bbox 형식: {bbox}")
-							continue
-					elif isinstance(bbox, (list, tuple)) and len(bbox) >= 4:
-						# 리스트/튜플 형식: [x, y, w, h] 또는 [x1, y1, x2, y2]
-						x, y, w, h = bbox[0], bbox[1], bbox[2], bbox[3]
-						registration_logger.debug(f"리스트/튜플 형식 bbox: x={x}, y={y}, w={w}, h={h}")
-					else:
-						registration_logger.warning(f"잘못된 bbox 형식: {bbox}")
+					# 다양한 bbox 형식을 (x, y, w, h) 로 정규화
+					normalized = _normalize_bbox(bbox)
+					if normalized is None:
+						registration_logger.warning(f"지원되지 않는 bbox 형식: {bbox}")
 						continue
+					x, y, w, h = normalized
+					registration_logger.debug(f"bbox 정규화: {bbox} -> x={x}, y={y}, w={w}, h={h}")
 
 					# 음수 좌표나 크기 값 검증
 					if x < 0 or y < 0 or w <= 0 or h <= 0:
 						registration_logger.warning(f"잘못된 bbox 값: x={x}, y={y}, w={w}, h={h}")
 						continue
 
-					# 이미지 크롭 후 EasyOCR 수행
+					# 이미지 영역 슬라이싱 후 EasyOCR 수행 (JPEG 재인코딩 없이 배열 뷰 전달)
 					registration_logger.debug(f"이미지 영역 크롭 중: x={x}, y={y}, w={w}, h={h}")
-					crop = img.crop((x, y, x + w, y + h))
-					registration_logger.debug(f"크롭된 이미지 크기: {crop.width}x{crop.height} 픽셀")
-
-					buf = BytesIO()
-					crop.save(buf, format="JPEG")
-					registration_logger.debug(f"EasyOCR 호출 중 (영역 '{field}')")
-					ocrs = await ocrmod.ocr_easy_with_progress(buf.getvalue(), progress_callback)
-
-					if ocrs and len(ocrs) > 0:
-						registration_logger.info(f"영역 '{field}'에서 {len(ocrs)}개 텍스트 감지됨")
-						processed_result = process_ocr_result(ocrs[0])
-						results[field] = processed_result["text"]
-						confidence[field] = processed_result["conf"]
-						registration_logger.info(f"영역 '{field}' OCR 결과: '{processed_result['text']}' (신뢰도: {processed_result['conf']:.2f})")
-					else:
-						registration_logger.warning(f"영역 '{field}'에서 텍스트가 감지되지 않음")
+					region = img_np[int(y):int(y + h), int(x):int(x + w)]
+					if region.size == 0:
+						registration_logger.warning(f"영역 '{field}'이 이미지 범위를 벗어남: x={x}, y={y}, w={w}, h={h}")
+						continue
+					registration_logger.debug(f"크롭된 이미지 크기: {region.shape[1]}x{region.shape[0]} 픽셀")
+
+					region_fields.append(field)
+					regions.append(region)
 
 				except (KeyError, ValueError, TypeError) as e:
 					registration_logger.error(f"영역 '{field}' bbox 처리 중 오류 발생: {e}")
 					continue
 
+			# 유효한 영역을 모아 한 번의 OCR 호출로 처리
+			if regions:
+				registration_logger.debug(f"EasyOCR 일괄 호출 중 (영역 {len(regions)}개)")
+				batched = await _run_ocr_limited(ocrmod.ocr_easy_batched, regions, progress_callback)
+
+				# 텍스트 후처리 (정규식 작업) 는 이벤트 루프 밖에서 한 번에 수행
+				results, confidence = await asyncio.get_running_loop().run_in_executor(
+					None, _postprocess_region_ocr, region_fields, batched
+				)
+
 		# 2) 세그멘테이션이 없거나 영역 OCR 결과가 없으면 전체 이미지에 대해 EasyOCR 수행
 		if not results:
 			registration_logger.info("세그멘테이션 영역 OCR 결과가 없음, 전체 이미지 OCR 수행 중")
 			try:
-				# 전체 이미지를 바이트로 변환
-				registration_logger.debug("전체 이미지를 바이트로 변환 중")
-				buf = BytesIO()
-				img.save(buf, format="JPEG")
 				registration_logger.debug("전체 이미지에 대해 EasyOCR 호출 중")
-				ocrs = await ocrmod.ocr_easy_with_progress(buf.getvalue(), progress_callback)
-
-				if ocrs and len(ocrs) > 0:
-					registration_logger.info(f"전체 이미지에서 {len(ocrs)}개 텍스트 영역 감지됨")
-					# 모든 검출된 텍스트를 처리
-					full_texts = []
-					total_confidence = 0.0
-
-					for i, ocr_result in enumerate(ocrs):
-						registration_logger.debug(f"텍스트 영역 {i+1}/{len(ocrs)} 처리 중")
-						processed_result = process_ocr_result(ocr_result)
-						field_name = f"text_{i + 1}" if len(ocrs) > 1 else "full_text"
-						results[field_name] = processed_result["text"]
-						confidence[field_name] = processed_result["conf"]
-						full_texts.append(processed_result["text"])
-						total_confidence += processed_result["conf"]
-						registration_logger.debug(f"텍스트 영역 {i+1} 결과: '{processed_result['text']}' (신뢰도: {processed_result['conf']:.2f})")
-
-					# 전체 텍스트도 함께 제공
-					if len(ocrs) > 1:
-						combined_text = " ".join(full_texts)
-						avg_confidence = total_confidence / len(ocrs)
-						results["combined_text"] = combined_text
-						confidence["combined_text"] = avg_confidence
-						registration_logger.info(f"결합된 전체 텍스트: '{combined_text}' (평균 신뢰도: {avg_confidence:.2f})")
-				else:
-					# OCR 결과가 없는 경우
-					registration_logger.warning("전체 이미지에서 텍스트가 감지되지 않음")
-					results["full_text"] = ""
-					confidence["full_text"] = 0.0
+				ocrs = await _run_ocr_limited(ocrmod.ocr_easy_with_progress, img_np, progress_callback)
+
+				# 검출된 모든 텍스트의 후처리는 이벤트 루프 밖에서 한 번에 수행
+				results, confidence = await asyncio.get_running_loop().run_in_executor(
+					None, _postprocess_full_image_ocr, ocrs
+				)
 
 			except Exception as e:
 				registration_logger.error(f"전체 이미지 OCR 중 오류 발생: {e}")
@@ -548,7 +770,7 @@ async def _perform_ocr_task(job_id: str, image_path: str, segments: Optional[Dic
 		ocr_event_data = {
 			"stage": JobStage.OCR_DONE,
 			"message": "텍스트 인식 완료",
-			"timestamp": datetime.utcnow().isoformat(),
+			"timestamp": _utc_now_iso(),
 			"result": {
 				"results": results,
 				"confidence": confidence
@@ -566,7 +788,7 @@ async def _perform_ocr_task(job_id: str, image_path: str, segments: Optional[Dic
 		await push_sse(job_id, {
 			"stage": "error",
 			"message": f"OCR 오류: {str(e)}",
-			"timestamp": datetime.utcnow().isoformat()
+			"timestamp": _utc_now_iso()
 		})
 		raise e
 
@@ -596,6 +818,16 @@ async def perform_ocr(request: OCRRequest, background_tasks: BackgroundTasks):
 	return JobResponse(job_id=job_id, status=JobStatus.QUEUED)
 
 
+# 자산 번호 일련값: 프로세스마다 임의의 32비트 값에서 시작해 1씩 증가 (uuid4 생성 후 8자리만 쓰던 방식 대체)
+_asset_number_seq = itertools.count(int.from_bytes(os.urandom(4), "big"))
+
+def _next_asset_number() -> str:
+	"""
+	새 자산 번호 생성 (AMS-<연도>-<8자리 16진수>)
+	"""
+	return f"AMS-{datetime.utcnow().year}-{next(_asset_number_seq) & 0xFFFFFFFF:08x}"
+
+
 @router.post("/chatbot-assist", response_model=ChatResponse)
 async def chatbot_assist(
 		model_name: str = Body(..., embed=True),
@@ -609,8 +841,7 @@ async def chatbot_assist(
 	specs_text = chatmod.suggest_specs(model_name)
 	registration_logger.debug(f"추천된 스펙: {specs_text[:50]}...")
 
-	year = datetime.utcnow().year
-	asset_number = f"AMS-{year}-{str(uuid.uuid4())[:8]}"
+	asset_number = _next_asset_number()
 	registration_logger.info(f"자산 번호 생성됨: {asset_number}")
 
 	registration_logger.info(f"챗봇 지원 응답 생성 완료")
@@ -638,13 +869,13 @@ async def _register_asset_task(job_id: str, request: AssetRegistrationRequest):
 		await push_sse(job_id, {
 			"stage": JobStage.REGISTER_START,
 			"message": "자산 등록 시작",
-			"timestamp": datetime.utcnow().isoformat()
+			"timestamp": _utc_now_iso()
 		})
 
 		# 자산 등록 처리
 		registration_logger.debug("자산 정보 생성 중...")
 		asset_id = str(uuid.uuid4())
-		asset_number = f"AMS-{datetime.utcnow().year}-{str(uuid.uuid4())[:8]}"
+		asset_number = _next_asset_number()
 		registration_logger.info(f"새 자산 ID 생성됨: {asset_id}")
 		registration_logger.info(f"새 자산 번호 생성됨: {asset_number}")
 
@@ -674,7 +905,7 @@ async def _register_asset_task(job_id: str, request: AssetRegistrationRequest):
 		await push_sse(job_id, {
 			"stage": JobStage.REGISTER_DONE,
 			"message": "자산 등록 완료",
-			"timestamp": datetime.utcnow().isoformat(),
+			"timestamp": _utc_now_iso(),
 			"data": {"asset_id": asset.id, "asset_number": asset.asset_number}
 		})
 
@@ -686,7 +917,7 @@ async def _register_asset_task(job_id: str, request: AssetRegistrationRequest):
 		await push_sse(job_id, {
 			"stage": "error",
 			"message": f"자산 등록 오류: {str(e)}",
-			"timestamp": datetime.utcnow().isoformat()
+			"timestamp": _utc_now_iso()
 		})
 		raise e
 
@@ -721,6 +952,14 @@ async def get_job_status(job_id: str):
 	return sse_response(job_id)
 
 
+# 자산 목록 CSV 컬럼 (헤더와 행 값의 순서)
+_ASSET_LIST_FIELDNAMES = (
+	'asset_number', 'model_name', 'serial_number', 'manufacturer',
+	'site', 'asset_type', 'user', 'registration_date',
+)
+# 상세 JSON 에는 OCR/세그멘테이션 결과의 numpy 값이 섞여 있을 수 있음
+_ASSET_DETAIL_DUMP_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
 @router.post("/save-asset-data")
 async def save_asset_data(request: AssetRegistrationRequest):
 	"""
@@ -730,7 +969,7 @@ async def save_asset_data(request: AssetRegistrationRequest):
 
 	try:
 		# 자산 번호 생성
-		asset_number = f"AMS-{datetime.utcnow().year}-{str(uuid.uuid4())[:8]}"
+		asset_number = _next_asset_number()
 		registration_logger.info(f"새 자산 번호 생성됨: {asset_number}")
 
 		# CSV 저장용 데이터 (자산 목록 조회용)
@@ -752,11 +991,15 @@ async def save_asset_data(request: AssetRegistrationRequest):
 		# CSV 파일에 추가 (헤더가 없으면 헤더도 추가)
 		file_exists = csv_file_path.exists() and csv_file_path.stat().st_size > 0
 
-		with open(csv_file_path, 'a', newline='', encoding='utf-8') as csvfile:
-			writer = csv.DictWriter(csvfile, fieldnames=csv_data.keys())
-			if not file_exists:
-				writer.writeheader()
-			writer.writerow(csv_data)
+		# 비동기 파일에 바로 쓸 수 없으므로 행을 문자열로 만든 뒤 한 번에 기록 (고정 컬럼 순서로 writerow)
+		csv_buffer = StringIO()
+		writer = csv.writer(csv_buffer)
+		if not file_exists:
+			writer.writerow(_ASSET_LIST_FIELDNAMES)
+		writer.writerow([csv_data[key] for key in _ASSET_LIST_FIELDNAMES])
+
+		async with aiofiles.open(csv_file_path, 'a', newline='', encoding='utf-8') as csvfile:
+			await csvfile.write(csv_buffer.getvalue())
 
 		registration_logger.info(f"CSV 파일에 자산 데이터 저장 완료: {csv_file_path}")
 
@@ -776,9 +1019,9 @@ async def save_asset_data(request: AssetRegistrationRequest):
 		json_file_path = Path(f"data/assets/details/{asset_number}.json")
 		json_file_path.parent.mkdir(parents=True, exist_ok=True)
 
-		# JSON 파일 저장
-		with open(json_file_path, 'w', encoding='utf-8') as jsonfile:
-			json.dump(json_data, jsonfile, ensure_ascii=False, indent=2)
+		# JSON 파일 저장 (orjson 은 UTF-8 bytes 를 바로 만들어 ensure_ascii=False 와 같은 결과)
+		async with aiofiles.open(json_file_path, 'wb') as jsonfile:
+			await jsonfile.write(orjson.dumps(json_data, option=_ASSET_DETAIL_DUMP_OPTIONS))
 
 		registration_logger.info(f"JSON 파일에 자산 상세 데이터 저장 완료: {json_file_path}")
 
@@ -797,6 +1040,136 @@ async def save_asset_data(request: AssetRegistrationRequest):
 		)
 
 
+# 자산 목록 메모리 인덱스: CSV 파일 (경로, inode, mtime, size) 가 바뀔 때만 다시 파싱
+# 같은 파일 끝에 행이 추가되기만 했다면 offset 이후의 새 줄만 읽어 이어 붙인다.
+# postings 는 등치 필터 컬럼별 값 -> 행 번호 (오름차순) 배열 색인
+_assets_list_cache: Dict[str, Any] = {
+	"key": None, "offset": 0, "fieldnames": None, "rows": [], "columns": {}, "postings": {}
+}
+_assets_list_lock = threading.Lock()
+
+# 값 색인으로 거르는 등치 필터 컬럼
+_EQUALITY_FILTER_COLUMNS = ("asset_type", "site", "manufacturer")
+_EMPTY_ROW_INDEX = np.empty(0, dtype=np.intp)
+
+def _read_assets_list_rows(csv_file_path: Path, offset: int = 0, fieldnames: Optional[List[str]] = None):
+	"""
+	자산 목록 CSV 에서 offset 이후의 완전한 줄만 읽어 (행 목록, 다음 offset, 헤더) 반환
+	offset 은 stat 크기가 아니라 실제로 읽은 완전한 줄의 끝이므로, 읽는 도중 추가된 줄은 다음 증분 조회에서 한 번만 읽힌다.
+	이어 읽을 수 없는 상태 (offset 직전이 줄 끝이 아님) 이면 None 반환
+	"""
+	with open(csv_file_path, 'rb') as csvfile:
+		if offset:
+			csvfile.seek(offset - 1)
+			if csvfile.read(1) != b"\n":
+				return None
+		tail = csvfile.read()
+
+	# 아직 쓰는 중인 마지막 줄은 다음 조회 때 읽음
+	complete = tail[:tail.rfind(b"\n") + 1]
+	reader = csv.DictReader(StringIO(complete.decode('utf-8'), newline=''), fieldnames=fieldnames)
+	rows = list(reader)
+	return rows, offset + len(complete), reader.fieldnames
+
+def _build_assets_list_columns(rows: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+	"""
+	필터용 컬럼 배열 생성
+	"""
+	def column(values) -> np.ndarray:
+		return np.array(list(values), dtype=str)
+
+	return {
+		# 검색 대상 필드는 기존과 같이 구분자 없이 이어 붙인 소문자 문자열
+		"search": column(
+			''.join((row.get(key) or '') for key in ('model_name', 'serial_number', 'manufacturer', 'asset_number')).lower()
+			for row in rows
+		),
+		"asset_type": column((row.get('asset_type') or '') for row in rows),
+		"site": column((row.get('site') or '') for row in rows),
+		"manufacturer": column((row.get('manufacturer') or '') for row in rows),
+	}
+
+def _build_assets_list_postings(columns: Dict[str, np.ndarray], offset: int = 0) -> Dict[str, Dict[str, np.ndarray]]:
+	"""
+	등치 필터 컬럼별 값 -> 행 번호 배열 색인 생성 (offset 은 columns 첫 행의 전체 행 번호)
+	"""
+	postings = {}
+	for name in _EQUALITY_FILTER_COLUMNS:
+		values, inverse = np.unique(columns[name], return_inverse=True)
+		# 같은 값의 행 번호를 모아 값마다 오름차순 배열로 분할
+		order = np.argsort(inverse, kind='stable')
+		bounds = np.cumsum(np.bincount(inverse, minlength=len(values)))[:-1]
+		postings[name] = {
+			value: group + offset
+			for value, group in zip(values.tolist(), np.split(order, bounds))
+		}
+	return postings
+
+def _merge_assets_list_postings(postings, new_postings):
+	"""
+	기존 색인에 새 행의 색인을 이어 붙인 새 색인 반환 (조회 중인 기존 색인은 변경하지 않음)
+	"""
+	merged = {}
+	for name, index in postings.items():
+		index = dict(index)
+		for value, row_ids in new_postings[name].items():
+			existing = index.get(value)
+			index[value] = row_ids if existing is None else np.concatenate((existing, row_ids))
+		merged[name] = index
+	return merged
+
+def _load_assets_list_index(csv_file_path: Path):
+	"""
+	자산 목록을 행 목록, 필터용 컬럼 배열, 등치 필터 색인으로 로드 (파일이 바뀌지 않았으면 캐시 반환)
+	"""
+	# 스레드 풀에서 동시에 호출되므로 캐시 확인부터 갱신까지 한 스레드만 수행 (같은 꼬리를 두 번 붙이지 않도록)
+	with _assets_list_lock:
+		stat_result = csv_file_path.stat()
+		cache_key = (csv_file_path, stat_result.st_ino, stat_result.st_mtime_ns, stat_result.st_size)
+		if _assets_list_cache["key"] == cache_key:
+			return _assets_list_cache["rows"], _assets_list_cache["columns"], _assets_list_cache["postings"]
+
+		cached_key = _assets_list_cache["key"]
+		offset = _assets_list_cache["offset"]
+		if (
+			cached_key is not None
+			and cached_key[:2] == cache_key[:2]
+			and stat_result.st_size >= offset
+		):
+			# 저장 시에는 같은 CSV 끝에 행만 추가되므로 새로 붙은 줄만 파싱
+			tail = _read_assets_list_rows(csv_file_path, offset, _assets_list_cache["fieldnames"])
+			if tail is not None:
+				new_rows, new_offset, fieldnames = tail
+				old_rows = _assets_list_cache["rows"]
+				rows = old_rows + new_rows
+				columns = _assets_list_cache["columns"]
+				postings = _assets_list_cache["postings"]
+				if new_rows:
+					new_columns = _build_assets_list_columns(new_rows)
+					columns = {name: np.concatenate((columns[name], new_columns[name])) for name in columns}
+					postings = _merge_assets_list_postings(
+						postings, _build_assets_list_postings(new_columns, offset=len(old_rows))
+					)
+				_assets_list_cache.update(
+					key=cache_key, offset=new_offset, fieldnames=fieldnames,
+					rows=rows, columns=columns, postings=postings
+				)
+				registration_logger.debug(f"자산 목록 인덱스 증분 갱신: {len(new_rows)}개 행 추가 (총 {len(rows)}개)")
+				return rows, columns, postings
+
+		# 파일이 교체되었거나 줄어들었으면 처음부터 다시 파싱
+		rows, offset, fieldnames = _read_assets_list_rows(csv_file_path)
+		columns = _build_assets_list_columns(rows)
+		postings = _build_assets_list_postings(columns)
+
+		_assets_list_cache.update(
+			key=cache_key, offset=offset, fieldnames=fieldnames,
+			rows=rows, columns=columns, postings=postings
+		)
+		registration_logger.debug(f"자산 목록 인덱스 재구성: {len(rows)}개 행")
+		return rows, columns, postings
+
+
 @router.get("/assets/list")
 async def get_assets_list(
 	page: int = 1,
@@ -824,44 +1197,32 @@ async def get_assets_list(
 				"total_pages": 0
 			}
 
-		assets = []
-
-		# CSV 파일 읽기
-		with open(csv_file_path, 'r', encoding='utf-8') as csvfile:
-			reader = csv.DictReader(csvfile)
-			for row in reader:
-				# 검색 필터 적용
-				if search and search.lower() not in (
-					row.get('model_name', '').lower() + 
-					row.get('serial_number', '').lower() + 
-					row.get('manufacturer', '').lower() +
-					row.get('asset_number', '').lower()
-				):
-					continue
-
-				# 자산 유형 필터 적용
-				if asset_type and row.get('asset_type', '') != asset_type:
-					continue
-
-				# 지점 필터 적용
-				if site and row.get('site', '') != site:
-					continue
-
-				# 제조사 필터 적용
-				if manufacturer and row.get('manufacturer', '') != manufacturer:
-					continue
+		# 캐시 미스 시 파일 전체를 파싱하므로 이벤트 루프 밖에서 로드
+		rows, columns, postings = await asyncio.get_running_loop().run_in_executor(
+			None, _load_assets_list_index, csv_file_path
+		)
 
-				assets.append(row)
+		# 자산 유형/지점/제조사 필터는 값 색인의 행 번호 배열을 교집합 (전체 컬럼을 비교하지 않음)
+		matched = None
+		for name, value in (("asset_type", asset_type), ("site", site), ("manufacturer", manufacturer)):
+			if value:
+				row_ids = postings[name].get(value, _EMPTY_ROW_INDEX)
+				matched = row_ids if matched is None else np.intersect1d(matched, row_ids, assume_unique=True)
+		if matched is None:
+			matched = np.arange(len(rows))
 
-		registration_logger.info(f"필터링된 자산 수: {len(assets)}")
+		# 검색 필터는 남은 후보 행에만 적용
+		if search and len(matched):
+			matched = matched[np.char.find(columns["search"][matched], search.lower()) >= 0]
+		registration_logger.info(f"필터링된 자산 수: {len(matched)}")
 
 		# 페이징 처리
-		total = len(assets)
+		total = len(matched)
 		total_pages = (total + page_size - 1) // page_size
 		start = (page - 1) * page_size
 		end = start + page_size
 
-		paginated_assets = assets[start:end]
+		paginated_assets = [rows[i] for i in matched[start:end]]
 
 		registration_logger.info(f"페이징 결과: {len(paginated_assets)}개 항목 반환")
 
@@ -899,8 +1260,8 @@ async def get_asset_detail(asset_number: str):
 			)
 
 		# JSON 파일 읽기
-		with open(json_file_path, 'r', encoding='utf-8') as jsonfile:
-			asset_detail = json.load(jsonfile)
+		async with aiofiles.open(json_file_path, 'rb') as jsonfile:
+			asset_detail = orjson.loads(await jsonfile.read())
 
 		registration_logger.info(f"자산 상세 정보 조회 완료: {asset_number}")
 		return asset_detail
@@ -915,20 +1276,28 @@ async def get_asset_detail(asset_number: str):
 		)
 
 
+# OCR 카테고리 -> 자산 필드명 (DB 검증 대상 카테고리만 포함, 그 외 카테고리는 제안 조회 시 그대로 사용)
+_CATEGORY_TO_FIELD = {
+	'model': 'model_name',
+	'serial': 'serial_number',
+	'manufacturer': 'manufacturer',
+}
+
 @router.post("/verify-single")
-async def verify_single_item(request: Dict[str, Any]):
+async def verify_single_item(request: OCRVerifyItem):
 	"""
 	단일 OCR 항목 검증
 	"""
 	registration_logger.info("단일 항목 검증 요청 수신")
 
 	try:
-		# 서비스 초기화 확인
-		await initialize_services()
+		# 서비스 초기화 확인 (시작 시 초기화되므로 보통은 건너뜀)
+		if asset_matcher is None or confidence_evaluator is None:
+			await initialize_services()
 
-		text = request.get('text', '')
-		category = request.get('category', 'other')
-		confidence = request.get('confidence', 0.0)
+		text = request.text
+		category = request.category
+		confidence = request.confidence
 
 		registration_logger.debug(f"검증 대상: {text} (카테고리: {category}, 신뢰도: {confidence})")
 
@@ -941,22 +1310,20 @@ async def verify_single_item(request: Dict[str, Any]):
 
 		# DB 검증 수행
 		verification_result = None
-		if text and category in ['model', 'serial', 'manufacturer']:
-			field_data = {f'{category}_name' if category == 'model' else 
-						 f'{category}_number' if category == 'serial' else category: text}
-			verification_result = await asset_matcher.verify_ocr_result_async(field_data)
-			verification_result = verification_result.get(f'{category}_name' if category == 'model' else 
-														f'{category}_number' if category == 'serial' else category)
-
-		# 신뢰도 평가
-		evaluation = confidence_evaluator.evaluate_ocr_result(ocr_data, verification_result)
+		field_name = _CATEGORY_TO_FIELD.get(category)
+		if text and field_name:
+			verification_result = await asset_matcher.verify_ocr_result_async({field_name: text})
+			verification_result = verification_result.get(field_name)
+
+		# 신뢰도 평가 (CPU 작업이므로 이벤트 루프 밖에서 실행)
+		evaluation = await asyncio.get_running_loop().run_in_executor(
+			None, confidence_evaluator.evaluate_ocr_result, ocr_data, verification_result
+		)
 
 		# 자동완성 제안 생성
 		suggestions = []
 		if text and len(text) >= 2:
-			field_type = 'model_name' if category == 'model' else \
-						'serial_number' if category == 'serial' else category
-			suggestions = await asset_matcher.get_suggestions(field_type, text, limit=5)
+			suggestions = await asset_matcher.get_suggestions(field_name or category, text, limit=5)
 
 		return {
 			"verification": evaluation,
@@ -973,7 +1340,7 @@ async def verify_single_item(request: Dict[str, Any]):
 
 
 @router.post("/verify-ocr")
-async def verify_ocr_batch(request: Dict[str, Any]):
+async def verify_ocr_batch(request: BatchVerifyRequest):
 	"""
 	OCR 결과 일괄 검증
 	"""
@@ -983,49 +1350,70 @@ async def verify_ocr_batch(request: Dict[str, Any]):
 		# 서비스 초기화 확인
 		await initialize_services()
 
-		ocr_data_list = request.get('ocr_data', [])
+		ocr_data_list = request.ocr_data
 		registration_logger.debug(f"검증할 항목 수: {len(ocr_data_list)}")
 
-		# 각 항목별 검증 수행
-		verification_results = {}
+		# 항목을 검증 필드별로 묶어 필드마다 한 번의 일괄 검증/제안 조회로 처리
+		# (항목별 검증 필드/제안 필드는 여기서 한 번만 계산해 결과 분배 시 재사용)
+		verify_buckets: Dict[str, List[str]] = {}
+		suggestion_buckets: Dict[str, List[str]] = {}
+		item_fields = []
+		for item in ocr_data_list:
+			text = item.text
+			category = item.category
+			field_name = field_type = None
+			if text:
+				field_name = _CATEGORY_TO_FIELD.get(category)
+				if field_name:
+					verify_buckets.setdefault(field_name, []).append(text)
+				if len(text) >= 2:
+					field_type = field_name or category
+					suggestion_buckets.setdefault(field_type, []).append(text)
+			item_fields.append((text, category, field_name, field_type))
+
+		db_results, *bulk_suggestions = await asyncio.gather(
+			asset_matcher.verify_ocr_bulk_async(verify_buckets),
+			*(
+				asset_matcher.get_suggestions_bulk(field_type, texts, limit=5)
+				for field_type, texts in suggestion_buckets.items()
+			)
+		)
+		suggestion_results = dict(zip(suggestion_buckets, bulk_suggestions))
+
+		# 각 항목별 결과 분배 (신뢰도 평가는 아래에서 한꺼번에 수행)
+		evaluation_inputs = []
 		suggestions = {}
 
-		for item in ocr_data_list:
-			item_id = item.get('id', '')
-			text = item.get('text', '')
-			category = item.get('category', 'other')
-			confidence = item.get('confidence', 0.0)
+		for item, (text, category, field_name, field_type) in zip(ocr_data_list, item_fields):
+			item_id = item.id
 
 			# OCR 데이터 구성
 			ocr_data = {
 				'text': text,
-				'confidence': confidence,
+				'confidence': item.confidence,
 				'category': category
 			}
 
-			# DB 검증 수행
-			verification_result = None
-			if text and category in ['model', 'serial', 'manufacturer']:
-				field_data = {f'{category}_name' if category == 'model' else 
-							 f'{category}_number' if category == 'serial' else category: text}
-				db_result = await asset_matcher.verify_ocr_result_async(field_data)
-				verification_result = db_result.get(f'{category}_name' if category == 'model' else 
-													f'{category}_number' if category == 'serial' else category)
-
-			# 신뢰도 평가
-			evaluation = confidence_evaluator.evaluate_ocr_result(ocr_data, verification_result)
-			verification_results[item_id] = evaluation
-
-			# 자동완성 제안 생성
-			item_suggestions = []
-			if text and len(text) >= 2:
-				field_type = 'model_name' if category == 'model' else \
-							'serial_number' if category == 'serial' else category
-				item_suggestions = await asset_matcher.get_suggestions(field_type, text, limit=5)
-			suggestions[item_id] = item_suggestions
-
-		# 전체 통계 계산
-		batch_evaluation = confidence_evaluator.batch_evaluate(ocr_data_list, verification_results)
+			# DB 검증 결과
+			verification_result = db_results[field_name][text] if field_name else None
+			evaluation_inputs.append((item_id, ocr_data, verification_result))
+
+			# 자동완성 제안
+			suggestions[item_id] = suggestion_results[field_type][text] if field_type else []
+
+		# 신뢰도 평가와 전체 통계 계산 (패턴 매칭/ML 예측은 CPU 작업이므로 이벤트 루프 밖에서 한 번에 실행)
+		def _evaluate_batch():
+			evaluations = confidence_evaluator.evaluate_ocr_results(
+				[(ocr_data, verification_result) for _, ocr_data, verification_result in evaluation_inputs]
+			)
+			verification_results = {}
+			for (item_id, _, _), evaluation in zip(evaluation_inputs, evaluations):
+				verification_results[item_id] = evaluation
+			return verification_results, confidence_evaluator.batch_evaluate(
+				[item.dict() for item in ocr_data_list], verification_results
+			)
+
+		verification_results, batch_evaluation = await asyncio.get_running_loop().run_in_executor(None, _evaluate_batch)
 
 		return {
 			"verification": verification_results,
@@ -1074,6 +1462,12 @@ async def get_suggestions(field_type: str, q: str = "", limit: int = 10):
 		)
 
 
+# 대시보드가 폴링하는 통계 응답 캐시 (초)
+STATS_CACHE_TTL = 5.0
+_verification_stats_cache = TTLCache(STATS_CACHE_TTL)
+_search_stats_cache = TTLCache(STATS_CACHE_TTL)
+_gpu_ocr_stats_cache = TTLCache(STATS_CACHE_TTL)
+
 @router.get("/verification/stats")
 async def get_verification_stats():
 	"""
@@ -1082,34 +1476,28 @@ async def get_verification_stats():
 	registration_logger.info("검증 시스템 통계 요청 수신")
 
 	try:
-		# 서비스 초기화 확인 (강제 리셋으로 새로 초기화)
-		await initialize_services(force_reset=True)
-
-		# 각 서비스의 통계 수집
-		matcher_stats = {}
-		evaluator_stats = {}
-		fuzzy_stats = {}
-
-		if asset_matcher:
-			try:
-				matcher_stats = asset_matcher.get_stats()
-			except Exception as e:
-				registration_logger.warning(f"자산 매처 통계 수집 실패: {str(e)}")
-				matcher_stats = {"error": str(e)}
+		# 서비스 초기화 확인 (다시 초기화가 필요하면 /services/reset 사용)
+		await initialize_services()
 
-		if confidence_evaluator:
+		# 각 서비스의 통계 수집 (대시보드 폴링이 몰려도 STATS_CACHE_TTL 동안은 한 번만 수집)
+		async def _safe_stats(get_stats, name: str) -> Dict[str, Any]:
+			# 통계 수집 중 파일을 읽는 서비스가 있어 기본 스레드 풀에서 실행, 실패는 오류 항목으로 반환
+			if get_stats is None:
+				return {}
 			try:
-				evaluator_stats = confidence_evaluator.get_stats()
+				return await asyncio.get_running_loop().run_in_executor(None, get_stats)
 			except Exception as e:
-				registration_logger.warning(f"신뢰도 평가기 통계 수집 실패: {str(e)}")
-				evaluator_stats = {"error": str(e)}
+				registration_logger.warning(f"{name} 통계 수집 실패: {str(e)}")
+				return {"error": str(e)}
+
+		async def _collect_stats():
+			return await asyncio.gather(
+				_safe_stats(asset_matcher.get_stats if asset_matcher else None, "자산 매처"),
+				_safe_stats(confidence_evaluator.get_stats if confidence_evaluator else None, "신뢰도 평가기"),
+				_safe_stats(fuzzy_matcher.get_cache_stats if fuzzy_matcher else None, "퍼지 매처")
+			)
 
-		if fuzzy_matcher:
-			try:
-				fuzzy_stats = fuzzy_matcher.get_cache_stats()
-			except Exception as e:
-				registration_logger.warning(f"퍼지 매처 통계 수집 실패: {str(e)}")
-				fuzzy_stats = {"error": str(e)}
+		matcher_stats, evaluator_stats, fuzzy_stats = await _verification_stats_cache.get(_collect_stats)
 
 		return {
 			"asset_matcher": matcher_stats,
@@ -1134,7 +1522,7 @@ async def get_verification_stats():
 # Phase 2: 새로운 엔드포인트들 추가
 
 @router.post("/feedback/collect")
-async def collect_user_feedback(request: Dict[str, Any]):
+async def collect_user_feedback(request: FeedbackRequest):
 	"""
 	사용자 피드백 수집 (Phase 2: ML 학습용)
 	"""
@@ -1144,17 +1532,12 @@ async def collect_user_feedback(request: Dict[str, Any]):
 		# 서비스 초기화 확인
 		await initialize_services()
 
-		ocr_data = request.get('ocr_data', {})
-		verification_result = request.get('verification_result')
-		user_accepted = request.get('user_accepted', True)
-		corrected_text = request.get('corrected_text')
-
 		# 피드백 수집
 		await confidence_evaluator.collect_user_feedback(
-			ocr_data=ocr_data,
-			verification_result=verification_result,
-			user_accepted=user_accepted,
-			corrected_text=corrected_text
+			ocr_data=request.ocr_data,
+			verification_result=request.verification_result,
+			user_accepted=request.user_accepted,
+			corrected_text=request.corrected_text
 		)
 
 		return {
@@ -1171,7 +1554,7 @@ async def collect_user_feedback(request: Dict[str, Any]):
 
 
 @router.post("/performance/update")
-async def update_performance_metrics(request: Dict[str, Any]):
+async def update_performance_metrics(request: PerformanceMetricsRequest):
 	"""
 	성능 지표 업데이트 및 임계값 자동 조정 (Phase 2)
 	"""
@@ -1182,13 +1565,7 @@ async def update_performance_metrics(request: Dict[str, Any]):
 		await initialize_services()
 
 		# 성능 지표 생성
-		metrics = PerformanceMetrics(
-			true_positives=request.get('true_positives', 0),
-			false_positives=request.get('false_positives', 0),
-			true_negatives=request.get('true_negatives', 0),
-			false_negatives=request.get('false_negatives', 0),
-			total_predictions=request.get('total_predictions', 0)
-		)
+		metrics = PerformanceMetrics(**request.dict())
 
 		# 임계값 조정
 		adjustment_result = await confidence_evaluator.update_performance_metrics(metrics)
@@ -1240,8 +1617,12 @@ async def get_ml_model_info():
 		)
 
 
+# 수동 설정 시 필요한 임계값 키 (높은 값부터)
+_THRESHOLD_KEYS = ('high', 'medium', 'low', 'very_low')
+_THRESHOLD_KEY_SET = frozenset(_THRESHOLD_KEYS)
+
 @router.post("/thresholds/manual-override")
-async def manual_threshold_override(request: Dict[str, Any]):
+async def manual_threshold_override(request: ThresholdOverrideRequest):
 	"""
 	수동 임계값 설정 (Phase 2)
 	"""
@@ -1251,28 +1632,28 @@ async def manual_threshold_override(request: Dict[str, Any]):
 		# 서비스 초기화 확인
 		await initialize_services()
 
-		new_thresholds = request.get('thresholds', {})
-		reason = request.get('reason', 'manual_override')
+		new_thresholds = request.thresholds
+		reason = request.reason
 
 		# 임계값 검증
-		required_keys = ['high', 'medium', 'low', 'very_low']
-		if not all(key in new_thresholds for key in required_keys):
+		if not new_thresholds.keys() >= _THRESHOLD_KEY_SET:
 			raise HTTPException(
 				status_code=status.HTTP_400_BAD_REQUEST,
-				detail=f"필수 임계값이 누락되었습니다: {required_keys}"
+				detail=f"필수 임계값이 누락되었습니다: {list(_THRESHOLD_KEYS)}"
 			)
 
-		# 임계값 범위 검증
-		for key, value in new_thresholds.items():
-			if not 0.0 <= value <= 1.0:
-				raise HTTPException(
-					status_code=status.HTTP_400_BAD_REQUEST,
-					detail=f"임계값은 0.0과 1.0 사이여야 합니다: {key}={value}"
-				)
+		# 임계값 범위 검증 (최솟값/최댓값만 비교하고, 벗어난 경우에만 해당 키를 찾음)
+		values = new_thresholds.values()
+		if not (0.0 <= min(values) and max(values) <= 1.0):
+			key, value = next((k, v) for k, v in new_thresholds.items() if not 0.0 <= v <= 1.0)
+			raise HTTPException(
+				status_code=status.HTTP_400_BAD_REQUEST,
+				detail=f"임계값은 0.0과 1.0 사이여야 합니다: {key}={value}"
+			)
 
 		# 임계값 순서 검증 (high > medium > low > very_low)
-		if not (new_thresholds['high'] > new_thresholds['medium'] > 
-				new_thresholds['low'] > new_thresholds['very_low']):
+		high, medium, low, very_low = (new_thresholds[key] for key in _THRESHOLD_KEYS)
+		if not high > medium > low > very_low:
 			raise HTTPException(
 				status_code=status.HTTP_400_BAD_REQUEST,
 				detail="임계값은 high > medium > low > very_low 순서여야 합니다"
@@ -1328,15 +1709,23 @@ async def search_assets(query: str, field: str = "content", limit: int = 10):
 
 
 @router.get("/search/suggestions")
-async def get_search_suggestions(field: str, partial_text: str, limit: int = 5):
+async def get_search_suggestions(field: str, partial_text: str, limit: int = 5, session_id: Optional[str] = None):
 	"""
-	검색 자동완성 제안
+	검색 자동완성 제안 (session_id 를 보내면 이어지는 입력은 직전 탐색 위치에서 이어서 조회)
 	"""
 	registration_logger.info(f"자동완성 요청: field={field}, text={partial_text}")
 
 	try:
-		search_engine = await get_search_engine()
-		suggestions = await search_engine.suggest_completions(field, partial_text, limit)
+		# 자산 매처가 트라이를 가진 필드는 트라이에서 바로 조회, 그 외 필드만 검색 엔진 사용
+		await initialize_services()
+		if asset_matcher is not None and field in asset_matcher.suggestion_tries:
+			if session_id:
+				suggestions = await asset_matcher.get_session_suggestions(session_id, field, partial_text, limit)
+			else:
+				suggestions = await asset_matcher.get_suggestions(field, partial_text, limit)
+		else:
+			search_engine = await get_search_engine()
+			suggestions = await search_engine.suggest_completions(field, partial_text, limit)
 
 		return {
 			"field": field,
@@ -1362,7 +1751,7 @@ async def get_search_stats():
 
 	try:
 		search_engine = await get_search_engine()
-		stats = await search_engine.get_stats()
+		stats = await _search_stats_cache.get(search_engine.get_stats)
 
 		return {
 			"stats": stats,
@@ -1603,15 +1992,15 @@ async def get_ab_test_status(test_id: str):
 
 
 @router.post("/ab-test/{test_id}/conversion")
-async def record_ab_test_conversion(test_id: str, request: Dict[str, Any]):
+async def record_ab_test_conversion(test_id: str, request: ABTestConversionRequest):
 	"""
 	A/B 테스트 전환 이벤트 기록
 	"""
 	registration_logger.info(f"A/B 테스트 전환 기록: {test_id}")
 
 	try:
-		user_id = request.get('user_id')
-		conversion_data = request.get('conversion_data', {})
+		user_id = request.user_id
+		conversion_data = request.conversion_data
 
 		if not user_id:
 			raise HTTPException(
@@ -1647,10 +2036,14 @@ async def record_ab_test_conversion(test_id: str, request: Dict[str, Any]):
 
 # ==================== GPU OCR API 엔드포인트 ====================
 
+# GPU 배치 OCR 요청에서 동시에 읽는 업로드 파일 수
+BATCH_OCR_READ_CONCURRENCY = 8
+
 @router.post("/gpu-ocr/batch")
 async def process_batch_gpu_ocr(files: List[UploadFile] = File(...)):
 	"""
 	GPU 최적화 배치 OCR 처리
+	이미지별 결과를 처리되는 대로 NDJSON (한 줄에 JSON 하나) 으로 스트리밍하고, 마지막 줄에 요약을 보낸다.
 	"""
 	registration_logger.info(f"GPU 배치 OCR 요청 수신: {len(files)}개 파일")
 
@@ -1660,8 +2053,7 @@ async def process_batch_gpu_ocr(files: List[UploadFile] = File(...)):
 		if not gpu_manager.is_gpu_available():
 			registration_logger.warning("GPU를 사용할 수 없어 CPU로 처리합니다")
 
-		# 이미지 파일 검증
-		image_data = []
+		# 이미지 파일 검증 (하나라도 잘못되면 파일을 읽기 전에 거부)
 		for file in files:
 			if not file.content_type.startswith("image/"):
 				raise HTTPException(
@@ -1669,52 +2061,62 @@ async def process_batch_gpu_ocr(files: List[UploadFile] = File(...)):
 					detail=f"잘못된 파일 형식: {file.filename}"
 				)
 
-			data = await file.read()
-			image_data.append({
+		# 업로드 파일을 동시에 읽되, 동시에 읽는 파일 수는 제한
+		read_semaphore = asyncio.Semaphore(BATCH_OCR_READ_CONCURRENCY)
+
+		async def _read(file: UploadFile) -> Dict[str, Any]:
+			async with read_semaphore:
+				data = await file.read()
+			return {
 				"filename": file.filename,
 				"data": data,
 				"content_type": file.content_type
-			})
+			}
+
+		image_data = await asyncio.gather(*(_read(file) for file in files))
 
 		# 배치 OCR 엔진으로 처리
 		batch_engine = await get_batch_ocr_engine()
+		gpu_available = gpu_manager.is_gpu_available()
 
 		# BatchOCRRequest 생성
 		batch_request = BatchOCRRequest(
 			images=image_data,
-			use_gpu=gpu_manager.is_gpu_available(),
-			batch_size=await gpu_manager.get_optimal_batch_size() if gpu_manager.is_gpu_available() else 4
+			use_gpu=gpu_available,
+			batch_size=batch_engine.config.batch_size if gpu_available else 4
 		)
 
-		# 배치 처리 실행
-		results = await batch_engine.process_batch(batch_request)
-
-		registration_logger.info(f"GPU 배치 OCR 처리 완료: {len(results.results)}개 결과")
+		async def _stream_results():
+			"""이미지별 결과를 완료되는 대로 NDJSON 한 줄씩 전송하고 마지막 줄에 요약 전송"""
+			start_time = time.time()
+			processed = 0
+			try:
+				async for result in batch_engine.process_batch_stream(batch_request):
+					if "error" not in result:
+						processed += 1
+					yield orjson.dumps({"type": "result", **result}) + b"\n"
+			except Exception as e:
+				registration_logger.error(f"GPU 배치 OCR 처리 중 오류 발생: {str(e)}")
+				yield orjson.dumps({"type": "error", "detail": f"GPU 배치 OCR 처리 실패: {str(e)}"}) + b"\n"
+				return
+
+			processing_time = time.time() - start_time
+			registration_logger.info(f"GPU 배치 OCR 처리 완료: {processed}개 결과")
+			yield orjson.dumps({
+				"type": "summary",
+				"message": "GPU 배치 OCR 처리가 완료되었습니다",
+				"total_images": len(files),
+				"processed_images": processed,
+				"processing_time": processing_time,
+				"gpu_used": gpu_available,
+				"performance_stats": {
+					"total_time": processing_time,
+					"average_time_per_image": processing_time / processed if processed else 0
+				},
+				"status": "success"
+			}) + b"\n"
 
-		return {
-			"message": "GPU 배치 OCR 처리가 완료되었습니다",
-			"total_images": len(files),
-			"processed_images": len(results.results),
-			"processing_time": results.processing_time,
-			"gpu_used": results.gpu_used,
-			"results": [
-				{
-					"filename": result.filename,
-					"text": result.text,
-					"confidence": result.confidence,
-					"processing_time": result.processing_time,
-					"bounding_boxes": result.bounding_boxes
-				}
-				for result in results.results
-			],
-			"performance_stats": {
-				"total_time": results.processing_time,
-				"average_time_per_image": results.processing_time / len(results.results) if results.results else 0,
-				"gpu_memory_used": results.gpu_memory_used,
-				"cpu_usage": results.cpu_usage
-			},
-			"status": "success"
-		}
+		return StreamingResponse(_stream_results(), media_type="application/x-ndjson")
 
 	except HTTPException:
 		raise
@@ -1737,11 +2139,11 @@ async def get_gpu_ocr_stats():
 		gpu_manager = await get_gpu_manager()
 		batch_engine = await get_batch_ocr_engine()
 
-		# GPU 상태 정보
-		gpu_stats = await gpu_manager.get_gpu_stats()
+		async def _collect_stats():
+			# GPU 상태 정보, 배치 엔진 통계
+			return await gpu_manager.get_gpu_stats(), await batch_engine.get_performance_stats()
 
-		# 배치 엔진 통계
-		engine_stats = await batch_engine.get_performance_stats()
+		gpu_stats, engine_stats = await _gpu_ocr_stats_cache.get(_collect_stats)
 
 		return {
 			"gpu_info": {
@@ -1815,17 +2217,20 @@ async def get_scheduler_status():
 
 
 @router.post("/gpu-ocr/scheduler/job")
-async def submit_ocr_job(request: Dict[str, Any]):
+async def submit_ocr_job(request: OCRJobSubmitRequest):
 	"""
 	OCR 작업 스케줄러에 작업 제출
+
+	큐에 넣기만 하고 바로 job_id 를 반환한다. 대기 순번과 진행 상태는
+	/gpu-ocr/scheduler/job/{job_id} 로 조회한다.
 	"""
 	registration_logger.info("OCR 작업 제출 요청 수신")
 
 	try:
 		# 요청 데이터 검증
-		images = request.get('images', [])
-		priority = request.get('priority', 'normal')
-		options = request.get('options', {})
+		images = request.images
+		priority = request.priority
+		options = request.options
 
 		if not images:
 			raise HTTPException(
@@ -1833,30 +2238,38 @@ async def submit_ocr_job(request: Dict[str, Any]):
 				detail="처리할 이미지가 없습니다"
 			)
 
-		# OCR 작업 요청 생성
-		job_request = OCRJobRequest(
-			images=images,
-			priority=priority,
-			options=options,
-			submitted_at=datetime.utcnow()
-		)
+		job_priority = JobPriority.__members__.get(str(priority).upper())
+		if job_priority is None:
+			raise HTTPException(
+				status_code=status.HTTP_400_BAD_REQUEST,
+				detail=f"알 수 없는 우선순위입니다: {priority}"
+			)
 
-		# 스케줄러에 작업 제출
+		# 스케줄러 큐에 작업 제출 (처리는 스케줄러 루프가 담당)
 		scheduler = await get_ocr_scheduler()
-		job_id = await scheduler.submit_job(job_request)
+		job_id = await scheduler.submit_job(
+			images,
+			priority=job_priority,
+			metadata={"options": options, "submitted_at": datetime.utcnow().isoformat()}
+		)
 
 		registration_logger.info(f"OCR 작업 제출 완료: {job_id}")
 
 		return {
 			"message": "OCR 작업이 성공적으로 제출되었습니다",
 			"job_id": job_id,
-			"estimated_completion_time": await scheduler.estimate_completion_time(job_id),
-			"queue_position": await scheduler.get_queue_position(job_id),
-			"status": "success"
+			"status": "queued"
 		}
 
 	except HTTPException:
 		raise
+	except QueueFullError as e:
+		registration_logger.warning(f"OCR 작업 큐 포화로 제출 거절: {str(e)}")
+		raise HTTPException(
+			status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+			detail="OCR 작업 큐가 가득 찼습니다. 잠시 후 다시 시도하세요",
+			headers={"Retry-After": "5"}
+		)
 	except Exception as e:
 		registration_logger.error(f"OCR 작업 제출 중 오류 발생: {str(e)}")
 		raise HTTPException(
@@ -1922,6 +2335,7 @@ async def reset_services():
 		asset_matcher = None
 		confidence_evaluator = None
 		fuzzy_matcher = None
+		_verification_stats_cache.clear()
 
 		registration_logger.info("모든 서비스가 리셋되었습니다")
 
@@ -1939,8 +2353,10 @@ async def reset_services():
 
 
 @router.get("/workflow")
-async def get_workflow():
+async def get_workflow(response: Response):
 	registration_logger.info("워크플로우 정보 요청 수신")
+	# 배포 동안 바뀌지 않는 고정 정보이므로 클라이언트 캐시 허용
+	response.headers["Cache-Control"] = "public, max-age=86400"
 	workflow = [
 		{"step": 1, "name": "upload", "description": "이미지 업로드"},
 		{"step": 2, "name": "segment", "description": "세그멘테이션 수행"},
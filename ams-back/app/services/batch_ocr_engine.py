@@ -1,7 +1,7 @@
 import asyncio
 import logging
 import numpy as np
-from typing import Dict, List, Optional, Tuple, Any, Union
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Any, Union
 from dataclasses import dataclass, asdict
 from pathlib import Path
 import time
@@ -222,6 +222,95 @@ class BatchOCREngine:
             logger.error(f"Failed to process image batch: {e}")
             return BatchOCRResult([], 0, 0.0, 0.0, self.current_device)
 
+    async def process_batch_stream(self, request: BatchOCRRequest) -> AsyncIterator[Dict[str, Any]]:
+        """
+        업로드 이미지 배치 처리 - 배치 단위로 OCR 을 수행하고 이미지별 결과를 완료되는 대로 반환
+
+        Args:
+            request: images 항목은 filename, data(bytes), content_type 을 가진 딕셔너리
+
+        Yields:
+            이미지별 결과 (filename, text, confidence, processing_time, bounding_boxes)
+        """
+        start_time = time.time()
+        use_gpu = request.use_gpu and self.current_device.startswith("cuda")
+        batch_size = max(1, request.batch_size)
+        total_confidence = 0.0
+        processed = 0
+
+        loop = asyncio.get_event_loop()
+        for i in range(0, len(request.images), batch_size):
+            batch = request.images[i:i + batch_size]
+            batch_start = time.time()
+
+            # 디코딩/전처리 (실패한 이미지는 None)
+            images = await loop.run_in_executor(self.executor, self._decode_upload_batch, batch)
+            decoded = [image for image in images if image is not None]
+
+            if use_gpu and self.gpu_manager:
+                # GPU 메모리 컨텍스트 사용
+                device_id = int(self.current_device.split(":")[1])
+                with self.gpu_manager.gpu_memory_context(device_id):
+                    image_results = await loop.run_in_executor(
+                        self.executor, self._ocr_image_batch_worker, decoded, use_gpu
+                    )
+            else:
+                image_results = await loop.run_in_executor(
+                    self.executor, self._ocr_image_batch_worker, decoded, use_gpu
+                )
+
+            # 이미지별 OCRResult 를 업로드 결과 형식으로 변환 (처리 시간은 배치 시간을 이미지 수로 나눈 값)
+            processing_time = (time.time() - batch_start) / len(batch)
+            ocr_results = iter(image_results)
+            for item, image in zip(batch, images):
+                filename = item.get("filename")
+                if image is None:
+                    yield {"filename": filename, "error": "Failed to decode image"}
+                    continue
+
+                results = next(ocr_results)
+                if results is None:
+                    yield {"filename": filename, "error": "OCR failed"}
+                    continue
+
+                confidence = sum(r.confidence for r in results) / len(results) if results else 0.0
+                processed += 1
+                total_confidence += confidence
+                yield {
+                    "filename": filename,
+                    "text": " ".join(r.text for r in results),
+                    "confidence": confidence,
+                    "processing_time": processing_time,
+                    "bounding_boxes": [
+                        {"text": r.text, "confidence": r.confidence, "bbox": list(r.bbox)}
+                        for r in results
+                    ]
+                }
+
+        average_confidence = total_confidence / processed if processed else 0.0
+        await self._update_stats(len(request.images), time.time() - start_time, average_confidence)
+
+    def _decode_upload_batch(self, batch: List[Dict[str, Any]]) -> List[Optional[np.ndarray]]:
+        """업로드 이미지 bytes 를 디코딩하고 전처리 (실패한 이미지는 None)"""
+        images = []
+        for item in batch:
+            try:
+                image = cv2.imdecode(np.frombuffer(item["data"], dtype=np.uint8), cv2.IMREAD_COLOR)
+            except Exception as e:
+                logger.error(f"Failed to decode uploaded image {item.get('filename')}: {e}")
+                images.append(None)
+                continue
+
+            if image is None:
+                logger.warning(f"Failed to decode uploaded image: {item.get('filename')}")
+                images.append(None)
+                continue
+
+            # 이미지별로 호출해 실패한 이미지가 있어도 순서가 어긋나지 않도록 함
+            processed = self._preprocess_batch_sync([image])
+            images.append(processed[0] if processed else None)
+        return images
+
     async def _get_optimal_batch_size(self, total_images: int) -> int:
         """최적 배치 크기 계산"""
         try:
@@ -361,13 +450,22 @@ class BatchOCREngine:
 
     def _ocr_batch_worker(self, batch: List[np.ndarray], use_gpu: bool) -> List[OCRResult]:
         """OCR 배치 워커"""
+        return [
+            result
+            for image_results in self._ocr_image_batch_worker(batch, use_gpu)
+            if image_results
+            for result in image_results
+        ]
+
+    def _ocr_image_batch_worker(self, batch: List[np.ndarray], use_gpu: bool) -> List[Optional[List[OCRResult]]]:
+        """OCR 배치 워커 - 이미지별 결과 목록 반환 (처리에 실패한 이미지는 None)"""
         results = []
 
         try:
             reader = self._get_ocr_reader(use_gpu)
             if not reader:
                 logger.error("OCR reader not available")
-                return results
+                return [None] * len(batch)
 
             for image in batch:
                 start_time = time.time()
@@ -378,6 +476,7 @@ class BatchOCREngine:
                     processing_time = time.time() - start_time
 
                     # 결과 변환
+                    image_results = []
                     for (bbox, text, confidence) in ocr_results:
                         if confidence >= self.config.confidence_threshold:
                             # bbox 좌표 변환
@@ -388,18 +487,20 @@ class BatchOCREngine:
 
                             result = OCRResult(
                                 text=text.strip(),
-                                confidence=confidence,
+                                confidence=float(confidence),
                                 bbox=(x1, y1, x2, y2),
                                 processing_time=processing_time
                             )
-                            results.append(result)
+                            image_results.append(result)
+                    results.append(image_results)
 
                 except Exception as e:
                     logger.error(f"Failed to process single image: {e}")
-                    continue
+                    results.append(None)
 
         except Exception as e:
             logger.error(f"OCR batch worker failed: {e}")
+            results.extend([None] * (len(batch) - len(results)))
 
         return results
 
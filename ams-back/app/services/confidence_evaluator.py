@@ -2,6 +2,7 @@ import re
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 import logging
+import numpy as np
 
 # 새로운 서비스 임포트
 from .confidence_ml import ConfidenceMLModel, FeedbackData
@@ -9,6 +10,20 @@ from .dynamic_thresholds import DynamicThresholdManager, PerformanceMetrics
 
 logger = logging.getLogger(__name__)
 
+# 종합 점수를 구성하는 요소 (가중치 딕셔너리 키와 같은 순서)
+_SCORE_KEYS = ('ocr_confidence', 'pattern_confidence', 'db_verification', 'length_penalty')
+
+# 패턴의 길이 제한 ({m,n}) 과 스펙 "숫자 + 단위" 정규식 (모듈 로드 시 한 번만 컴파일)
+_LENGTH_QUANTIFIER_RE = re.compile(r'\{(\d+),?(\d+)?\}')
+_NUMBER_UNIT_RE = re.compile(r'\d+\s*[a-zA-Z]+')
+
+# 휴리스틱 키워드 (소문자 비교)
+_KNOWN_MANUFACTURERS = (
+    'lg', '삼성', 'samsung', '애플', 'apple', '델', 'dell',
+    '레노버', 'lenovo', 'hp', 'asus', 'msi', '소니', 'sony'
+)
+_SPEC_UNITS = ('v', 'a', 'w', 'hz', 'gb', 'tb', 'mb', 'ghz', 'mhz')
+
 @dataclass
 class ConfidenceThresholds:
     """신뢰도 임계값 설정 (레거시 호환성용)"""
@@ -61,6 +76,9 @@ class ConfidenceEvaluator:
             ]
         }
 
+        # 카테고리별 (원본 패턴, 컴파일된 정규식) - 항목마다 re 캐시를 거치지 않도록 미리 컴파일
+        self._compiled_patterns = self._compile_field_patterns()
+
         # 가중치 설정 (Phase 2: ML 모델에서 동적으로 조정)
         self.default_weights = {
             'ocr_confidence': 0.3,
@@ -83,58 +101,88 @@ class ConfidenceEvaluator:
         Returns:
             종합 신뢰도 평가 결과
         """
-        text = ocr_data.get('text', '')
-        ocr_confidence = ocr_data.get('confidence', 0.0)
-        category = ocr_data.get('category', 'other')
+        return self.evaluate_ocr_results([(ocr_data, verification_result)])[0]
 
-        # 각 요소별 점수 계산
-        scores = {
-            'ocr_confidence': ocr_confidence,
-            'pattern_confidence': self.evaluate_pattern_match(text, category),
-            'db_verification': self._extract_db_confidence(verification_result),
-            'length_penalty': self.calculate_length_penalty(text, category)
-        }
+    def evaluate_ocr_results(self, items: List[Tuple[Dict, Optional[Dict]]]) -> List[Dict]:
+        """
+        여러 OCR 결과를 평가 - 요소별 점수를 행렬로 쌓아 ML 예측과 가중 평균을 한 번에 계산
 
-        # Phase 2: ML 모델을 사용한 신뢰도 예측
-        ml_confidence, ml_info = self.ml_model.predict_confidence(
-            scores['ocr_confidence'],
-            scores['pattern_confidence'],
-            scores['db_verification'],
-            scores['length_penalty']
-        )
+        Args:
+            items: (OCR 결과 데이터, DB 검증 결과) 목록
 
-        # 기존 가중 평균과 ML 예측 결합
-        traditional_score = sum(scores[key] * self.weights[key] for key in scores.keys())
+        Returns:
+            항목 순서대로의 종합 신뢰도 평가 결과 목록
+        """
+        prepared = []
+        for ocr_data, verification_result in items:
+            text = ocr_data.get('text', '')
+            category = ocr_data.get('category', 'other')
+
+            # 각 요소별 점수 계산
+            scores = {
+                'ocr_confidence': ocr_data.get('confidence', 0.0),
+                'pattern_confidence': self.evaluate_pattern_match(text, category),
+                'db_verification': self._extract_db_confidence(verification_result),
+                'length_penalty': self.calculate_length_penalty(text, category)
+            }
+            prepared.append((text, category, scores))
+
+        components = np.array(
+            [[scores[key] for key in _SCORE_KEYS] for _, _, scores in prepared],
+            dtype=float
+        ).reshape(len(prepared), len(_SCORE_KEYS))
+
+        # Phase 2: ML 모델을 사용한 신뢰도 예측 (모든 항목을 한 번에)
+        ml_confidences, ml_infos = self.ml_model.predict_confidence_batch(components)
+
+        # 기존 가중 평균 (항목별 합산과 같은 순서로 열 단위 계산)
+        traditional_scores = sum(
+            components[:, index] * self.weights[key] for index, key in enumerate(_SCORE_KEYS)
+        )
+        traditional_scores = np.asarray(traditional_scores, dtype=float).tolist()
 
         # ML 모델이 학습되어 있으면 ML 예측을 우선 사용, 아니면 기존 방식 사용
         if self.ml_model.is_trained:
-            final_score = ml_confidence
+            final_scores = ml_confidences
             method = "ml_prediction"
         else:
-            final_score = traditional_score
+            final_scores = traditional_scores
             method = "traditional_weighted"
 
         # Phase 2: 동적 임계값 사용
         current_thresholds = self.threshold_manager.get_current_thresholds()
-        level = self._get_confidence_level_dynamic(final_score, current_thresholds)
-
-        # 추천 사항 생성
-        recommendations = self.generate_recommendations(scores, text, category)
-
-        result = {
-            'score': final_score,
-            'level': level,
-            'breakdown': scores,
-            'recommendations': recommendations,
-            'category': category,
-            'text': text,
-            'ml_info': ml_info,
-            'method': method,
-            'traditional_score': traditional_score,
-            'thresholds_used': current_thresholds
-        }
 
-        return result
+        results = []
+        for (text, category, scores), final_score, traditional_score, ml_info in zip(
+            prepared, final_scores, traditional_scores, ml_infos
+        ):
+            results.append({
+                'score': final_score,
+                'level': self._get_confidence_level_dynamic(final_score, current_thresholds),
+                'breakdown': scores,
+                # 추천 사항 생성
+                'recommendations': self.generate_recommendations(scores, text, category),
+                'category': category,
+                'text': text,
+                'ml_info': ml_info,
+                'method': method,
+                'traditional_score': traditional_score,
+                'thresholds_used': dict(current_thresholds)
+            })
+
+        return results
+
+    def _compile_field_patterns(self) -> Dict[str, List[Tuple[str, re.Pattern]]]:
+        """field_patterns 를 대소문자 무시 정규식으로 컴파일 (잘못된 패턴은 경고 후 제외)"""
+        compiled = {}
+        for category, patterns in self.field_patterns.items():
+            compiled[category] = []
+            for pattern in patterns:
+                try:
+                    compiled[category].append((pattern, re.compile(pattern, re.IGNORECASE)))
+                except re.error:
+                    logger.warning(f"잘못된 정규식 패턴: {pattern}")
+        return compiled
 
     def evaluate_pattern_match(self, text: str, category: str) -> float:
         """
@@ -147,27 +195,22 @@ class ConfidenceEvaluator:
         Returns:
             패턴 매칭 점수 (0.0 ~ 1.0)
         """
-        if not text or category not in self.field_patterns:
+        if not text or category not in self._compiled_patterns:
             return 0.0
 
-        patterns = self.field_patterns[category]
         max_score = 0.0
 
-        for pattern in patterns:
-            try:
-                if re.match(pattern, text, re.IGNORECASE):
-                    # 완전 매칭
-                    max_score = max(max_score, 1.0)
-                elif re.search(pattern, text, re.IGNORECASE):
-                    # 부분 매칭
-                    max_score = max(max_score, 0.7)
-                else:
-                    # 유사 패턴 검사
-                    similarity = self._calculate_pattern_similarity(text, pattern)
-                    max_score = max(max_score, similarity)
-            except re.error:
-                logger.warning(f"잘못된 정규식 패턴: {pattern}")
-                continue
+        for pattern, regex in self._compiled_patterns[category]:
+            if regex.match(text):
+                # 완전 매칭
+                max_score = max(max_score, 1.0)
+            elif regex.search(text):
+                # 부분 매칭
+                max_score = max(max_score, 0.7)
+            else:
+                # 유사 패턴 검사
+                similarity = self._calculate_pattern_similarity(text, pattern)
+                max_score = max(max_score, similarity)
 
         # 추가 휴리스틱 검사
         heuristic_score = self._apply_heuristic_rules(text, category)
@@ -191,7 +234,7 @@ class ConfidenceEvaluator:
         length_score = 0.5  # 기본값
         if r'{' in pattern:
             # 길이 제한이 있는 패턴
-            length_match = re.search(r'\{(\d+),?(\d+)?\}', pattern)
+            length_match = _LENGTH_QUANTIFIER_RE.search(pattern)
             if length_match:
                 min_len = int(length_match.group(1))
                 max_len = int(length_match.group(2)) if length_match.group(2) else min_len
@@ -246,27 +289,24 @@ class ConfidenceEvaluator:
 
         elif category == 'manufacturer':
             # 제조사 휴리스틱
-            known_manufacturers = [
-                'lg', '삼성', 'samsung', '애플', 'apple', '델', 'dell', 
-                '레노버', 'lenovo', 'hp', 'asus', 'msi', '소니', 'sony'
-            ]
-            if any(mfg in text.lower() for mfg in known_manufacturers):
+            text_lower = text.lower()
+            if any(mfg in text_lower for mfg in _KNOWN_MANUFACTURERS):
                 score += 0.8
             elif any(c.isalpha() for c in text):
                 score += 0.4
-            if '전자' in text or 'electronics' in text.lower():
+            if '전자' in text or 'electronics' in text_lower:
                 score += 0.2
-            if '(주)' in text or 'inc' in text.lower() or 'corp' in text.lower():
+            if '(주)' in text or 'inc' in text_lower or 'corp' in text_lower:
                 score += 0.1
 
         elif category == 'spec':
             # 스펙 휴리스틱
-            spec_units = ['v', 'a', 'w', 'hz', 'gb', 'tb', 'mb', 'ghz', 'mhz']
-            if any(unit in text.lower() for unit in spec_units):
+            text_lower = text.lower()
+            if any(unit in text_lower for unit in _SPEC_UNITS):
                 score += 0.6
             if any(c.isdigit() for c in text):
                 score += 0.3
-            if re.search(r'\d+\s*[a-zA-Z]+', text):  # 숫자 + 단위 패턴
+            if _NUMBER_UNIT_RE.search(text):  # 숫자 + 단위 패턴
                 score += 0.1
 
         return min(score, 1.0)
@@ -377,31 +417,33 @@ class ConfidenceEvaluator:
 
     def batch_evaluate(self, ocr_results: List[Dict], verification_results: Optional[Dict] = None) -> Dict:
         """여러 OCR 결과를 일괄 평가"""
-        evaluations = {}
+        item_ids = []
+        seen_ids = set()
+        items = []
+        for ocr_data in ocr_results:
+            # id 가 없으면 지금까지의 고유 항목 수를 id 로 사용
+            item_id = ocr_data.get('id', str(len(seen_ids)))
+            seen_ids.add(item_id)
+            item_ids.append(item_id)
+            items.append((ocr_data, verification_results.get(item_id) if verification_results else None))
+
+        results = self.evaluate_ocr_results(items)
+        evaluations = dict(zip(item_ids, results))
+
+        # 통계 업데이트 (점수 배열로 평균, 레벨별 개수 집계)
+        scores = np.fromiter((evaluation['score'] for evaluation in results), dtype=float, count=len(results))
+        levels, counts = np.unique([evaluation['level'] for evaluation in results], return_counts=True)
+
         summary = {
             'total_count': len(ocr_results),
             'high_confidence': 0,
             'medium_confidence': 0,
             'low_confidence': 0,
             'very_low_confidence': 0,
-            'average_score': 0.0
+            'average_score': float(scores.mean()) if len(results) else 0.0
         }
-
-        total_score = 0.0
-
-        for ocr_data in ocr_results:
-            item_id = ocr_data.get('id', str(len(evaluations)))
-            verification_result = verification_results.get(item_id) if verification_results else None
-
-            evaluation = self.evaluate_ocr_result(ocr_data, verification_result)
-            evaluations[item_id] = evaluation
-
-            # 통계 업데이트
-            level = evaluation['level']
-            summary[f'{level}_confidence'] += 1
-            total_score += evaluation['score']
-
-        summary['average_score'] = total_score / len(ocr_results) if ocr_results else 0.0
+        for level, count in zip(levels.tolist(), counts.tolist()):
+            summary[f'{level}_confidence'] = count
 
         return {
             'evaluations': evaluations,
@@ -84,6 +84,27 @@ class ConfidenceMLModel:
         
         return features
 
+    def prepare_features_batch(self, components: np.ndarray) -> np.ndarray:
+        """특성 행렬 준비 - components 는 [ocr, pattern, db, length] 를 행으로 쌓은 (n, 4) 배열"""
+        ocr, pattern, db = components[:, 0], components[:, 1], components[:, 2]
+        return np.column_stack((
+            components,
+            ocr * pattern,
+            db * ocr,
+            np.abs(ocr - pattern),
+            np.maximum(np.maximum(ocr, pattern), db)
+        ))
+
+    def _default_confidence_batch(self, components: np.ndarray) -> np.ndarray:
+        """기본 가중치로 계산한 신뢰도 (predict_confidence 폴백과 같은 순서로 합산)"""
+        weights = self.default_weights
+        return (
+            components[:, 0] * weights['ocr_confidence'] +
+            components[:, 1] * weights['pattern_confidence'] +
+            components[:, 2] * weights['db_verification'] +
+            components[:, 3] * weights['length_penalty']
+        )
+
     async def train_from_feedback(self, feedback_data: List[FeedbackData]) -> Dict:
         """
         사용자 피드백 데이터로 모델 학습
@@ -241,6 +262,59 @@ class ConfidenceMLModel:
                 "error": str(e)
             }
 
+    def predict_confidence_batch(self, components: np.ndarray) -> Tuple[List[float], List[Dict]]:
+        """
+        여러 항목의 신뢰도를 한 번의 모델 호출로 예측 (항목별 결과는 predict_confidence 와 같음)
+
+        Args:
+            components: [ocr, pattern, db, length] 를 행으로 쌓은 (n, 4) 배열
+
+        Returns:
+            (예측된 신뢰도 목록, 항목별 추가 정보 목록)
+        """
+        count = len(components)
+        if count == 0:
+            return [], []
+
+        if not self.is_trained or not SKLEARN_AVAILABLE:
+            return self._default_confidence_batch(components).tolist(), [
+                {"method": "default_weights", "weights_used": self.default_weights}
+                for _ in range(count)
+            ]
+
+        try:
+            features_scaled = self.scaler.transform(self.prepare_features_batch(components))
+            predicted = self.weight_model.predict(features_scaled).astype(float)
+            acceptance = self.acceptance_model.predict_proba(features_scaled)[:, 1].astype(float)
+
+            # 모델 계수 기반 가중치는 항목과 무관하므로 한 번만 계산
+            feature_importance = abs(self.weight_model.coef_[:4])
+            total_importance = feature_importance.sum()
+            predicted_weights = {
+                'ocr_confidence': feature_importance[0] / total_importance,
+                'pattern_confidence': feature_importance[1] / total_importance,
+                'db_verification': feature_importance[2] / total_importance,
+                'length_penalty': feature_importance[3] / total_importance
+            }
+
+            return predicted.tolist(), [
+                {
+                    "method": "ml_prediction",
+                    "acceptance_probability": probability,
+                    "predicted_weights": predicted_weights,
+                    "model_confidence": min(confidence, 1.0)
+                }
+                for confidence, probability in zip(predicted.tolist(), acceptance.tolist())
+            ]
+
+        except Exception as e:
+            logger.error(f"ML 예측 중 오류 발생: {str(e)}")
+            # 폴백
+            return self._default_confidence_batch(components).tolist(), [
+                {"method": "fallback_after_error", "error": str(e)}
+                for _ in range(count)
+            ]
+
     def get_optimal_weights(self) -> Dict[str, float]:
         """현재 학습된 모델에서 최적 가중치 추출"""
         if not self.is_trained or not SKLEARN_AVAILABLE:
@@ -1,24 +1,48 @@
 import asyncio
+import time
 import aiofiles
 from typing import Dict, List, Optional, Tuple
+from collections import OrderedDict
 from dataclasses import dataclass
 from concurrent.futures import ThreadPoolExecutor
 import json
 import csv
+import orjson
 import pickle
 from pathlib import Path
 from datetime import datetime
 import logging
 
+from app.utils.prefix_trie import PrefixTrie, TrieNode
+
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
+try:
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+try:
+    from rapidfuzz.distance import Levenshtein
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+    logger.info("rapidfuzz not available, using pure Python Levenshtein. Install with: pip install rapidfuzz")
+
 @dataclass
 class AssetMatcherConfig:
     cache_ttl: int = 3600  # 1시간
     max_workers: int = 4
     enable_cache: bool = True
     data_dir: str = "data/assets"
+    suggestion_cache_size: int = 4096  # 자동완성 결과 LRU 캐시 크기
+    suggestion_cache_ttl: int = 300  # 5분
+    suggestion_session_size: int = 10000  # 세션별 트라이 탐색 위치 보관 수
+    suggestion_session_ttl: int = 600  # 10분
+    redis_url: Optional[str] = None  # 설정하면 워커 간 자동완성 캐시를 Redis 로 공유
+    redis_max_connections: int = 20
 
 class EnhancedAssetMatcher:
     def __init__(self, config: AssetMatcherConfig):
@@ -33,6 +57,16 @@ class EnhancedAssetMatcher:
         self._loading = False
         self._loaded = False
         self.cache_file = Path(config.data_dir) / "matcher_cache.pkl"
+        # 필드별 자동완성 트라이 (인덱스 로드 후 구축)
+        self.suggestion_tries: Dict[str, PrefixTrie] = {}
+        # (필드, 정규화된 입력, limit) -> (저장 시각, 제안 목록)
+        self._suggestion_cache: "OrderedDict[Tuple[str, str, int], Tuple[float, List[str]]]" = OrderedDict()
+        # 워커 간 공유 자동완성 캐시 (redis_url 설정 시 지연 연결)
+        self._redis = None
+        if config.redis_url and not REDIS_AVAILABLE:
+            logger.warning("redis_url 이 설정되었지만 redis 패키지가 없어 공유 캐시를 사용하지 않습니다. Install with: pip install redis")
+        # (세션, 필드) -> (저장 시각, 트라이, 마지막 입력, 마지막 입력의 트라이 노드)
+        self._suggestion_loci: "OrderedDict[Tuple[str, str], Tuple[float, PrefixTrie, str, Optional[TrieNode]]]" = OrderedDict()
 
     async def initialize(self):
         """비동기 초기화 - 애플리케이션 시작 시 백그라운드에서 실행"""
@@ -46,6 +80,7 @@ class EnhancedAssetMatcher:
                 cached_data = await self._load_from_cache()
                 if cached_data:
                     self.assets_db, self.indexes = cached_data
+                    await self._build_suggestion_tries()
                     self._loaded = True
                     logger.info(f"캐시에서 {len(self.assets_db)}개 자산 데이터 로드 완료")
                     return
@@ -53,6 +88,7 @@ class EnhancedAssetMatcher:
             # 파일에서 로드
             await self._load_from_files()
             await self._build_indexes()
+            await self._build_suggestion_tries()
 
             # 캐시에 저장
             if self.config.enable_cache:
@@ -189,6 +225,41 @@ class EnhancedAssetMatcher:
                    f"모델 {len(indexes['model'])}개, 제조사 {len(indexes['manufacturer'])}개")
         return indexes
 
+    async def _build_suggestion_tries(self):
+        """자동완성 트라이 구축 - 키 입력마다 인덱스 전체를 훑지 않도록 함"""
+        loop = asyncio.get_event_loop()
+        self.suggestion_tries = await loop.run_in_executor(
+            self.executor,
+            self._build_suggestion_tries_sync
+        )
+
+    def _build_suggestion_tries_sync(self) -> Dict[str, PrefixTrie]:
+        """동기 자동완성 트라이 구축 (인덱스 키를 그대로 트라이 키로 사용)"""
+        model_trie = PrefixTrie()
+        for word, assets in self.indexes['model'].items():
+            for asset in assets:
+                model_name = asset.get('model_name', '')
+                if model_name:
+                    model_trie.add(word, model_name)
+
+        manufacturer_trie = PrefixTrie()
+        for mfg, assets in self.indexes['manufacturer'].items():
+            # 원본 제조사명은 첫 자산 기준, 가중치는 해당 제조사 자산 수
+            original_mfg = assets[0].get('manufacturer', '') if assets else ''
+            if original_mfg:
+                manufacturer_trie.add(mfg, original_mfg, len(assets))
+
+        serial_trie = PrefixTrie()
+        for serial in self.indexes['serial']:
+            serial_trie.add(serial, serial)
+
+        logger.info("자동완성 트라이 구축 완료")
+        return {
+            'model_name': model_trie,
+            'manufacturer': manufacturer_trie,
+            'serial_number': serial_trie
+        }
+
     async def verify_ocr_result_async(self, ocr_data: Dict) -> Dict:
         """비동기 OCR 결과 검증"""
         if not self._loaded:
@@ -214,6 +285,32 @@ class EnhancedAssetMatcher:
             'confidence_score': self._calculate_overall_confidence([serial_result, model_result, manufacturer_result])
         }
 
+    async def verify_ocr_bulk_async(self, field_values: Dict[str, List[str]]) -> Dict[str, Dict[str, Dict]]:
+        """필드별 OCR 값 일괄 검증 - {필드: [값, ...]} -> {필드: {값: 검증 결과}}
+
+        같은 필드의 중복 값은 한 번만 검증하며, 결과는 verify_ocr_result_async 의 필드별 결과와 같다.
+        """
+        if not self._loaded:
+            await self.initialize()
+
+        verifiers = {
+            'serial_number': self._verify_serial_async,
+            'model_name': self._verify_model_async,
+            'manufacturer': self._verify_manufacturer_async
+        }
+
+        pairs = [
+            (field, value)
+            for field, values in field_values.items()
+            for value in dict.fromkeys(values)
+        ]
+        verified = await asyncio.gather(*(verifiers[field](value) for field, value in pairs))
+
+        results: Dict[str, Dict[str, Dict]] = {field: {} for field in field_values}
+        for (field, value), result in zip(pairs, verified):
+            results[field][value] = result
+        return results
+
     async def _verify_serial_async(self, serial: str) -> Dict:
         """시리얼번호 검증 (가장 신뢰도 높음)"""
         if not serial:
@@ -361,38 +458,29 @@ class EnhancedAssetMatcher:
         if not text1 or not text2:
             return 0.0
 
-        # 간단한 Levenshtein 거리 구현
-        len1, len2 = len(text1), len(text2)
-        if len1 == 0:
-            return 0.0 if len2 > 0 else 1.0
-        if len2 == 0:
-            return 0.0
-
-        # DP 테이블 생성
-        dp = [[0] * (len2 + 1) for _ in range(len1 + 1)]
-
-        # 초기화
-        for i in range(len1 + 1):
-            dp[i][0] = i
-        for j in range(len2 + 1):
-            dp[0][j] = j
-
-        # DP 계산
-        for i in range(1, len1 + 1):
-            for j in range(1, len2 + 1):
-                if text1[i-1] == text2[j-1]:
-                    dp[i][j] = dp[i-1][j-1]
+        # 네이티브 구현이 있으면 사용 (1 - 거리 / 긴 문자열 길이, 아래 구현과 같은 값)
+        if RAPIDFUZZ_AVAILABLE:
+            return Levenshtein.normalized_similarity(text1, text2)
+
+        # 두 행만 유지하는 Levenshtein 거리 구현
+        if len(text1) < len(text2):
+            text1, text2 = text2, text1
+        previous = list(range(len(text2) + 1))
+        for i, char1 in enumerate(text1, 1):
+            current = [i]
+            for j, char2 in enumerate(text2, 1):
+                if char1 == char2:
+                    current.append(previous[j - 1])
                 else:
-                    dp[i][j] = min(
-                        dp[i-1][j] + 1,    # 삭제
-                        dp[i][j-1] + 1,    # 삽입
-                        dp[i-1][j-1] + 1   # 교체
-                    )
+                    current.append(min(
+                        previous[j] + 1,      # 삭제
+                        current[j - 1] + 1,   # 삽입
+                        previous[j - 1] + 1   # 교체
+                    ))
+            previous = current
 
         # 유사도 계산 (0~1)
-        max_len = max(len1, len2)
-        distance = dp[len1][len2]
-        similarity = 1.0 - (distance / max_len)
+        similarity = 1.0 - (previous[-1] / len(text1))
 
         return max(0.0, similarity)
 
@@ -449,45 +537,113 @@ class EnhancedAssetMatcher:
         return weighted_sum / weight_sum if weight_sum > 0 else 0.0
 
     async def get_suggestions(self, field_type: str, partial_text: str, limit: int = 5) -> List[str]:
-        """자동완성 제안"""
+        """자동완성 제안 (짧은 입력이 반복되므로 결과를 TTL LRU 캐시에 보관)"""
         if not self._loaded:
             await self.initialize()
 
-        suggestions = []
-        partial_lower = partial_text.lower().strip()
-
-        if field_type == 'model_name':
-            for word, assets in self.indexes['model'].items():
-                if word.startswith(partial_lower):
-                    for asset in assets:
-                        model_name = asset.get('model_name', '')
-                        if model_name and model_name not in suggestions:
-                            suggestions.append(model_name)
-                            if len(suggestions) >= limit:
-                                break
-                if len(suggestions) >= limit:
-                    break
+        # 필드별로 실제 조회에 쓰는 형태로 정규화해 캐시 키로 사용
+        query = partial_text.upper() if field_type == 'serial_number' else partial_text.lower().strip()
+        key = (field_type, query, limit)
+        now = time.monotonic()
+
+        cached = self._suggestion_cache.get(key)
+        if cached is not None and now - cached[0] < self.config.suggestion_cache_ttl:
+            self._suggestion_cache.move_to_end(key)
+            return list(cached[1])
+
+        # 로컬 캐시에 없으면 다른 워커가 채운 공유 캐시 확인, 그래도 없으면 트라이 조회 후 공유 캐시에 저장
+        redis_key = f"sug:{field_type}:{limit}:{query}"
+        suggestions = await self._get_shared_suggestions(redis_key)
+        if suggestions is None:
+            suggestions = self._find_suggestions(field_type, query, limit)
+            await self._set_shared_suggestions(redis_key, suggestions)
+
+        self._suggestion_cache[key] = (now, suggestions)
+        self._suggestion_cache.move_to_end(key)
+        if len(self._suggestion_cache) > self.config.suggestion_cache_size:
+            self._suggestion_cache.popitem(last=False)
+
+        return list(suggestions)
+
+    def _get_redis(self):
+        """공유 캐시용 Redis 클라이언트 (설정되지 않았거나 redis 패키지가 없으면 None)"""
+        if self._redis is None and self.config.redis_url and REDIS_AVAILABLE:
+            self._redis = aioredis.from_url(
+                self.config.redis_url,
+                max_connections=self.config.redis_max_connections
+            )
+        return self._redis
+
+    async def _get_shared_suggestions(self, redis_key: str) -> Optional[List[str]]:
+        """공유 캐시에서 자동완성 결과 조회 (Redis 오류 시 캐시 없이 진행)"""
+        client = self._get_redis()
+        if client is None:
+            return None
+        try:
+            cached = await client.get(redis_key)
+        except Exception as e:
+            logger.warning(f"Redis 자동완성 캐시 조회 실패: {e}")
+            return None
+        return orjson.loads(cached) if cached is not None else None
 
-        elif field_type == 'manufacturer':
-            for mfg in self.indexes['manufacturer'].keys():
-                if mfg.startswith(partial_lower):
-                    # 원본 제조사명 찾기
-                    assets = self.indexes['manufacturer'][mfg]
-                    if assets:
-                        original_mfg = assets[0].get('manufacturer', '')
-                        if original_mfg and original_mfg not in suggestions:
-                            suggestions.append(original_mfg)
-                            if len(suggestions) >= limit:
-                                break
-
-        elif field_type == 'serial_number':
-            for serial in self.indexes['serial'].keys():
-                if serial.startswith(partial_text.upper()):
-                    suggestions.append(serial)
-                    if len(suggestions) >= limit:
-                        break
+    async def _set_shared_suggestions(self, redis_key: str, suggestions: List[str]):
+        """공유 캐시에 자동완성 결과 저장"""
+        client = self._get_redis()
+        if client is None:
+            return
+        try:
+            await client.set(redis_key, orjson.dumps(suggestions), ex=self.config.suggestion_cache_ttl)
+        except Exception as e:
+            logger.warning(f"Redis 자동완성 캐시 저장 실패: {e}")
+
+    def _find_suggestions(self, field_type: str, query: str, limit: int) -> List[str]:
+        """정규화된 입력으로 접두사 트라이에서 빈도순 자동완성 제안 검색"""
+        trie = self.suggestion_tries.get(field_type)
+        if trie is None:
+            return []
+        return trie.complete(query, limit)
+
+    async def get_session_suggestions(self, session_id: str, field_type: str, partial_text: str, limit: int = 5) -> List[str]:
+        """
+        세션 단위 자동완성 제안 - 한 글자씩 이어 입력하면 직전 입력의 트라이 노드에서 이어서 탐색
+        """
+        if not self._loaded:
+            await self.initialize()
 
-        return suggestions[:limit]
+        trie = self.suggestion_tries.get(field_type)
+        if trie is None:
+            return []
+
+        query = partial_text.upper() if field_type == 'serial_number' else partial_text.lower().strip()
+        key = (session_id, field_type)
+        now = time.monotonic()
+
+        entry = self._suggestion_loci.get(key)
+        if (
+            entry is not None
+            and now - entry[0] < self.config.suggestion_session_ttl
+            and entry[1] is trie
+            and query.startswith(entry[2])
+        ):
+            # 직전 입력에 덧붙인 부분만 탐색 (직전 입력에 맞는 키가 없었다면 이어지는 입력도 없음)
+            _, _, last_query, last_node = entry
+            node = trie.locate(query[len(last_query):], start=last_node) if last_node is not None else None
+        else:
+            node = trie.locate(query)
+
+        self._suggestion_loci[key] = (now, trie, query, node)
+        self._suggestion_loci.move_to_end(key)
+        if len(self._suggestion_loci) > self.config.suggestion_session_size:
+            self._suggestion_loci.popitem(last=False)
+
+        return list(trie.complete_node(node, limit))
+
+    async def get_suggestions_bulk(self, field_type: str, queries: List[str], limit: int = 5) -> Dict[str, List[str]]:
+        """여러 입력에 대한 자동완성 제안 - 같은 입력은 한 번만 조회"""
+        return {
+            query: await self.get_suggestions(field_type, query, limit)
+            for query in dict.fromkeys(queries)
+        }
 
     def get_stats(self) -> Dict:
         """자산 매처 통계 반환"""
@@ -498,6 +654,7 @@ class EnhancedAssetMatcher:
                 "model_count": len(self.indexes['model']),
                 "manufacturer_count": len(self.indexes['manufacturer'])
             },
+            "suggestion_cache_size": len(self._suggestion_cache),
             "config": {
                 "cache_ttl": self.config.cache_ttl,
                 "max_workers": self.config.max_workers,
@@ -5,6 +5,10 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# 전처리 정규식 (모듈 로드 시 한 번만 컴파일)
+_WS_RE = re.compile(r'\s+')
+_SPECIAL_CHARS_RE = re.compile(r'[^\w\s가-힣-]')
+
 class FuzzyMatcher:
     """
     OCR 특성을 고려한 퍼지 매칭 클래스
@@ -115,10 +119,10 @@ class FuzzyMatcher:
             return ""
         
         # 공백 정리
-        cleaned = re.sub(r'\s+', ' ', text.strip())
+        cleaned = _WS_RE.sub(' ', text.strip())
         
         # 특수문자 정리 (일부만)
-        cleaned = re.sub(r'[^\w\s가-힣-]', '', cleaned)
+        cleaned = _SPECIAL_CHARS_RE.sub('', cleaned)
         
         return cleaned
     
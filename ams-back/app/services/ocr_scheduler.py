@@ -16,6 +16,10 @@ from .batch_ocr_engine import get_batch_ocr_engine, BatchOCREngine, BatchOCRResu
 
 logger = logging.getLogger(__name__)
 
+class QueueFullError(RuntimeError):
+    """대기 큐가 가득 차 작업을 받을 수 없음"""
+
+
 class JobPriority(Enum):
     """작업 우선순위"""
     LOW = 1
@@ -89,9 +93,12 @@ class OCRScheduler:
     - 작업 상태 추적 및 콜백
     """
 
-    def __init__(self, max_concurrent_jobs: int = 4, enable_gpu_monitoring: bool = True):
+    def __init__(self, max_concurrent_jobs: int = 4, enable_gpu_monitoring: bool = True,
+                 max_queue_size: int = 256):
         self.max_concurrent_jobs = max_concurrent_jobs
         self.enable_gpu_monitoring = enable_gpu_monitoring
+        # 대기 작업 상한 - 넘치면 제출을 거절해 버스트 시 메모리와 대기 시간이 무한히 늘지 않게 함
+        self.max_queue_size = max_queue_size
 
         # 작업 큐 (우선순위 큐)
         self.job_queue: List[OCRJob] = []
@@ -185,6 +192,9 @@ class OCRScheduler:
                         callback: Optional[Callable] = None, metadata: Dict[str, Any] = None) -> str:
         """작업 제출"""
         try:
+            if len(self.job_queue) >= self.max_queue_size:
+                raise QueueFullError(f"OCR job queue is full ({self.max_queue_size} pending jobs)")
+
             job_id = str(uuid.uuid4())
 
             job = OCRJob(
@@ -205,6 +215,8 @@ class OCRScheduler:
             logger.info(f"Job {job_id} submitted with priority {priority.name}")
             return job_id
 
+        except QueueFullError:
+            raise
         except Exception as e:
             logger.error(f"Failed to submit job: {e}")
             raise
@@ -228,11 +240,13 @@ class OCRScheduler:
                 job = self.failed_jobs[job_id]
                 return self._job_to_dict(job)
 
-            # 대기 중인 작업 확인
+            # 대기 중인 작업 확인 (대기 순번은 제출 시가 아니라 조회할 때 계산)
             async with self.queue_lock:
                 for job in self.job_queue:
                     if job.job_id == job_id:
-                        return self._job_to_dict(job)
+                        job_dict = self._job_to_dict(job)
+                        job_dict["queue_position"] = sum(1 for other in self.job_queue if other < job)
+                        return job_dict
 
             return None
 
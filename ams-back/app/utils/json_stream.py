@@ -0,0 +1,41 @@
+"""
+JSON 스트리밍 유틸리티 모듈.
+큰 목록 응답을 한 번에 직렬화하지 않고 항목 단위로 전송하기 위한 함수를 제공합니다.
+"""
+
+from typing import Iterable, Iterator
+
+from fastapi.responses import StreamingResponse
+
+
+def iter_json_array(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    Join pre-encoded JSON values into a JSON array, one chunk at a time.
+
+    Args:
+        chunks: Each item is one already-encoded JSON value (e.g. orjson.dumps output)
+
+    Yields:
+        Byte chunks that together form a single JSON array
+    """
+    yield b"["
+    first = True
+    for chunk in chunks:
+        if not first:
+            yield b","
+        first = False
+        yield chunk
+    yield b"]"
+
+
+def json_array_response(chunks: Iterable[bytes]) -> StreamingResponse:
+    """
+    Create a streaming JSON array response from pre-encoded JSON values.
+
+    Args:
+        chunks: Each item is one already-encoded JSON value
+
+    Returns:
+        A StreamingResponse with media type application/json
+    """
+    return StreamingResponse(iter_json_array(chunks), media_type="application/json")
@@ -0,0 +1,90 @@
+"""
+접두사 트라이 유틸리티 모듈.
+자동완성 후보를 입력 길이에 비례하는 비용으로 찾기 위한 문자 단위 트라이를 제공합니다.
+"""
+
+from typing import Dict, List, Optional
+
+
+class TrieNode:
+    """트라이 노드 - 자식 노드, 이 노드에서 끝나는 값의 가중치, 빈도순 상위 완성 목록 캐시"""
+
+    __slots__ = ("children", "values", "top")
+
+    def __init__(self):
+        self.children: Dict[str, "TrieNode"] = {}
+        self.values: Dict[str, int] = {}
+        self.top: Optional[List[str]] = None
+
+
+class PrefixTrie:
+    """
+    빈도순 자동완성용 접두사 트라이.
+
+    키 (정규화된 검색어) 마다 반환할 값과 가중치를 저장하고, 접두사 노드에서
+    가중치가 높은 값부터 돌려준다. 노드별 상위 top_k 결과는 처음 조회할 때 계산해
+    캐시하므로 이후 같은 접두사는 접두사 길이만큼의 탐색으로 끝난다.
+    """
+
+    def __init__(self, top_k: int = 20):
+        self.root = TrieNode()
+        self.top_k = top_k
+
+    def add(self, key: str, value: str, weight: int = 1):
+        """
+        Add a completion value under a key.
+
+        Args:
+            key: Normalized text the prefix is matched against
+            value: Text returned as the suggestion
+            weight: Popularity added to the value (e.g. number of assets)
+        """
+        node = self.root
+        node.top = None
+        for char in key:
+            node = node.children.setdefault(char, TrieNode())
+            # 경로 위 노드의 캐시된 상위 목록은 새 값이 반영되도록 무효화
+            node.top = None
+        node.values[value] = node.values.get(value, 0) + weight
+
+    def locate(self, prefix: str, start: Optional[TrieNode] = None) -> Optional[TrieNode]:
+        """
+        Walk from start (the root by default) along prefix.
+
+        Returns:
+            The node reached, or None if no key continues with prefix
+        """
+        node = self.root if start is None else start
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return None
+        return node
+
+    def complete_node(self, node: Optional[TrieNode], limit: int) -> List[str]:
+        """Return up to limit values below node, most popular first."""
+        if node is None or limit <= 0:
+            return []
+        if limit > self.top_k:
+            return self._collect(node)[:limit]
+        if node.top is None:
+            node.top = self._collect(node)[:self.top_k]
+        return node.top[:limit]
+
+    def complete(self, prefix: str, limit: int) -> List[str]:
+        """Return up to limit values whose key starts with prefix, most popular first."""
+        return self.complete_node(self.locate(prefix), limit)
+
+    @staticmethod
+    def _collect(node: TrieNode) -> List[str]:
+        # 같은 값이 여러 키 아래에 있으면 가장 큰 가중치만 사용 (값 단위 중복 제거)
+        weights: Dict[str, int] = {}
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            for value, weight in current.values.items():
+                if weight > weights.get(value, 0):
+                    weights[value] = weight
+            stack.extend(current.children.values())
+        # 가중치 내림차순, 같은 가중치는 값 순서로 고정
+        return sorted(weights, key=lambda value: (-weights[value], value))
@@ -4,7 +4,8 @@ This module provides functionality for sending real-time updates to clients.
 """
 
 import asyncio
-import json
+import logging
+import orjson
 from typing import Dict, Any, List, Callable, Awaitable
 
 from sse_starlette.sse import EventSourceResponse
@@ -16,6 +17,9 @@ from app.utils.logging import sse_logger
 # Structure: {job_id: [list of subscribers]}
 _subscribers: Dict[str, List[asyncio.Queue]] = {}
 
+# Event payloads may carry numpy values (OCR confidences, bboxes) and non-str keys
+_SSE_DUMP_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
 sse_logger.info("SSE 유틸리티 모듈 초기화 완료")
 
 async def push_sse(job_id: str, data: Dict[str, Any]) -> None:
@@ -36,10 +40,13 @@ async def push_sse(job_id: str, data: Dict[str, Any]) -> None:
     stage = data.get("stage", "unknown")
     message = data.get("message", "")
     sse_logger.info(f"이벤트 정보 - 단계: {stage}, 메시지: {message}")
-    sse_logger.debug(f"전체 이벤트 데이터: {data}")
 
-    # Convert data to JSON string
-    message = json.dumps(data)
+    # Convert data to JSON string (encoded once, shared by all subscribers)
+    message = orjson.dumps(data, option=_SSE_DUMP_OPTIONS).decode()
+
+    # 마스크/OCR 결과가 담긴 큰 페이로드는 디버그 로깅이 꺼져 있을 때 문자열로 만들지 않음
+    if sse_logger.isEnabledFor(logging.DEBUG):
+        sse_logger.debug(f"전체 이벤트 데이터 ({len(message)} bytes): {message}")
 
     # Push to all subscribers
     subscriber_count = len(_subscribers[job_id])
@@ -121,7 +128,7 @@ async def event_generator(job_id: str):
     try:
         # Send initial connection established event
         sse_logger.debug(f"작업 ID '{job_id}'에 대한 초기 연결 이벤트 전송")
-        initial_data = json.dumps({"status": "connected", "job_id": job_id})
+        initial_data = orjson.dumps({"status": "connected", "job_id": job_id}).decode()
         yield {"event": "connected", "data": initial_data}
 
         # Listen for messages
@@ -0,0 +1,50 @@
+"""
+TTL 캐시 유틸리티 모듈.
+대시보드가 자주 폴링하는 통계처럼 잠깐 오래된 값이어도 되는 결과를 짧게 재사용하기 위한 캐시를 제공합니다.
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+
+class TTLCache:
+    """
+    비동기 producer 결과를 키별로 ttl 초 동안 재사용하는 캐시.
+
+    만료된 키를 여러 요청이 동시에 조회해도 producer 는 한 번만 실행된다.
+    """
+
+    def __init__(self, ttl: float):
+        self._ttl = ttl
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = asyncio.Lock()
+
+    async def get(self, producer: Callable[[], Awaitable[Any]], key: Hashable = None) -> Any:
+        """
+        Return the cached value for key, calling producer when it is missing or expired.
+
+        Args:
+            producer: Coroutine function that computes a fresh value
+            key: Cache key (e.g. query parameters); None for a single value
+
+        Returns:
+            The cached or freshly produced value
+        """
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() - entry[0] < self._ttl:
+            return entry[1]
+
+        async with self._lock:
+            # 락을 기다리는 동안 다른 요청이 이미 갱신했으면 그 값을 사용
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] < self._ttl:
+                return entry[1]
+
+            value = await producer()
+            self._entries[key] = (time.monotonic(), value)
+            return value
+
+    def clear(self):
+        """Drop all cached values."""
+        self._entries.clear()
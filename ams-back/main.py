@@ -1,7 +1,7 @@
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 import uvicorn
 import os
 import logging
@@ -10,6 +10,7 @@ from dotenv import load_dotenv
 
 # 로깅 설정 임포트
 from app.utils.logging import setup_logger
+from app.middleware.compression import SSEAwareGZipMiddleware
 
 # Import routers
 from app.routers import asset, dashboard, registration, label, chatbot, list_router
@@ -25,7 +26,8 @@ logger.info("애플리케이션 시작 중...")
 app = FastAPI(
 	title="AMS API",
 	description="API for Asset Management System",
-	version="1.0.0"
+	version="1.0.0",
+	default_response_class=ORJSONResponse
 )
 logger.info("FastAPI 애플리케이션 생성 완료")
 
@@ -52,6 +54,9 @@ app.add_middleware(
 	allow_headers=["*"],
 )
 
+# 1KB 이상 응답 gzip 압축 (SSE 스트림 제외)
+app.add_middleware(SSEAwareGZipMiddleware, minimum_size=1024)
+
 # 파일 크기 제한 미들웨어 추가
 @app.middleware("http")
 async def limit_upload_size(request: Request, call_next):
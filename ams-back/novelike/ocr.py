@@ -1,7 +1,12 @@
 # novelike/ocr.py
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from io import BytesIO
+from typing import List, Union
 
 import easyocr
+import numpy as np
 from PIL import Image
 from transformers import VisionEncoderDecoderModel, TrOCRProcessor
 
@@ -13,6 +18,18 @@ ocr_logger.info("EasyOCR 리더 초기화 중...")
 _reader = easyocr.Reader(['ko', 'en'], gpu=False)
 ocr_logger.info("EasyOCR 리더 초기화 완료")
 
+# EasyOCR 인식 전용 스레드 (공유 리더를 한 번에 하나의 호출만 사용하고, 인식 중에도 이벤트 루프가 멈추지 않도록 함)
+_reader_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="easyocr")
+
+
+def _readtext_all(images: List[np.ndarray]) -> list:
+	"""영역 이미지들을 순서대로 인식 (리더 스레드에서 한 번에 실행)"""
+	batched = []
+	for idx, image in enumerate(images):
+		ocr_logger.debug(f"영역 {idx+1}/{len(images)} 인식 중 ({image.shape[1]}x{image.shape[0]} 픽셀)")
+		batched.append(_reader.readtext(image, detail=1, paragraph=False))
+	return batched
+
 
 def ocr_easy(image_bytes: bytes):
 	"""
@@ -35,14 +52,18 @@ def ocr_easy(image_bytes: bytes):
 		raise
 
 
-async def ocr_easy_with_progress(image_bytes: bytes, progress_callback=None):
+async def ocr_easy_with_progress(image: Union[bytes, np.ndarray], progress_callback=None):
 	"""
 	EasyOCR을 단계별로 실행하여 진행 상황을 전달하는 함수
-	"""
-	import asyncio
 
+	image 는 인코딩된 이미지 바이트 또는 BGR ndarray (EasyOCR/OpenCV 채널 순서).
+	ndarray 를 넘기면 인코딩/디코딩 왕복 없이 그대로 인식한다.
+	"""
 	ocr_logger.info("EasyOCR 단계별 텍스트 인식 시작")
-	ocr_logger.debug(f"이미지 크기: {len(image_bytes)} 바이트")
+	if isinstance(image, np.ndarray):
+		ocr_logger.debug(f"이미지 배열 크기: {image.nbytes} 바이트")
+	else:
+		ocr_logger.debug(f"이미지 크기: {len(image)} 바이트")
 
 	try:
 		# 1단계: 이미지 전처리
@@ -50,8 +71,12 @@ async def ocr_easy_with_progress(image_bytes: bytes, progress_callback=None):
 			await progress_callback("preprocessing", "이미지 전처리 중...", 10)
 
 		ocr_logger.debug("이미지 전처리 중...")
-		img = Image.open(BytesIO(image_bytes)).convert("RGB")
-		ocr_logger.debug(f"이미지 크기: {img.width}x{img.height} 픽셀")
+		if isinstance(image, np.ndarray):
+			ocr_logger.debug(f"이미지 크기: {image.shape[1]}x{image.shape[0]} 픽셀")
+		else:
+			# 크기 로깅에는 헤더만 필요하므로 디코딩/RGB 변환 없이 지연 로드된 이미지의 size 만 읽음
+			width, height = Image.open(BytesIO(image)).size
+			ocr_logger.debug(f"이미지 크기: {width}x{height} 픽셀")
 
 		# 단계별 진행을 체감할 수 있도록 약간의 지연 추가
 		await asyncio.sleep(1.0)
@@ -68,8 +93,10 @@ async def ocr_easy_with_progress(image_bytes: bytes, progress_callback=None):
 			await progress_callback("recognition", "텍스트 인식 중...", 60)
 
 		ocr_logger.debug("텍스트 인식 중...")
-		# EasyOCR의 실제 처리 (감지와 인식을 함께 수행)
-		results = _reader.readtext(image_bytes, detail=1, paragraph=False)
+		# EasyOCR의 실제 처리 (감지와 인식을 함께 수행, 리더 스레드에서 실행)
+		results = await asyncio.get_running_loop().run_in_executor(
+			_reader_executor, partial(_reader.readtext, image, detail=1, paragraph=False)
+		)
 
 		# 4단계: 후처리
 		if progress_callback:
@@ -96,6 +123,62 @@ async def ocr_easy_with_progress(image_bytes: bytes, progress_callback=None):
 		raise
 
 
+async def ocr_easy_batched(images: List[np.ndarray], progress_callback=None):
+	"""
+	여러 영역 이미지를 한 번의 OCR 작업으로 처리하고 진행 상황을 한 번만 전달하는 함수
+
+	영역마다 ocr_easy_with_progress 를 호출하면 단계별 진행 이벤트와 지연이 영역 수만큼 반복되므로
+	모든 영역을 모아 리더 스레드에 한 번에 넘겨 인식한다. 영역 크기가 제각각이라 readtext_batched 로
+	묶으면 공통 크기로 리사이즈되어 글자가 왜곡되므로 인식 자체는 영역별 readtext 로 수행한다.
+
+	Returns:
+		images 와 같은 순서의 영역별 EasyOCR 결과 리스트
+	"""
+	ocr_logger.info(f"EasyOCR 일괄 텍스트 인식 시작: {len(images)}개 영역")
+
+	try:
+		# 1단계: 이미지 전처리
+		if progress_callback:
+			await progress_callback("preprocessing", "이미지 전처리 중...", 10)
+
+		ocr_logger.debug("이미지 전처리 중...")
+		await asyncio.sleep(1.0)
+
+		# 2단계: 텍스트 영역 감지 시작
+		if progress_callback:
+			await progress_callback("detection", "텍스트 영역 감지 중...", 30)
+
+		ocr_logger.debug("텍스트 영역 감지 중...")
+		await asyncio.sleep(1.0)
+
+		# 3단계: 텍스트 인식 시작
+		if progress_callback:
+			await progress_callback("recognition", "텍스트 인식 중...", 60)
+
+		batched = await asyncio.get_running_loop().run_in_executor(_reader_executor, _readtext_all, images)
+
+		# 4단계: 후처리
+		if progress_callback:
+			await progress_callback("postprocessing", "결과 후처리 중...", 90)
+
+		ocr_logger.debug("결과 후처리 중...")
+		await asyncio.sleep(0.5)
+
+		ocr_logger.info(f"EasyOCR 일괄 텍스트 인식 완료: {sum(len(r) for r in batched)}개 텍스트 영역 감지")
+
+		# 완료
+		if progress_callback:
+			await progress_callback("completed", "OCR 처리 완료", 100)
+
+		return batched
+
+	except Exception as e:
+		ocr_logger.error(f"EasyOCR 일괄 텍스트 인식 중 오류 발생: {str(e)}")
+		if progress_callback:
+			await progress_callback("error", f"OCR 오류: {str(e)}", 0)
+		raise
+
+
 # TrOCR processor/model 초기화 (printed 모델 예시)
 ocr_logger.info("TrOCR 모델 초기화 중...")
 _processor = TrOCRProcessor.from_pretrained("microsoft/trocr-base-printed")
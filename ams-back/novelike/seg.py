@@ -14,9 +14,10 @@ seg_logger.info(f"YOLOv8 세그멘테이션 모델 초기화 중... (모델 경
 _model = YOLO(modelPath)
 seg_logger.info("YOLOv8 세그멘테이션 모델 초기화 완료")
 
-def segment_image(image_path: str, conf: float = 0.25):
+def segment_image(image_path: str, conf: float = 0.25, image=None):
 	"""
 	이미지 파일 경로를 받아 YOLOv8 세그멘테이션 수행
+	image 로 이미 디코딩된 BGR ndarray 를 넘기면 파일을 다시 읽지 않고 그대로 추론한다.
 	"""
 	seg_logger.info(f"이미지 세그멘테이션 시작: {os.path.basename(image_path)}")
 	seg_logger.debug(f"전체 이미지 경로: {image_path}")
@@ -29,7 +30,7 @@ def segment_image(image_path: str, conf: float = 0.25):
 			raise FileNotFoundError(f"이미지 파일을 찾을 수 없음: {image_path}")
 
 		seg_logger.debug("YOLOv8 세그멘테이션 모델 예측 실행 중...")
-		results = _model.predict(source=image_path,
+		results = _model.predict(source=image if image is not None else image_path,
 		                         task="segment",
 		                         conf=conf)
 
@@ -279,9 +279,7 @@ export const labelApi = {
 
   // Batch print labels
   batchPrintLabels: async (assetIds) => {
-    const response = await api.get('/api/labels/batch/print', {
-      params: { asset_ids: assetIds },
-    });
+    const response = await api.post('/api/labels/batch/print', assetIds);
     return response.data;
   },
 };